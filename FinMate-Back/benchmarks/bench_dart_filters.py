@@ -0,0 +1,142 @@
+"""Micro-benchmark for classifying DART list.json filings (report name + company name).
+
+Compares the Aho-Corasick matchers built at import with the per-keyword loops dart.py used before
+(re-normalizing every keyword and company name for each filing). Pass a recorded list.json response
+(or a JSON array of its items) to benchmark real filings; otherwise a synthetic 700-filing day is used.
+Run from FinMate-Back:
+
+    python -m benchmarks.bench_dart_filters [path/to/list.json]
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import timeit
+
+from dart import (
+    EARNINGS_CALENDAR_COMPANY_NAMES,
+    EARNINGS_REPORT_KEYWORDS,
+    IR_REPORT_KEYWORDS,
+    LARGE_CAP_NAMES,
+    PBLNTF_TYPES,
+    _get_importance,
+    _is_calendar_company,
+    _is_direct_earnings_report,
+    _is_ir_report,
+    _report_keywords,
+)
+
+ITERATIONS = 20
+
+OTHER_REPORTS = [
+    "주요사항보고서(자기주식취득결정)",
+    "임원ㆍ주요주주특정증권등소유상황보고서",
+    "기업가치제고계획(자율공시)",
+    "현금ㆍ현물배당결정",
+    "단일판매ㆍ공급계약체결",
+    "[기재정정]주식등의대량보유상황보고서(일반)",
+]
+MATCHING_REPORTS = [
+    "연결재무제표기준영업(잠정)실적(공정공시)",
+    "기업설명회(IR)개최(안내공시)",
+    "[기재정정]영업(잠정)실적(공정공시)",
+    "기업설명회(IR)개최 (경영실적 발표)",
+]
+OTHER_COMPANIES = ["에코프로비엠", "LS ELECTRIC", "한미반도체", "알테오젠", "HLB", "코스모신소재", "LX세미콘"]
+
+
+def _legacy_normalize(value: str) -> str:
+    return re.sub(r"\s+", "", value or "")
+
+
+def _legacy_contains_keyword(value: str, keywords) -> bool:
+    normalized_value = _legacy_normalize(value).lower()
+    return any(_legacy_normalize(keyword).lower() in normalized_value for keyword in keywords)
+
+
+def _legacy_is_calendar_company(corp_name: str) -> bool:
+    normalized_corp = _legacy_normalize(corp_name)
+    for name in EARNINGS_CALENDAR_COMPANY_NAMES:
+        normalized_name = _legacy_normalize(name)
+        if len(normalized_name) <= 2:
+            if normalized_corp == normalized_name:
+                return True
+            continue
+        if normalized_name in normalized_corp:
+            return True
+    return False
+
+
+def _legacy_classify(items, keywords):
+    labels = []
+    for item in items:
+        report_name = item["report_nm"]
+        corp_name = item["corp_name"]
+        importance = "very_high" if any(name in corp_name for name in LARGE_CAP_NAMES) else "high"
+        if not _legacy_contains_keyword(report_name, keywords) or not _legacy_is_calendar_company(corp_name):
+            labels.append(("skip", importance))
+        elif _legacy_contains_keyword(report_name, EARNINGS_REPORT_KEYWORDS) and not _legacy_contains_keyword(
+            report_name, IR_REPORT_KEYWORDS
+        ):
+            labels.append(("result", importance))
+        elif _legacy_contains_keyword(report_name, IR_REPORT_KEYWORDS):
+            labels.append(("ir", importance))
+        else:
+            labels.append(("skip", importance))
+    return labels
+
+
+def _classify(items, keywords):
+    labels = []
+    for item in items:
+        report_name = item["report_nm"]
+        corp_name = item["corp_name"]
+        importance = _get_importance(corp_name)
+        found = _report_keywords(report_name)
+        if found.isdisjoint(keywords) or not _is_calendar_company(corp_name):
+            labels.append(("skip", importance))
+        elif _is_direct_earnings_report(report_name, found):
+            labels.append(("result", importance))
+        elif _is_ir_report(report_name, found):
+            labels.append(("ir", importance))
+        else:
+            labels.append(("skip", importance))
+    return labels
+
+
+def _load_corpus(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as fp:
+        data = json.load(fp)
+    items = data.get("list", []) if isinstance(data, dict) else data
+    return [{"report_nm": item.get("report_nm", ""), "corp_name": item.get("corp_name", "")} for item in items]
+
+
+def _synthetic_corpus(count: int = 700) -> list[dict]:
+    companies = list(EARNINGS_CALENDAR_COMPANY_NAMES) + OTHER_COMPANIES * 8
+    items = []
+    for index in range(count):
+        reports = MATCHING_REPORTS if index % 5 == 0 else OTHER_REPORTS
+        items.append({"report_nm": reports[index % len(reports)], "corp_name": companies[index % len(companies)]})
+    return items
+
+
+def _per_call_us(statement) -> float:
+    return min(timeit.repeat(statement, number=ITERATIONS, repeat=5)) / ITERATIONS * 1_000_000
+
+
+def main() -> None:
+    items = _load_corpus(sys.argv[1]) if len(sys.argv) > 1 else _synthetic_corpus()
+    keywords = PBLNTF_TYPES[0][1]
+    assert _classify(items, keywords) == _legacy_classify(items, keywords)
+
+    new = _per_call_us(lambda: _classify(items, keywords))
+    old = _per_call_us(lambda: _legacy_classify(items, keywords))
+
+    print(f"{'dart list filter':<32}{'new (us)':>14}{'old (us)':>14}{'speedup':>10}{'filings/s':>14}")
+    print(f"{f'classify x{len(items)} filings':<32}{new:>14.2f}{old:>14.2f}{old / new:>9.1f}x{len(items) / new * 1e6:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
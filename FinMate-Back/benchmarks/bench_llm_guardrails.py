@@ -0,0 +1,97 @@
+"""Micro-benchmarks for the LLM guardrail matcher and payload sanitization.
+
+Compares the anchor-keyword scan with running every prohibited-advice pattern one by one (as the
+guardrail used to), and the copy-free payload walk with deep-copying the news-weather payload first.
+Run from FinMate-Back:
+
+    python -m benchmarks.bench_llm_guardrails
+"""
+
+from __future__ import annotations
+
+import re
+import timeit
+from copy import deepcopy
+
+from llm_guardrails import (
+    PROHIBITED_INVESTMENT_ADVICE_PATTERNS,
+    _sanitize_value,
+    has_prohibited_investment_advice,
+    iter_eval_cases,
+    sanitize_llm_payload,
+)
+
+CARD_COUNT = 200
+ITERATIONS = 50
+
+SAFE_SENTENCES = [
+    "금리가 오르면 할인율이 높아져 성장주 평가에 부담이 될 수 있어요.",
+    "환율 변동은 수출 기업의 실적 발표에서 함께 확인해 볼 체크포인트입니다.",
+    "공시 원문과 발행일, 지표 기준일을 함께 확인해 주세요.",
+]
+
+
+# The per-pattern list as it was, including the optional time-word prefix on the "사세요" pattern.
+LEGACY_PATTERNS = [
+    re.compile(r"(지금|오늘|내일|이번\s*주)?\s*(사세요|팔세요|담으세요|손절하세요|익절하세요)")
+    if pattern.pattern.startswith("(사세요")
+    else pattern
+    for pattern in PROHIBITED_INVESTMENT_ADVICE_PATTERNS
+]
+
+
+def _legacy_has_prohibited(text: str) -> bool:
+    if not text:
+        return False
+    normalized = " ".join(text.split())
+    return any(pattern.search(normalized) for pattern in LEGACY_PATTERNS)
+
+
+def _build_corpus() -> list[str]:
+    corpus = [case["unsafe_output"] for case in iter_eval_cases()]
+    corpus += [" ".join(SAFE_SENTENCES[index % 3] for index in range(count)) for count in range(1, 21)]
+    return corpus
+
+
+def _build_payload(cards: int) -> dict:
+    return {
+        "weather": {"line1": "오늘 날씨는 : CLOUDY", "line2": SAFE_SENTENCES[0], "line3": SAFE_SENTENCES[1]},
+        "cards": [
+            {
+                "category": "증시",
+                "title": f"반도체 업황 점검 {index}",
+                "summary": " ".join(SAFE_SENTENCES),
+                "insight": SAFE_SENTENCES[index % 3],
+                "url": f"https://example.com/news/{index}",
+            }
+            for index in range(cards)
+        ],
+    }
+
+
+def _per_call_us(statement) -> float:
+    return min(timeit.repeat(statement, number=ITERATIONS, repeat=5)) / ITERATIONS * 1_000_000
+
+
+def main() -> None:
+    corpus = _build_corpus()
+    payload = _build_payload(CARD_COUNT)
+    assert [has_prohibited_investment_advice(text) for text in corpus] == [
+        _legacy_has_prohibited(text) for text in corpus
+    ]
+
+    combined = _per_call_us(lambda: [has_prohibited_investment_advice(text) for text in corpus])
+    per_pattern = _per_call_us(lambda: [_legacy_has_prohibited(text) for text in corpus])
+    walk = _per_call_us(lambda: sanitize_llm_payload(payload, "news_weather"))
+    walk_copy = _per_call_us(lambda: _sanitize_value(deepcopy(dict(payload)), "news_weather"))
+
+    print(f"{'guardrail':<32}{'new (us)':>14}{'old (us)':>14}{'speedup':>10}")
+    for label, new, old in (
+        (f"match corpus x{len(corpus)}", combined, per_pattern),
+        (f"sanitize payload x{CARD_COUNT} cards", walk, walk_copy),
+    ):
+        print(f"{label:<32}{new:>14.2f}{old:>14.2f}{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Micro-benchmarks for PublicDataMarketDataProvider cache hits and row parsing.
+
+Compares the shared read-only snapshots with the per-read deep copies the cache used to make,
+and the column parser with building a validated pydantic ``DailyBar`` per row. Run from
+FinMate-Back:
+
+    python -m benchmarks.bench_market_data_cache
+"""
+
+from __future__ import annotations
+
+import timeit
+from datetime import date, datetime, timedelta
+
+from market_data.public_data_provider import PublicDataMarketDataProvider, _rows_to_columns, _to_float
+from market_data.types import DailyBar, DailyBarSeries, MarketDataStatus, MarketInstrumentType
+
+ROW_COUNT = 360
+ITERATIONS = 200
+
+
+class _StaticResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class _StaticSession:
+    def __init__(self, rows):
+        self._payload = {"response": {"header": {"resultCode": "00"}, "body": {"items": {"item": rows}}}}
+
+    def get(self, url, params, timeout):
+        return _StaticResponse(self._payload)
+
+
+def _build_rows(count: int) -> list[dict[str, str]]:
+    start = date(2025, 1, 1)
+    return [
+        {
+            "basDt": (start + timedelta(days=index)).strftime("%Y%m%d"),
+            "srtnCd": "005930",
+            "itmsNm": "삼성전자",
+            "mkp": "70000",
+            "hipr": "71000",
+            "lopr": "69000",
+            "clpr": "70500",
+            "trqu": "1000000",
+        }
+        for index in range(count)
+    ]
+
+
+def _per_call_us(statement) -> float:
+    return min(timeit.repeat(statement, number=ITERATIONS, repeat=5)) / ITERATIONS * 1_000_000
+
+
+def main() -> None:
+    rows = _build_rows(ROW_COUNT)
+    provider = PublicDataMarketDataProvider(
+        service_key="bench",
+        stock_price_url="https://example.com/stock",
+        session=_StaticSession(rows),
+        cache_ttl_seconds=3600,
+    )
+    provider.get_stock_daily_bars("005930", lookback=260)
+    columns = _rows_to_columns(rows)
+    bars = columns.to_bars()
+    provider._set_cache_entry(provider._benchmark_bars_cache, ("benchmark", "kospi", 260), columns)
+
+    stock_hit = _per_call_us(lambda: provider._fetch_stock_snapshot("005930", requested_lookback=260))
+    stock_copy = _per_call_us(lambda: [dict(row) for row in rows])
+    bench_hit = _per_call_us(lambda: provider._get_cached_benchmark_bars(("benchmark", "kospi", 260)))
+    bench_copy = _per_call_us(lambda: [bar.model_copy(deep=True) for bar in bars])
+    ticker_hit = _per_call_us(lambda: provider.normalize_ticker("005930"))
+    ticker_copy = _per_call_us(lambda: provider.normalize_ticker("005930").model_copy(deep=True))
+    warm_series = _per_call_us(lambda: provider.get_stock_daily_bars("005930", lookback=260))
+    warm_series_legacy = _per_call_us(lambda: _build_series_from_models(provider, [dict(row) for row in rows]))
+    parse_columns = _per_call_us(lambda: _build_series_from_columns(provider, rows))
+    parse_models = _per_call_us(lambda: _build_series_from_models(provider, rows))
+
+    print(f"{'cache read':<28}{'snapshot (us)':>16}{'deep copy (us)':>16}{'speedup':>10}")
+    for label, shared, copied in (
+        (f"stock rows x{ROW_COUNT}", stock_hit, stock_copy),
+        (f"benchmark bars x{ROW_COUNT}", bench_hit, bench_copy),
+        ("normalize_ticker", ticker_hit, ticker_copy),
+    ):
+        print(f"{label:<28}{shared:>16.2f}{copied:>16.2f}{copied / shared:>9.1f}x")
+
+    print()
+    print(f"{'rows -> DailyBarSeries':<28}{'columns (us)':>16}{'per-bar (us)':>16}{'speedup':>10}")
+    for label, columnar, per_bar in (
+        ("get_stock_daily_bars (hit)", warm_series, warm_series_legacy),
+        (f"cold parse x{ROW_COUNT}", parse_columns, parse_models),
+    ):
+        print(f"{label:<28}{columnar:>16.2f}{per_bar:>16.2f}{per_bar / columnar:>9.1f}x")
+
+
+def _series_fields(provider: PublicDataMarketDataProvider) -> dict:
+    return {
+        "instrument_type": MarketInstrumentType.EQUITY,
+        "instrument_code": "005930",
+        "data_status": MarketDataStatus.FRESH,
+        "source": provider.source_info,
+    }
+
+
+def _build_series_from_columns(provider: PublicDataMarketDataProvider, rows) -> DailyBarSeries:
+    return DailyBarSeries.from_columns(_rows_to_columns(rows), **_series_fields(provider))
+
+
+def _build_series_from_models(provider: PublicDataMarketDataProvider, rows) -> DailyBarSeries:
+    bars = [
+        DailyBar(
+            date=datetime.strptime(row["basDt"], "%Y%m%d").date(),
+            open=_to_float(row["mkp"]),
+            high=_to_float(row["hipr"]),
+            low=_to_float(row["lopr"]),
+            close=_to_float(row["clpr"]),
+            volume=int(_to_float(row["trqu"])),
+        )
+        for row in rows
+    ]
+    by_date = {bar.date: bar for bar in bars}
+    return DailyBarSeries(**_series_fields(provider), bars=[by_date[bar_date] for bar_date in sorted(by_date)])
+
+
+if __name__ == "__main__":
+    main()
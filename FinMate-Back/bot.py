@@ -1,10 +1,15 @@
 # finmate_ai.py
 
-from typing import Literal, List, Mapping
+import queue
+import threading
+from typing import Dict, Iterator, Literal, List, Mapping
 from google import genai
 from google.genai import types
 from config import settings  # 환경변수 및 설정값 관리 모듈
-from llm_guardrails import build_prompt_reminder, build_system_instruction, ensure_safe_llm_text
+from llm_guardrails import StreamingGuardrail, build_prompt_reminder, build_system_instruction, ensure_safe_llm_text
+from llm_cache import cached_llm_text, get_llm_cache, make_cache_key  # 같은 프롬프트의 Gemini 응답 재사용
+from llm_gateway import QUEUE_TIMEOUT_SECONDS, Priority, llm_slot, run_llm  # Gemini RPM/동시 호출 제한 (챗봇은 최우선)
+from chat_sessions import MAX_RECENT_TURNS  # 세션이 원문으로 두는 턴 수와 프롬프트에 넣는 턴 수를 같게 유지
 
 # ==============================================================================
 # 1. Google Gemini API 클라이언트 설정
@@ -60,21 +65,15 @@ config = types.GenerateContentConfig(
 # 2. 챗봇 답변 생성 함수 (Core Logic)
 # ==============================================================================
 
-def generate_finmate_reply(
+def build_chat_prompt(
     mode: Literal["easy", "pro"],
     message: str,
     history: List[Mapping[str, str]],
+    summary: str = "",
 ) -> str:
     """
-    FinMate용 Gemini 답변 생성 함수.
-    
-    Args:
-        mode (str): "easy"(초보자용) 또는 "pro"(전문가용) 모드 선택
-        message (str): 사용자가 현재 입력한 질문
-        history (List): 이전 대화 기록 목록 [{ "role": "user/ai", "text": "..." }]
-        
-    Returns:
-        str: AI가 생성한 답변 텍스트
+    모드 지시사항 + 안전 규칙 + (오래된 대화 요약) + 이전 대화 기록 + 현재 질문으로 Gemini 프롬프트를 조립합니다.
+    (일반 응답과 스트리밍 응답이 같은 프롬프트를 써야 캐시를 함께 사용할 수 있습니다.)
     """
 
     # -----------------------------------------------------------
@@ -90,8 +89,9 @@ def generate_finmate_reply(
     # 2) 대화 문맥(Context) 관리
     # API 비용 절감 및 토큰 제한을 고려하여, 최근 대화 9개까지만 잘라서 사용합니다.
     # (이번 질문 1개 + 이전 기록 9개 = 총 10개 턴의 맥락 유지)
+    # 서버 세션은 그보다 오래된 턴을 summary로 접어 두므로 잘려 나가는 대화가 없습니다.
     # -----------------------------------------------------------
-    trimmed_history = history[-9:]
+    trimmed_history = history[-MAX_RECENT_TURNS:]
 
     # -----------------------------------------------------------
     # 3) 히스토리 데이터 포맷팅
@@ -106,12 +106,15 @@ def generate_finmate_reply(
         history_lines.append(f"{speaker}: {text}")
 
     history_text = "\n".join(history_lines) if history_lines else "이전 대화 없음"
+    # 서버 세션이 토큰 예산을 넘어 접어 둔 오래된 대화가 있으면 앞에 붙입니다.
+    if summary:
+        history_text = f"[앞선 대화 요약]\n{summary}\n\n[최근 대화]\n{history_text}"
 
     # -----------------------------------------------------------
     # 4) 최종 프롬프트(Prompt) 조립
     # [모드 지시사항] + [이전 대화 기록] + [현재 질문] 순서로 합칩니다.
     # -----------------------------------------------------------
-    user_prompt = (
+    return (
         mode_prefix
         + build_prompt_reminder("chat")
         + "\n"
@@ -122,15 +125,151 @@ def generate_finmate_reply(
         + f"사용자 질문: {message}"
     )
 
+
+def generate_finmate_reply(
+    mode: Literal["easy", "pro"],
+    message: str,
+    history: List[Mapping[str, str]],
+    summary: str = "",
+) -> str:
+    """
+    FinMate용 Gemini 답변 생성 함수.
+    
+    Args:
+        mode (str): "easy"(초보자용) 또는 "pro"(전문가용) 모드 선택
+        message (str): 사용자가 현재 입력한 질문
+        history (List): 이전 대화 기록 목록 [{ "role": "user/ai", "text": "..." }]
+        summary (str): 서버 세션에서 접어 둔 오래된 대화 요약 (없으면 빈 문자열)
+        
+    Returns:
+        str: AI가 생성한 답변 텍스트
+    """
+    user_prompt = build_chat_prompt(mode, message, history, summary)
+
     # -----------------------------------------------------------
-    # 5) Gemini API 호출 및 응답 반환
+    # Gemini API 호출 및 응답 반환
     # 설정된 모델과 설정을 사용하여 최종 텍스트를 생성합니다.
+    # (모드/대화 기록/질문이 모두 같은 프롬프트는 llm_cache에서 짧게 재사용)
     # -----------------------------------------------------------
-    chat_session = client.chats.create(
-        model=settings.GEMINI_MODEL_DEFAULT,  # config.py에서 지정한 모델명 (예: gemini-2.0-flash)
-        config=config,
+    def _generate() -> str:
+        chat_session = client.chats.create(
+            model=settings.GEMINI_MODEL_DEFAULT,  # config.py에서 지정한 모델명 (예: gemini-2.0-flash)
+            config=config,
+        )
+
+        response = run_llm(lambda: chat_session.send_message(user_prompt), priority=Priority.INTERACTIVE)
+
+        return ensure_safe_llm_text(response.text, "chat")
+
+    return cached_llm_text(
+        "chat",
+        model=settings.GEMINI_MODEL_DEFAULT,
+        system_instruction=system_persona,
+        prompt=user_prompt,
+        generate=_generate,
     )
 
-    response = chat_session.send_message(user_prompt)
-    
-    return ensure_safe_llm_text(response.text, "chat")
+
+# ==============================================================================
+# 3. 스트리밍 답변 생성 함수 (/api/chat/stream)
+# ==============================================================================
+
+def stream_finmate_reply(
+    mode: Literal["easy", "pro"],
+    message: str,
+    history: List[Mapping[str, str]],
+    summary: str = "",
+) -> Iterator[Dict[str, str]]:
+    """
+    Gemini 스트리밍 응답을 조각 단위로 전달합니다.
+
+    Yields:
+        {"event": "delta", "text": "..."}: 가드레일을 통과한 답변 조각
+        {"event": "replace", "text": "..."}: 금지 표현이 감지되어 지금까지의 답변을 안전 문구로 바꿔야 할 때
+        {"event": "done", "reply": "..."}: 최종 답변 (일반 /api/chat 응답과 같은 값)
+    """
+    user_prompt = build_chat_prompt(mode, message, history, summary)
+
+    # 같은 프롬프트의 답변이 캐시에 있으면 한 번에 보냅니다.
+    cache = get_llm_cache()
+    cache_key = make_cache_key(
+        "chat",
+        model=settings.GEMINI_MODEL_DEFAULT,
+        prompt=user_prompt,
+        system_instruction=system_persona,
+    )
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None:
+        yield {"event": "delta", "text": cached}
+        yield {"event": "done", "reply": cached}
+        return
+
+    # Gemini 스트림은 별도 스레드가 받아 큐에 쌓습니다. 클라이언트가 느리게 읽어도
+    # 게이트웨이 동시 호출 슬롯은 Gemini 응답이 끝나는 즉시 반납됩니다.
+    guard = StreamingGuardrail("chat")
+    pieces: "queue.Queue[object]" = queue.Queue()
+    cancelled = threading.Event()
+    threading.Thread(
+        target=_pump_chat_stream,
+        args=(user_prompt, guard, pieces, cancelled),
+        name="gemini-chat-stream",
+        daemon=True,
+    ).start()
+    try:
+        # 첫 조각은 슬롯 대기 시간까지 기다리고, 이후에는 조각 사이 간격이 STREAM_IDLE_TIMEOUT_SECONDS를 넘으면 중단합니다.
+        timeout = STREAM_FIRST_CHUNK_TIMEOUT_SECONDS
+        while True:
+            try:
+                piece = pieces.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(f"Gemini 스트리밍 응답이 {timeout:.0f}초 동안 멈췄습니다.") from None
+            timeout = STREAM_IDLE_TIMEOUT_SECONDS
+            if piece is _STREAM_END:
+                break
+            if isinstance(piece, BaseException):
+                raise piece
+            yield {"event": "delta", "text": piece}
+    finally:
+        # 클라이언트가 끊거나 Gemini 응답이 멈춰 중단하면 남은 응답은 받지 않습니다.
+        cancelled.set()
+
+    tail = guard.finish()
+    if tail:
+        yield {"event": "delta", "text": tail}
+    if guard.tripped:
+        yield {"event": "replace", "text": guard.text}
+    elif cache is not None:
+        cache.set(cache_key, "chat", guard.text)
+    yield {"event": "done", "reply": guard.text}
+
+
+_STREAM_END = object()
+
+# Gemini 스트림이 예외 없이 멈추면 SSE 응답이 서버 워커를 계속 붙잡지 않도록 끊는 기준 (초)
+STREAM_IDLE_TIMEOUT_SECONDS = 30.0
+STREAM_FIRST_CHUNK_TIMEOUT_SECONDS = QUEUE_TIMEOUT_SECONDS[Priority.INTERACTIVE] + STREAM_IDLE_TIMEOUT_SECONDS
+
+
+def _pump_chat_stream(
+    user_prompt: str,
+    guard: StreamingGuardrail,
+    pieces: "queue.Queue[object]",
+    cancelled: threading.Event,
+) -> None:
+    """Gemini 스트림을 받아 가드레일을 통과한 조각을 pieces에 넣습니다. 끝나면 _STREAM_END, 실패하면 예외 객체."""
+    try:
+        with llm_slot(Priority.INTERACTIVE):
+            chat_session = client.chats.create(
+                model=settings.GEMINI_MODEL_DEFAULT,
+                config=config,
+            )
+            for chunk in chat_session.send_message_stream(user_prompt):
+                released = guard.feed(chunk.text or "")
+                if released:
+                    pieces.put(released)
+                if guard.tripped or cancelled.is_set():
+                    # 금지 표현이 보이면(또는 클라이언트가 떠나면) 나머지 생성은 받지 않고 끊습니다.
+                    break
+        pieces.put(_STREAM_END)
+    except Exception as e:
+        pieces.put(e)
@@ -4,6 +4,8 @@ from google import genai
 from google.genai import types
 from config import settings
 from llm_guardrails import build_prompt_reminder, build_system_instruction, ensure_safe_llm_text
+from llm_cache import cached_llm_text
+from llm_gateway import Priority, run_llm
 
 
 # ==============================================================================
@@ -109,10 +111,22 @@ def generate_calendar_insight(
         event_type=event_type,
     )
 
-    res = client.models.generate_content(
+    def _generate() -> str:
+        res = run_llm(
+            lambda: client.models.generate_content(
+                model=settings.GEMINI_MODEL_DEFAULT,
+                contents=prompt,
+                config=INSIGHT_CONFIG,
+            ),
+            priority=Priority.USER,
+        )
+        return ensure_safe_llm_text(res.text, "calendar_insight")
+
+    # 같은 이벤트는 여러 사용자가 눌러도 한 번만 생성
+    return cached_llm_text(
+        "calendar_insight",
         model=settings.GEMINI_MODEL_DEFAULT,
-        contents=prompt,
-        config=INSIGHT_CONFIG,
+        system_instruction=INSIGHT_SYSTEM_PERSONA,
+        prompt=prompt,
+        generate=_generate,
     )
-    
-    return ensure_safe_llm_text(res.text, "calendar_insight")
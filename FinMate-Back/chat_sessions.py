@@ -0,0 +1,225 @@
+# chat_sessions.py
+# 챗봇 대화 세션 저장소 (/api/chat, /api/chat/stream 공용)
+# - 클라이언트가 매 요청마다 전체 대화 기록(history)을 보내지 않도록, 서버가 세션 id별로 대화를 보관합니다.
+# - 메모리 LRU(최대 세션 수) + 선택적 SQLite 저장(CHAT_SESSION_PATH를 지정하면 서버 재시작 후에도 유지)
+# - 대화가 토큰 예산을 넘으면 오래된 턴부터 짧은 요약 줄로 접어서, 턴이 쌓여도 프롬프트 길이가 일정하게 유지됩니다.
+#   (요약은 Gemini를 추가로 호출하지 않고 앞부분만 남기는 방식이라 비용/지연이 없습니다.)
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from config import settings
+
+SESSION_ID_PATTERN = r"^[0-9a-f]{32}$"   # 서버가 발급하는 세션 id 형식 (uuid4 hex)
+SUMMARY_LINE_CHARS = 60     # 요약으로 접힌 턴 하나에 남길 최대 글자 수
+MIN_RECENT_TURNS = 2        # 예산을 넘어도 최근 턴 2개(질문 + 답변)는 원문으로 유지
+MAX_RECENT_TURNS = 9        # 원문으로 두는 최대 턴 수. 챗봇 프롬프트(bot.build_chat_prompt)도 최근 9개만 넣으므로
+                            # 그보다 오래된 턴은 예산 안이어도 요약으로 접어야 프롬프트에서 사라지지 않습니다.
+
+
+def estimate_tokens(text: str) -> int:
+    """한글 위주 텍스트 기준 대략적인 토큰 수 (2글자 ≈ 1토큰)"""
+    return (len(text or "") + 1) // 2
+
+
+@dataclass
+class ChatSession:
+    id: str
+    turns: List[Dict[str, str]] = field(default_factory=list)   # [{"role": "user"|"ai", "text": "..."}]
+    summary: str = ""                                           # 접힌 오래된 턴의 요약
+    updated_at: float = 0.0
+
+    def history(self) -> List[Dict[str, str]]:
+        return [dict(turn) for turn in self.turns]
+
+
+class ChatSessionStore:
+    def __init__(
+        self,
+        *,
+        max_sessions: int = 1000,
+        token_budget: int = 1200,
+        ttl_seconds: float = 24 * 3600,
+        path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._max_sessions = max(max_sessions, 1)
+        self._token_budget = max(token_budget, 1)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+        # append_turn이 조회 → 추가 → 저장을 한 번에 묶으므로 재진입 가능한 락을 씁니다.
+        self._lock = threading.RLock()
+        self._path = Path(path) if path else None
+        self._db_lock = threading.Lock()
+        self._db_initialized = False
+
+    def get_or_create(
+        self,
+        session_id: Optional[str],
+        seed_history: Optional[List[Dict[str, str]]] = None,
+    ) -> ChatSession:
+        """
+        세션 id로 대화를 찾습니다. 없거나 만료되었으면 서버가 새 id를 발급해 새 세션을 만들고,
+        클라이언트가 보낸 history가 있으면 첫 대화 기록으로 사용합니다. (기존 클라이언트 호환)
+        클라이언트가 보낸 id를 그대로 새 세션 키로 쓰지 않으므로, 같은 id를 보낸 다른 사용자와 대화가 섞이지 않습니다.
+        """
+        session = self.get(session_id) if session_id else None
+        if session is not None:
+            return session
+        session = ChatSession(id=uuid.uuid4().hex, updated_at=self._clock())
+        for turn in seed_history or []:
+            session.turns.append({"role": turn.get("role", "user"), "text": turn.get("text", "")})
+        self._compact(session)
+        self._put(session)
+        return session
+
+    def get(self, session_id: str) -> Optional[ChatSession]:
+        now = self._clock()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                if now - session.updated_at <= self._ttl_seconds:
+                    self._sessions.move_to_end(session_id)
+                    return _copy(session)
+                del self._sessions[session_id]
+
+        if self._path is None:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT turns, summary, updated_at FROM chat_sessions WHERE session_id = ? AND updated_at >= ?",
+                (session_id, now - self._ttl_seconds),
+            ).fetchone()
+        if row is None:
+            return None
+        session = ChatSession(id=session_id, turns=json.loads(row[0]), summary=row[1], updated_at=row[2])
+        self._remember(session)
+        return _copy(session)
+
+    def append_turn(self, session_id: str, user_text: str, ai_text: str) -> ChatSession:
+        """질문과 답변 한 쌍을 추가하고, 토큰 예산을 넘으면 오래된 턴을 요약으로 접습니다."""
+        # 같은 세션에 동시에 들어온 두 요청이 서로의 턴을 덮어쓰지 않도록 조회부터 저장까지 락을 잡습니다.
+        with self._lock:
+            session = self.get_or_create(session_id)
+            session.turns.append({"role": "user", "text": user_text})
+            session.turns.append({"role": "ai", "text": ai_text})
+            session.updated_at = self._clock()
+            self._compact(session)
+            self._put(session)
+            return session
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+        if self._path is not None:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM chat_sessions WHERE session_id = ?", (session_id,))
+                conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"sessions": len(self._sessions), "max_sessions": self._max_sessions}
+
+    # --------------------------------------------------------------------------
+    # 내부 함수
+    # --------------------------------------------------------------------------
+
+    def _compact(self, session: ChatSession) -> None:
+        def total_tokens() -> int:
+            return estimate_tokens(session.summary) + sum(estimate_tokens(turn["text"]) for turn in session.turns)
+
+        # 1) 오래된 턴부터 한 줄 요약으로 접기 (예산 초과 또는 프롬프트에 들어가는 턴 수 초과)
+        while len(session.turns) > MAX_RECENT_TURNS or (
+            total_tokens() > self._token_budget and len(session.turns) > MIN_RECENT_TURNS
+        ):
+            turn = session.turns.pop(0)
+            speaker = "사용자" if turn["role"] == "user" else "컨설턴트"
+            text = " ".join(turn["text"].split())
+            if len(text) > SUMMARY_LINE_CHARS:
+                text = text[:SUMMARY_LINE_CHARS] + "…"
+            line = f"- {speaker}: {text}"
+            session.summary = f"{session.summary}\n{line}" if session.summary else line
+
+        # 2) 요약도 예산의 절반을 넘으면 가장 오래된 요약 줄부터 버리기
+        lines = session.summary.split("\n") if session.summary else []
+        while lines and estimate_tokens("\n".join(lines)) > self._token_budget // 2:
+            lines.pop(0)
+        session.summary = "\n".join(lines)
+
+    def _put(self, session: ChatSession) -> None:
+        self._remember(session)
+        if self._path is None:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO chat_sessions (session_id, turns, summary, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    turns = excluded.turns,
+                    summary = excluded.summary,
+                    updated_at = excluded.updated_at
+                """,
+                (session.id, json.dumps(session.turns, ensure_ascii=False), session.summary, session.updated_at),
+            )
+            conn.execute(
+                "DELETE FROM chat_sessions WHERE updated_at < ?",
+                (self._clock() - self._ttl_seconds,),
+            )
+            conn.commit()
+
+    def _remember(self, session: ChatSession) -> None:
+        with self._lock:
+            self._sessions[session.id] = _copy(session)
+            self._sessions.move_to_end(session.id)
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=10)
+        if not self._db_initialized:
+            with self._db_lock:
+                if not self._db_initialized:
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS chat_sessions (
+                            session_id TEXT PRIMARY KEY,
+                            turns TEXT NOT NULL,
+                            summary TEXT NOT NULL,
+                            updated_at REAL NOT NULL
+                        )
+                        """
+                    )
+                    conn.commit()
+                    self._db_initialized = True
+        return conn
+
+
+def _copy(session: ChatSession) -> ChatSession:
+    return ChatSession(id=session.id, turns=session.history(), summary=session.summary, updated_at=session.updated_at)
+
+
+# ==============================================================================
+# 앱 전역 인스턴스
+# ==============================================================================
+
+@lru_cache(maxsize=1)
+def get_chat_session_store() -> ChatSessionStore:
+    path = (settings.CHAT_SESSION_PATH or "").strip() or None
+    if path:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return ChatSessionStore(
+        max_sessions=settings.CHAT_SESSION_MAX,
+        token_budget=settings.CHAT_SESSION_TOKEN_BUDGET,
+        ttl_seconds=settings.CHAT_SESSION_TTL_HOURS * 3600,
+        path=path,
+    )
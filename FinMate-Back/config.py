@@ -6,19 +6,32 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-def _optional_int_env(name: str) -> int | None:
+def _optional_int_env(name: str, default: int | None = None) -> int | None:
+    # default는 값이 없거나 숫자가 아닐 때만 씁니다. (명시적인 0은 그대로 유지)
     value = os.getenv(name)
     if value in (None, ""):
-        return None
+        return default
     try:
         return int(value)
     except (TypeError, ValueError):
-        return None
+        return default
 
 class Settings:
     # ECOS
     ECOS_AUTH_KEY = os.getenv("ECOS_AUTH_KEY", "")
     ECOS_BASE_URL = os.getenv("ECOS_BASE_URL", "http://ecos.bok.or.kr/api")
+    # 챗봇 용어 사전 로컬 색인 (JSON) 및 백그라운드 갱신 주기
+    ECOS_GLOSSARY_INDEX_PATH = os.getenv(
+        "ECOS_GLOSSARY_INDEX_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ecos_glossary_index.json"),
+    )
+    ECOS_GLOSSARY_REFRESH_ENABLED = os.getenv("ECOS_GLOSSARY_REFRESH_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+    ECOS_GLOSSARY_REFRESH_HOURS = _optional_int_env("ECOS_GLOSSARY_REFRESH_HOURS") or 168
+    # 마감된 달의 KOSPI 월평균 집계 저장소 (빈 값이면 저장하지 않음)
+    ECOS_MONTHLY_STORE_PATH = os.getenv(
+        "ECOS_MONTHLY_STORE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ecos_monthly.db"),
+    )
     
     # NAVER
     NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID", "")
@@ -29,9 +42,27 @@ class Settings:
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
     # 모델은 변경 가능합니다
     GEMINI_MODEL_DEFAULT = os.getenv("GEMINI_MODEL_DEFAULT", "")
+    # 같은 프롬프트의 Gemini 응답 캐시 (LLM_CACHE_PATH를 지정하면 SQLite에도 저장)
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+    LLM_CACHE_MAX_ENTRIES = _optional_int_env("LLM_CACHE_MAX_ENTRIES") or 512
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "")
+    # Gemini 호출 게이트웨이: 분당 요청 수(토큰 버킷)와 최대 동시 호출 수
+    GEMINI_REQUESTS_PER_MINUTE = _optional_int_env("GEMINI_REQUESTS_PER_MINUTE") or 15
+    GEMINI_MAX_CONCURRENCY = _optional_int_env("GEMINI_MAX_CONCURRENCY") or 4
+    # 챗봇 대화 세션 (CHAT_SESSION_PATH를 지정하면 SQLite에도 저장)
+    CHAT_SESSION_MAX = _optional_int_env("CHAT_SESSION_MAX") or 1000
+    CHAT_SESSION_TOKEN_BUDGET = _optional_int_env("CHAT_SESSION_TOKEN_BUDGET") or 1200
+    CHAT_SESSION_TTL_HOURS = _optional_int_env("CHAT_SESSION_TTL_HOURS") or 24
+    CHAT_SESSION_PATH = os.getenv("CHAT_SESSION_PATH", "")
 
     # DART
     DART_API_KEY = os.getenv("DART_API_KEY", "")
+    # DART 공시 목록 로컬 색인 (빈 값이면 색인 없이 매번 목록 API 조회) 및 최신 공시 갱신 주기
+    DART_FILING_INDEX_PATH = os.getenv(
+        "DART_FILING_INDEX_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "dart_filings.db"),
+    )
+    DART_FILING_INDEX_REFRESH_MINUTES = _optional_int_env("DART_FILING_INDEX_REFRESH_MINUTES") or 30
 
     # DATA.GO.KR
     DATA_GO_KR_SERVICE_KEY = os.getenv("DATA_GO_KR_SERVICE_KEY", "")
@@ -40,5 +71,18 @@ class Settings:
         "https://apis.data.go.kr/1160100/service/GetStockSecuritiesInfoService/getStockPriceInfo",
     )
     DATA_GO_KR_CACHE_TTL_SECONDS = _optional_int_env("DATA_GO_KR_CACHE_TTL_SECONDS")
+    # 빈 값이면 일봉 디스크 저장소를 사용하지 않습니다
+    DATA_GO_KR_BAR_STORE_PATH = os.getenv(
+        "DATA_GO_KR_BAR_STORE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "market_bars.db"),
+    )
+
+    # 13:10 KST 갱신 직후 지원 종목/벤치마크 캐시를 미리 채웁니다 (0/false면 끔)
+    MARKET_DATA_PREWARM_ENABLED = os.getenv("MARKET_DATA_PREWARM_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+    MARKET_DATA_PREWARM_DELAY_SECONDS = _optional_int_env("MARKET_DATA_PREWARM_DELAY_SECONDS", 30)
+
+    # STRATEGY SCREENER
+    STRATEGY_SCREEN_MAX_CONCURRENCY = _optional_int_env("STRATEGY_SCREEN_MAX_CONCURRENCY") or 4
+    STRATEGY_SCREEN_MAX_SYMBOLS = _optional_int_env("STRATEGY_SCREEN_MAX_SYMBOLS") or 100
 
 settings = Settings()
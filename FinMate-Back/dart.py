@@ -2,16 +2,24 @@
 # 금융감독원 전자공시시스템(DART) API 연동 모듈
 # - 실적·잠정실적 공시와 실적 관련 IR 일정을 캘린더 이벤트 형식으로 변환합니다.
 
+import codecs
 import html
 import io
 import re
-import requests
+import tempfile
+import threading
+import time
 import zipfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, IO, Iterable, Iterator, Optional, Set, Tuple
 
 from config import settings
+from dart_filing_index import DartFilingIndex, IrClassification, open_dart_filing_index
+from http_client import http_get
+from keyword_matcher import KeywordMatcher
 
 # ==============================================================================
 # 1. DART API 설정
@@ -112,6 +120,23 @@ IR_EVENT_DATE_LABELS = [
 ]
 
 MAX_IR_DETAIL_FETCHES = 80
+# IR 원문은 최대 IR_FETCH_WORKERS개씩 동시에 받고, IR_FETCH_DEADLINE초 안에 끝난 것만 이번 응답에 반영합니다.
+IR_FETCH_WORKERS = 8
+IR_FETCH_DEADLINE = 10.0
+LIST_MAX_PAGES = 7  # 색인을 쓰지 않을 때: 7페이지 × 100건 = 700건/타입
+
+# IR 원문 스트리밍 분류: 압축 해제/디코딩 단위, 메모리에 둘 최대 응답 크기(넘으면 임시 파일), 최대 검사 글자 수
+DOCUMENT_READ_BYTES = 64 * 1024
+DOCUMENT_SPOOL_BYTES = 1024 * 1024
+MAX_IR_SCAN_CHARS = 100_000
+_DATE_WINDOW_CHARS = 140
+_ENCODING_SNIFF_BYTES = 8 * 1024
+
+# 공시 목록 색인 동기화: 한 번에 요청하는 접수일 구간(일)과 구간당 최대 페이지 수
+# (페이지가 더 많으면 구간을 나눠서 받음), 캘린더 요청 한 번이 받아 오는 최대 구간 수(나머지는 다음 요청이 이어서 받음)
+INDEX_SYNC_CHUNK_DAYS = 7
+INDEX_SYNC_MAX_PAGES = 30
+INDEX_SYNC_MAX_CHUNKS_PER_CALL = 2
 
 _DATE_TIME_RE = re.compile(
     r"(20\d{2})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})\s*일?"
@@ -147,6 +172,24 @@ def _fetch_dart_list(
     if not DART_API_KEY:
         return []
 
+    try:
+        items, _ = _request_dart_list(bgn_de, end_de, pblntf_ty, page_no, page_count)
+        return items
+    except Exception:
+        return []
+
+
+def _request_dart_list(
+    bgn_de: str,
+    end_de: str,
+    pblntf_ty: Optional[str],
+    page_no: int,
+    page_count: int = 100,
+) -> Tuple[List[Dict], int]:
+    """
+    _fetch_dart_list와 같은 요청을 보내되, 실패하면 예외를 발생시키고 (항목, 전체 페이지 수)를 반환합니다.
+    색인 동기화는 "결과 없음"과 "요청 실패"를 구분해야 하므로 이 함수를 사용합니다.
+    """
     params: Dict[str, Any] = {
         "crtfc_key": DART_API_KEY,
         "bgn_de": bgn_de,
@@ -159,20 +202,19 @@ def _fetch_dart_list(
     if pblntf_ty:
         params["pblntf_ty"] = pblntf_ty
 
-    try:
-        res = requests.get(f"{DART_BASE_URL}/list.json", params=params, timeout=20)
-        if res.status_code != 200:
-            return []
-
-        data = res.json()
-        # "000" = 정상, "013" = 조회 결과 없음
-        if data.get("status") not in ("000", "013"):
-            return []
+    res = http_get(f"{DART_BASE_URL}/list.json", params=params)
+    if res.status_code != 200:
+        raise RuntimeError(f"DART list.json HTTP 오류: {res.status_code}")
 
-        return data.get("list") or []
+    data = res.json()
+    # "000" = 정상, "013" = 조회 결과 없음
+    status = data.get("status")
+    if status == "013":
+        return [], 0
+    if status != "000":
+        raise RuntimeError(f"DART list.json 오류: {status} {data.get('message', '')}")
 
-    except Exception:
-        return []
+    return data.get("list") or [], int(data.get("total_page") or 1)
 
 
 def _fetch_dart_document_text(rcept_no: str) -> str:
@@ -191,7 +233,7 @@ def _fetch_dart_document_text(rcept_no: str) -> str:
     }
 
     try:
-        res = requests.get(f"{DART_BASE_URL}/document.xml", params=params, timeout=20)
+        res = http_get(f"{DART_BASE_URL}/document.xml", params=params)
         if res.status_code != 200:
             return ""
 
@@ -212,6 +254,131 @@ def _fetch_dart_document_text(rcept_no: str) -> str:
         return ""
 
 
+def _iter_dart_document_text(rcept_no: str) -> Iterator[str]:
+    """
+    DART 공시 원문(document.xml)을 태그를 제거한 텍스트 조각으로 조금씩 돌려줍니다.
+
+    _fetch_dart_document_text와 달리 응답을 메모리에 통째로 올리지 않고(큰 응답은 임시 파일),
+    zip 멤버를 DOCUMENT_READ_BYTES씩 풀면서 디코딩/태그 제거를 합니다.
+    IR 분류처럼 필요한 문구만 찾으면 되는 경우, 호출 측에서 순회를 멈추면 나머지는 풀지 않습니다.
+    실패하면 아무것도 내보내지 않습니다.
+    """
+    if not DART_API_KEY or not rcept_no:
+        return
+
+    params = {
+        "crtfc_key": DART_API_KEY,
+        "rcept_no": rcept_no,
+    }
+
+    try:
+        res = http_get(f"{DART_BASE_URL}/document.xml", params=params, stream=True)
+    except Exception:
+        return
+
+    with closing(res), tempfile.SpooledTemporaryFile(max_size=DOCUMENT_SPOOL_BYTES) as body:
+        try:
+            if res.status_code != 200:
+                return
+            for block in res.iter_content(DOCUMENT_READ_BYTES):
+                body.write(block)
+            body.seek(0)
+            if not zipfile.is_zipfile(body):
+                body.seek(0)
+                yield from _iter_clean_text(body)
+                return
+            body.seek(0)
+            with zipfile.ZipFile(body) as archive:
+                for info in archive.infolist():
+                    if info.is_dir():
+                        continue
+                    with archive.open(info) as member:
+                        yield from _iter_clean_text(member)
+                    yield " "
+        except Exception:
+            return
+
+
+def _iter_clean_text(stream: IO[bytes]) -> Iterator[str]:
+    """바이트 스트림 → 디코딩 + 태그 제거된 텍스트 조각"""
+    # 인코딩은 XML 선언이 들어 있는 앞부분으로 판단합니다.
+    first = stream.read(max(DOCUMENT_READ_BYTES, _ENCODING_SNIFF_BYTES))
+    if not first:
+        return
+    decoder = codecs.getincrementaldecoder(_detect_encoding(first))(errors="ignore")
+    stripper = _MarkupStripper()
+    block = first
+    while block:
+        text = stripper.feed(decoder.decode(block))
+        if text:
+            yield text
+        block = stream.read(DOCUMENT_READ_BYTES)
+    text = stripper.feed(decoder.decode(b"", final=True)) + stripper.flush()
+    if text:
+        yield text
+
+
+def _detect_encoding(head: bytes) -> str:
+    """XML 선언의 encoding을 우선 쓰고, 없으면 첫 블록을 utf-8 → cp949 순으로 시험합니다. (_decode_bytes와 같은 순서)"""
+    declared = re.search(rb"<\?xml[^>]*encoding=[\"']([A-Za-z0-9_\-]+)", head[:200])
+    if declared:
+        name = declared.group(1).decode("ascii")
+        try:
+            return codecs.lookup(name).name
+        except LookupError:
+            pass
+    for encoding in ("utf-8", "cp949", "euc-kr"):
+        try:
+            # 블록 끝에서 잘린 멀티바이트 문자는 오류로 보지 않도록 incremental 디코더로 시험합니다.
+            codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return "utf-8"
+
+
+class _MarkupStripper:
+    """
+    _strip_markup을 조각 단위로 적용합니다.
+    닫히지 않은 태그("<..." )나 엔티티("&...")가 조각 끝에 걸리면 다음 조각과 합쳐서 처리합니다.
+    """
+
+    MAX_PENDING_CHARS = 4096
+
+    def __init__(self):
+        self._pending = ""
+
+    def feed(self, text: str) -> str:
+        buf = self._pending + text
+        cut = len(buf)
+        open_tag = buf.rfind("<")
+        if open_tag != -1 and buf.find(">", open_tag) == -1 and cut - open_tag <= self.MAX_PENDING_CHARS:
+            cut = open_tag
+        open_entity = buf.rfind("&", 0, cut)
+        if open_entity != -1 and ";" not in buf[open_entity:cut] and cut - open_entity <= 10:
+            cut = open_entity
+        self._pending = buf[cut:]
+        return self._clean(buf[:cut])
+
+    def flush(self) -> str:
+        text, self._pending = self._pending, ""
+        return self._clean(text)
+
+    @staticmethod
+    def _clean(text: str) -> str:
+        if not text:
+            return ""
+        # CDATA는 표시만 지우고 내용은 남깁니다. (_strip_markup과 같은 결과)
+        text = text.replace("<![CDATA[", " ").replace("]]>", " ")
+        text = _TAG_RE.sub(" ", text)
+        text = html.unescape(text)
+        return _WHITESPACE_RE.sub(" ", text)
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _decode_bytes(raw: bytes) -> str:
     for encoding in ("utf-8", "cp949", "euc-kr"):
         try:
@@ -233,7 +400,7 @@ def _strip_markup(text: str) -> str:
 # ==============================================================================
 
 def _get_importance(corp_name: str) -> str:
-    if any(name in corp_name for name in LARGE_CAP_NAMES):
+    if _LARGE_CAP_MATCHER.search(corp_name):
         return "very_high"
     return "high"
 
@@ -242,37 +409,51 @@ def _normalize_for_match(value: str) -> str:
     return re.sub(r"\s+", "", value or "")
 
 
-def _contains_keyword(value: str, keywords: List[str]) -> bool:
-    normalized_value = _normalize_for_match(value).lower()
-    return any(_normalize_for_match(keyword).lower() in normalized_value for keyword in keywords)
+# 공시 목록 분류용 매처는 import 시점에 한 번 만들어 둡니다. (보고서명/회사명을 한 번 훑어 분류)
+_REPORT_KEYWORD_MATCHER = KeywordMatcher(
+    EARNINGS_REPORT_KEYWORDS + IR_REPORT_KEYWORDS,
+    ignore_case=True,
+    ignore_whitespace=True,
+)
+_EARNINGS_REPORT_KEYWORD_SET = frozenset(EARNINGS_REPORT_KEYWORDS)
+_IR_REPORT_KEYWORD_SET = frozenset(IR_REPORT_KEYWORDS)
+_LARGE_CAP_MATCHER = KeywordMatcher(LARGE_CAP_NAMES)
+# 두 글자 이하 회사명("LG", "SK", "KT", "기아")은 다른 회사명에 섞여 있기 쉬워 정확히 같을 때만 인정합니다.
+_CALENDAR_COMPANY_EXACT = frozenset(
+    _normalize_for_match(name) for name in EARNINGS_CALENDAR_COMPANY_NAMES if len(_normalize_for_match(name)) <= 2
+)
+_CALENDAR_COMPANY_MATCHER = KeywordMatcher(
+    (name for name in EARNINGS_CALENDAR_COMPANY_NAMES if len(_normalize_for_match(name)) > 2),
+    ignore_whitespace=True,
+)
+_EARNINGS_IR_TEXT_KEYWORDS_NORMALIZED = tuple(
+    dict.fromkeys(_normalize_for_match(keyword).lower() for keyword in EARNINGS_IR_TEXT_KEYWORDS)
+)
+
+
+def _report_keywords(report_name: str) -> Set[str]:
+    """보고서명에 들어 있는 실적/IR 키워드를 한 번에 찾습니다."""
+    return _REPORT_KEYWORD_MATCHER.find(report_name)
 
 
-def _is_direct_earnings_report(report_name: str) -> bool:
-    return _contains_keyword(report_name, EARNINGS_REPORT_KEYWORDS) and not _contains_keyword(
-        report_name,
-        IR_REPORT_KEYWORDS,
-    )
+def _is_direct_earnings_report(report_name: str, found: Optional[Set[str]] = None) -> bool:
+    found = _report_keywords(report_name) if found is None else found
+    return not found.isdisjoint(_EARNINGS_REPORT_KEYWORD_SET) and found.isdisjoint(_IR_REPORT_KEYWORD_SET)
 
 
-def _is_ir_report(report_name: str) -> bool:
-    return _contains_keyword(report_name, IR_REPORT_KEYWORDS)
+def _is_ir_report(report_name: str, found: Optional[Set[str]] = None) -> bool:
+    found = _report_keywords(report_name) if found is None else found
+    return not found.isdisjoint(_IR_REPORT_KEYWORD_SET)
 
 
 def _is_calendar_company(corp_name: str) -> bool:
-    normalized_corp = _normalize_for_match(corp_name)
-    for name in EARNINGS_CALENDAR_COMPANY_NAMES:
-        normalized_name = _normalize_for_match(name)
-        if len(normalized_name) <= 2:
-            if normalized_corp == normalized_name:
-                return True
-            continue
-        if normalized_name in normalized_corp:
-            return True
-    return False
+    return _normalize_for_match(corp_name) in _CALENDAR_COMPANY_EXACT or _CALENDAR_COMPANY_MATCHER.search(corp_name)
 
 
 def _is_earnings_ir_text(text: str) -> bool:
-    return _contains_keyword(text, EARNINGS_IR_TEXT_KEYWORDS)
+    # 공시 원문처럼 긴 텍스트는 키워드별 부분 문자열 검색(C 구현)이 한 글자씩 도는 오토마톤보다 빠릅니다.
+    normalized_text = _normalize_for_match(text).lower()
+    return any(keyword in normalized_text for keyword in _EARNINGS_IR_TEXT_KEYWORDS_NORMALIZED)
 
 
 def _format_rcept_datetime(rcept_dt: str) -> str:
@@ -298,30 +479,44 @@ def _parse_datetime_match(match: re.Match) -> Optional[str]:
 
 
 def _extract_event_datetime_from_text(text: str) -> Optional[str]:
+    return _find_event_datetime(text)[0]
+
+
+def _find_event_datetime(text: str) -> Tuple[Optional[str], bool]:
+    """
+    (행사 일시, 확정 여부). 확정 = 가장 우선하는 라벨("개최일시")에서 찾았고 그 뒤 검사 구간이 모두 들어와 있음.
+    확정이면 뒤에 텍스트가 더 붙어도 결과가 바뀌지 않으므로 스트리밍 분류를 멈춰도 됩니다.
+    """
     normalized = re.sub(r"\s+", " ", text or "")
     if not normalized:
-        return None
+        return None, False
 
-    for corpus in (normalized, _normalize_for_match(normalized)):
-        for label in IR_EVENT_DATE_LABELS:
+    for corpus_rank, corpus in enumerate((normalized, _normalize_for_match(normalized))):
+        for label_rank, label in enumerate(IR_EVENT_DATE_LABELS):
             search_label = _normalize_for_match(label) if corpus != normalized else label
             search_from = 0
             while True:
                 idx = corpus.find(search_label, search_from)
                 if idx == -1:
                     break
-                window = corpus[idx : idx + 140]
+                window = corpus[idx : idx + _DATE_WINDOW_CHARS]
                 match = _DATE_TIME_RE.search(window)
                 if match:
                     parsed = _parse_datetime_match(match)
                     if parsed:
-                        return parsed
+                        settled = corpus_rank == 0 and label_rank == 0 and idx + _DATE_WINDOW_CHARS <= len(corpus)
+                        return parsed, settled
                 search_from = idx + len(search_label)
 
-    return None
+    return None, False
 
 
-def _to_calendar_event(item: Dict, *, event_kind: str = "result", document_text: str = "") -> Dict:
+def _to_calendar_event(
+    item: Dict,
+    *,
+    event_kind: str = "result",
+    event_datetime: Optional[str] = None,
+) -> Dict:
     """
     DART 공시 항목 → 프론트엔드 캘린더 이벤트 형식 변환.
 
@@ -345,7 +540,7 @@ def _to_calendar_event(item: Dict, *, event_kind: str = "result", document_text:
     description = title
 
     if event_kind == "ir_schedule":
-        iso_dt = _extract_event_datetime_from_text(document_text) or iso_dt
+        iso_dt = event_datetime or iso_dt
         calendar_category = "earnings_schedule"
         source_detail = "dart_ir"
         title = f"{corp_name} 실적발표"
@@ -400,11 +595,129 @@ def _dedupe_company_day_events(events: List[Dict]) -> List[Dict]:
 
 
 # ==============================================================================
-# 4. 캐시 (24시간 TTL 인메모리 캐시)
+# 4. 공시 목록 색인 동기화 + 결과 캐시
 # ==============================================================================
 
+# 계산된 캘린더 결과 캐시. 색인 갱신 주기와 같게 두어, 그 사이에는 IR 원문도 다시 받지 않습니다.
+_INDEX_REFRESH_SECONDS = settings.DART_FILING_INDEX_REFRESH_MINUTES * 60
 _cache: Dict[str, Any] = {}
-_CACHE_TTL_SECONDS = 86400  # 24시간
+_CACHE_TTL_SECONDS = _INDEX_REFRESH_SECONDS
+_index_sync_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_filing_index() -> Optional[DartFilingIndex]:
+    return open_dart_filing_index(settings.DART_FILING_INDEX_PATH)
+
+
+def _shift_de(de: str, days: int) -> str:
+    return (datetime.strptime(de, "%Y%m%d") + timedelta(days=days)).strftime("%Y%m%d")
+
+
+def _fetch_dart_range(bgn_de: str, end_de: str, pblntf_ty: str) -> List[Dict]:
+    """
+    bgn_de~end_de 구간의 공시를 모든 페이지에 걸쳐 받습니다. 한 페이지라도 실패하면 예외.
+    INDEX_SYNC_MAX_PAGES를 넘으면 구간을 반으로 나눠 받고, 하루치도 넘으면 예외를 발생시킵니다.
+    (일부만 받은 구간을 동기화했다고 기록하면 빠진 공시를 다시 받지 않기 때문)
+    """
+    first_page, total_page = _request_dart_list(bgn_de, end_de, pblntf_ty, 1, 100)
+    if total_page > INDEX_SYNC_MAX_PAGES:
+        if bgn_de == end_de:
+            raise RuntimeError(f"DART {pblntf_ty} {bgn_de} 공시가 {total_page}페이지로 한도({INDEX_SYNC_MAX_PAGES})를 넘습니다.")
+        days = (datetime.strptime(end_de, "%Y%m%d") - datetime.strptime(bgn_de, "%Y%m%d")).days
+        mid_de = _shift_de(bgn_de, days // 2)
+        return _fetch_dart_range(bgn_de, mid_de, pblntf_ty) + _fetch_dart_range(_shift_de(mid_de, 1), end_de, pblntf_ty)
+
+    items = list(first_page)
+    pages = range(2, total_page + 1)
+    if pages:
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            for page_items, _ in executor.map(
+                lambda page: _request_dart_list(bgn_de, end_de, pblntf_ty, page, 100),
+                pages,
+            ):
+                items.extend(page_items)
+    return items
+
+
+def _sync_range(
+    index: DartFilingIndex,
+    pblntf_ty: str,
+    bgn_de: str,
+    end_de: str,
+    synced_at: float,
+    *,
+    newest_first: bool,
+    max_chunks: int,
+) -> int:
+    """
+    구간을 INDEX_SYNC_CHUNK_DAYS 단위로 최대 max_chunks개 받아 색인에 넣고, 받은 만큼 동기화 구간을 넓힙니다.
+    구간을 다 받지 못하고 멈춘 경우 남은 구간 수를 반환합니다. (0이면 전부 받음)
+    """
+    chunks = []
+    chunk_start = bgn_de
+    while chunk_start <= end_de:
+        chunk_end = min(_shift_de(chunk_start, INDEX_SYNC_CHUNK_DAYS - 1), end_de)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = _shift_de(chunk_end, 1)
+    # 기존 구간 앞쪽을 채울 때는 기존 구간에 붙은 쪽부터 받아야 중간에 실패해도 구간이 끊기지 않습니다.
+    if newest_first:
+        chunks.reverse()
+    for chunk_start, chunk_end in chunks[:max_chunks]:
+        index.upsert(pblntf_ty, _fetch_dart_range(chunk_start, chunk_end, pblntf_ty))
+        index.mark_synced(pblntf_ty, chunk_start, chunk_end, synced_at)
+    return max(len(chunks) - max_chunks, 0)
+
+
+# 색인 동기화 결과
+SYNC_DONE = "done"          # 요청 구간을 모두 덮음
+SYNC_PARTIAL = "partial"    # 이번 요청의 동기화 한도에 걸려 일부 구간이 남음 (다음 요청이 이어서 받음)
+SYNC_FAILED = "failed"      # DART 요청 실패 (색인에 있는 데이터만 사용)
+
+
+def _sync_filing_index(index: DartFilingIndex, pblntf_ty: str, bgn_de: str, end_de: str) -> str:
+    """
+    색인이 bgn_de~end_de(오늘 이후는 제외)를 덮도록 빠진 접수일만 DART에서 받습니다.
+    - 처음: 오늘 쪽부터 구간 전체
+    - 이후: 마지막 동기화일~오늘 (오늘 공시는 계속 늘어나므로 갱신 주기마다 다시 받음) + 기존 구간보다 앞선 날짜
+    캘린더 요청 경로에서 불리므로 한 번에 INDEX_SYNC_MAX_CHUNKS_PER_CALL개 구간까지만 받습니다.
+    (처음 쓰는 색인이나 오래 쉰 색인은 여러 요청에 걸쳐 채워짐)
+    """
+    now = time.time()
+    end_de = min(end_de, datetime.today().strftime("%Y%m%d"))
+    if bgn_de > end_de:
+        return SYNC_DONE
+
+    with _index_sync_lock:
+        try:
+            budget = INDEX_SYNC_MAX_CHUNKS_PER_CALL
+            coverage = index.coverage(pblntf_ty)
+            if coverage is None:
+                # 최근 공시부터 받아야 한도에 걸려도 최신 일정이 먼저 보이고, 동기화 구간도 끊기지 않습니다.
+                left = _sync_range(index, pblntf_ty, bgn_de, end_de, now, newest_first=True, max_chunks=budget)
+                return SYNC_PARTIAL if left else SYNC_DONE
+
+            synced_from, synced_through, synced_at = coverage
+            left = 0
+            stale = now - synced_at >= _INDEX_REFRESH_SECONDS
+            if end_de > synced_through or (end_de == synced_through and stale):
+                left = _sync_range(index, pblntf_ty, synced_through, end_de, now, newest_first=False, max_chunks=budget)
+                budget -= min(budget, _count_chunks(synced_through, end_de))
+            if bgn_de < synced_from:
+                # 과거 구간 보충은 최신 공시 갱신과 무관하므로 synced_at을 건드리지 않습니다.
+                left += _sync_range(
+                    index, pblntf_ty, bgn_de, _shift_de(synced_from, -1), 0.0, newest_first=True, max_chunks=budget
+                )
+            return SYNC_PARTIAL if left else SYNC_DONE
+        except Exception as e:
+            print(f"[WARN] DART 공시 목록 색인 동기화 실패 ({pblntf_ty}): {e}")
+            return SYNC_FAILED
+
+
+def _count_chunks(bgn_de: str, end_de: str) -> int:
+    days = (datetime.strptime(end_de, "%Y%m%d") - datetime.strptime(bgn_de, "%Y%m%d")).days + 1
+    return -(-days // INDEX_SYNC_CHUNK_DAYS)
+
 
 def _cache_get(key: str) -> Optional[Dict]:
     entry = _cache.get(key)
@@ -419,6 +732,163 @@ def _cache_set(key: str, data: Dict) -> None:
     _cache[key] = {"ts": datetime.now(), "data": data}
 
 
+# ------------------------------------------------------------------------------
+# 기업설명회(IR) 원문 분류 메모 (rcept_no → 실적 IR 여부, 원문 행사 일시)
+# 색인이 켜져 있으면 SQLite에 저장해 재시작/다른 워커와 공유하고, 꺼져 있으면 프로세스 메모리에만 둡니다.
+# ------------------------------------------------------------------------------
+
+_ir_memo: Dict[str, IrClassification] = {}
+_ir_memo_lock = threading.Lock()
+
+
+def _load_ir_classifications(rcept_nos: List[str]) -> Dict[str, IrClassification]:
+    with _ir_memo_lock:
+        found = {rcept_no: _ir_memo[rcept_no] for rcept_no in rcept_nos if rcept_no in _ir_memo}
+    missing = [rcept_no for rcept_no in rcept_nos if rcept_no not in found]
+    index = _get_filing_index()
+    if missing and index is not None:
+        stored = index.load_ir_classifications(missing)
+        with _ir_memo_lock:
+            _ir_memo.update(stored)
+        found.update(stored)
+    return found
+
+
+def _scan_ir_document(chunks: Iterable[str]) -> Optional[IrClassification]:
+    """
+    원문 텍스트 조각을 차례로 보며 실적 IR 여부와 행사 일시를 판정합니다.
+    실적 문구와 확정된 일시를 찾으면 나머지 원문은 읽지 않고, 최대 MAX_IR_SCAN_CHARS 글자까지만 봅니다.
+    원문이 비어 있으면 None.
+    """
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        if len(text) >= MAX_IR_SCAN_CHARS:
+            text = text[:MAX_IR_SCAN_CHARS]
+            break
+        if _is_earnings_ir_text(text) and _find_event_datetime(text)[1]:
+            break
+    if not text.strip():
+        return None
+    is_earnings_ir = _is_earnings_ir_text(text)
+    return is_earnings_ir, (_extract_event_datetime_from_text(text) if is_earnings_ir else None)
+
+
+def _classify_ir_filing(rcept_no: str) -> Optional[IrClassification]:
+    """
+    IR 원문을 스트리밍으로 읽어 실적 IR 여부와 행사 일시를 판정하고 메모에 저장합니다.
+    원문을 받지 못한 경우(빈 텍스트)는 판정하지 않고 None을 반환합니다. (다음 조회에서 다시 시도)
+    """
+    # 중간에 멈추면 closing이 응답 연결과 임시 파일을 바로 정리합니다.
+    with closing(_iter_dart_document_text(rcept_no)) as chunks:
+        classification = _scan_ir_document(chunks)
+    if classification is None:
+        return None
+    with _ir_memo_lock:
+        _ir_memo[rcept_no] = classification
+    index = _get_filing_index()
+    if index is not None:
+        index.save_ir_classification(rcept_no, classification, time.time())
+    return classification
+
+
+def _classify_ir_filings(
+    rcept_nos: List[str],
+    deadline: Optional[float] = None,
+) -> Tuple[Dict[str, IrClassification], bool]:
+    """
+    여러 IR 공시 원문을 동시에 받아 분류합니다.
+    deadline(초) 안에 끝난 분류만 반환하고, 끝나지 못한 공시가 있으면 두 번째 값이 True입니다.
+    (마감 뒤에도 실행 중인 다운로드는 자체 타임아웃까지 진행되어 메모에 저장됩니다)
+    """
+    if not rcept_nos:
+        return {}, False
+    if deadline is None:
+        deadline = IR_FETCH_DEADLINE
+
+    pool = ThreadPoolExecutor(max_workers=min(IR_FETCH_WORKERS, len(rcept_nos)), thread_name_prefix="dart-ir")
+    futures = {pool.submit(_classify_ir_filing, rcept_no): rcept_no for rcept_no in rcept_nos}
+    done, not_done = wait(futures, timeout=deadline)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    results: Dict[str, IrClassification] = {}
+    for future in done:
+        try:
+            classification = future.result()
+        except Exception as e:
+            print(f"[WARN] DART IR 원문 분류 실패 ({futures[future]}): {e}")
+            continue
+        if classification is not None:
+            results[futures[future]] = classification
+    if not_done:
+        print(f"[WARN] DART IR 원문 {len(not_done)}건이 {deadline:.0f}초 안에 끝나지 않아 이번 응답에서 제외합니다.")
+    return results, bool(not_done)
+
+
+def _fetch_dart_list_pages(bgn_de: str, end_de: str, pblntf_ty: str) -> List[Dict]:
+    """색인을 쓰지 않을 때: 첫 페이지 후 2~LIST_MAX_PAGES 페이지를 병렬로 받아 페이지 순서대로 합칩니다."""
+    first_page = _fetch_dart_list(bgn_de, end_de, pblntf_ty=pblntf_ty, page_no=1, page_count=100)
+    if len(first_page) < 100:
+        return first_page
+
+    items = list(first_page)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        for page_items in executor.map(
+            lambda page: _fetch_dart_list(bgn_de, end_de, pblntf_ty, page, 100),
+            range(2, LIST_MAX_PAGES + 1),
+        ):
+            items.extend(page_items or [])
+    return items
+
+
+def _build_calendar_events(filings: List[Tuple[List[str], List[Dict]]]) -> Tuple[List[Dict], bool]:
+    """
+    공시 목록 → 캘린더 이벤트. (이벤트 목록, IR 원문 분류가 마감에 걸렸는지)
+    - 실적 공시: 바로 이벤트로 변환
+    - IR 공시: 메모에 있는 분류는 그대로 쓰고, 처음 보는 공시만 최대 MAX_IR_DETAIL_FETCHES건 동시에 원문 확인
+    """
+    direct: List[Tuple[Dict, str]] = []   # (공시, event_kind)
+    ir_items: List[Dict] = []
+
+    for keywords, items in filings:
+        for item in items:
+            report_name = item.get("report_nm", "")
+            # 보고서명은 한 번만 훑습니다. (PBLNTF_TYPES의 키워드는 실적/IR 키워드 중에서 고릅니다)
+            found = _report_keywords(report_name)
+            if found.isdisjoint(keywords):
+                continue
+            if not _is_calendar_company(item.get("corp_name", "")):
+                continue
+            if _is_direct_earnings_report(report_name, found):
+                direct.append((item, "result"))
+            elif _is_ir_report(report_name, found):
+                ir_items.append(item)
+
+    ir_rcept_nos = list(dict.fromkeys(item.get("rcept_no", "") for item in ir_items if item.get("rcept_no")))
+    known_ir = _load_ir_classifications(ir_rcept_nos)
+    unknown = [rcept_no for rcept_no in ir_rcept_nos if rcept_no not in known_ir]
+    # 상한에 걸려 이번에 분류하지 못한 공시가 있으면 마감을 넘긴 경우처럼 부분 결과로 취급합니다. (캐시하지 않음)
+    truncated = len(unknown) > MAX_IR_DETAIL_FETCHES
+    classified, timed_out = _classify_ir_filings(unknown[:MAX_IR_DETAIL_FETCHES])
+    partial = truncated or timed_out
+    known_ir.update(classified)
+
+    events: List[Dict] = [_to_calendar_event(item, event_kind=kind) for item, kind in direct]
+    for item in ir_items:
+        classification = known_ir.get(item.get("rcept_no", ""))
+        if classification is None or not classification[0]:
+            continue
+        events.append(_to_calendar_event(item, event_kind="ir_schedule", event_datetime=classification[1]))
+
+    seen_ids: set = set()
+    unique_events: List[Dict] = []
+    for ev in events:
+        if ev["datetime"] and ev["id"] not in seen_ids:
+            seen_ids.add(ev["id"])
+            unique_events.append(ev)
+    return unique_events, partial
+
+
 # ==============================================================================
 # 5. 메인 함수: 캘린더용 실적 일정 조회
 # ==============================================================================
@@ -431,8 +901,10 @@ def get_dart_calendar(days_back: int = 30, days_ahead: int = 30) -> Dict[str, An
     - I타입(거래소공시): "영업(잠정)실적(공정공시)" 계열 포착
     - 기업설명회(IR)는 원문 문서에 실적/경영실적 문구가 있을 때만 일정으로 노출
     - 일반 기업설명회(IR)는 숨김
-    - 병렬 페이지 요청으로 속도 개선
-    - 24시간 인메모리 캐시 적용
+    - 공시 목록은 로컬 색인(dart_filing_index)에서 읽고, DART에는 색인에 없는 접수일만 요청
+      (색인을 끄면 기존처럼 병렬 페이지 요청)
+    - 목록을 먼저 모은 뒤 IR 원문은 제한된 스레드 풀로 동시에 받고, 마감을 넘기면 끝난 것만 반환 (source=dart_partial)
+    - 계산된 결과는 색인 갱신 주기 동안 인메모리 캐시
     """
     if not DART_API_KEY:
         return {
@@ -452,87 +924,42 @@ def get_dart_calendar(days_back: int = 30, days_ahead: int = 30) -> Dict[str, An
     if cached:
         return cached
 
-    MAX_PAGES = 7  # 7페이지 × 100건 = 700건/타입, 병렬로 ~5-8초
-    ir_detail_fetches = 0
-
-    def _extract_events(items: List[Dict], keywords: List[str]) -> List[Dict]:
-        """items 리스트에서 키워드 매칭 항목만 이벤트로 변환해 반환 (순수 함수)."""
-        nonlocal ir_detail_fetches
-        result = []
-        for item in items:
-            report_name = item.get("report_nm", "")
-            corp_name = item.get("corp_name", "")
-
-            if not _contains_keyword(report_name, keywords):
-                continue
-
-            if _is_direct_earnings_report(report_name):
-                if not _is_calendar_company(corp_name):
-                    continue
-                ev = _to_calendar_event(item, event_kind="result")
-            elif _is_ir_report(report_name):
-                if not _is_calendar_company(corp_name):
-                    continue
-                if ir_detail_fetches >= MAX_IR_DETAIL_FETCHES:
-                    continue
-                ir_detail_fetches += 1
-                document_text = _fetch_dart_document_text(item.get("rcept_no", ""))
-                if not _is_earnings_ir_text(document_text):
-                    continue
-                ev = _to_calendar_event(
-                    item,
-                    event_kind="ir_schedule",
-                    document_text=document_text,
-                )
-            else:
-                continue
-
-            if ev["datetime"]:
-                result.append(ev)
-        return result
-
-    seen_ids: set = set()
-    events:   List[Dict] = []
+    index = _get_filing_index()
+    sync_failed = False
+    sync_partial = False
+    filings: List[Tuple[List[str], List[Dict]]] = []
 
+    # 1) 공시 목록을 먼저 모두 모읍니다. (색인 또는 list.json 페이지)
     for pblntf_ty, keywords in PBLNTF_TYPES:
-        first_page = _fetch_dart_list(bgn_de, end_de, pblntf_ty=pblntf_ty,
-                                      page_no=1, page_count=100)
-        if not first_page:
-            continue
-
-        # 첫 페이지 처리 (직렬)
-        for ev in _extract_events(first_page, keywords):
-            if ev["id"] not in seen_ids:
-                seen_ids.add(ev["id"])
-                events.append(ev)
-
-        if len(first_page) < 100:
-            continue  # 1페이지로 끝
-
-        # 2~MAX_PAGES 를 병렬로 요청
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_map = {
-                executor.submit(
-                    _fetch_dart_list, bgn_de, end_de, pblntf_ty, p, 100
-                ): p
-                for p in range(2, MAX_PAGES + 1)
-            }
-            for future in as_completed(future_map):
-                page_items = future.result() or []
-                for ev in _extract_events(page_items, keywords):
-                    if ev["id"] not in seen_ids:
-                        seen_ids.add(ev["id"])
-                        events.append(ev)
+        if index is not None:
+            sync_status = _sync_filing_index(index, pblntf_ty, bgn_de, end_de)
+            sync_failed = sync_failed or sync_status == SYNC_FAILED
+            sync_partial = sync_partial or sync_status == SYNC_PARTIAL
+            filings.append((keywords, index.query(pblntf_ty, bgn_de, end_de)))
+        else:
+            filings.append((keywords, _fetch_dart_list_pages(bgn_de, end_de, pblntf_ty)))
+
+    # 2) 실적 공시는 바로 이벤트로, IR 후보는 원문을 동시에 받아 분류한 뒤 이벤트로 변환합니다.
+    events, partial = _build_calendar_events(filings)
+    # 색인을 이번 요청 한도만큼만 채운 경우도 빠진 날짜가 있으므로 dart_partial로 돌려주고 캐시하지 않습니다.
+    partial = partial or sync_partial
 
     events = _dedupe_company_day_events(events)
     events.sort(key=lambda e: e["datetime"])
 
     result = {
         "events":     events,
-        "source":     "dart",
+        # 마감 시간 안에 IR 원문을 다 받지 못했거나 색인이 아직 덜 채워졌으면 dart_partial (다음 조회에서 이어서 채움)
+        "source":     "dart_partial" if partial else "dart",
         "fetched_at": datetime.now().isoformat(),
         "total":      len(events),
     }
+    if partial:
+        return result
+    if sync_failed:
+        # 색인에 있던 공시만으로 만든 결과이므로 캐시하지 않고 다음 요청에서 다시 동기화합니다.
+        result["error"] = "DART 공시 목록 동기화에 실패해 저장된 공시만 표시합니다."
+        return result
     _cache_set(cache_key, result)
     return result
 
@@ -0,0 +1,190 @@
+# dart_filing_index.py
+# DART 공시 목록 로컬 색인 (SQLite)
+# - list.json 결과를 rcept_no 기준으로 저장하고, 공시 유형별로 "어디부터 어디까지 받아 두었는지"(접수일 구간)를 기록합니다.
+# - 캘린더 조회는 어떤 기간이든 색인에서 읽고, DART에는 색인에 없는 날짜(보통 오늘 새로 들어온 공시)만 요청합니다.
+# - WAL 모드라 여러 워커 프로세스가 같은 파일을 함께 읽고 쓸 수 있습니다. (같은 공시를 두 번 받아도 rcept_no로 덮어씀)
+# - 기업설명회(IR) 원문 분류 결과(실적 IR 여부, 원문에서 찾은 일정)도 rcept_no별로 저장합니다. 공시 원문은 바뀌지 않으므로 한 번만 내려받습니다.
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+SCHEMA_VERSION = 2
+
+# (구간 시작 YYYYMMDD, 구간 끝 YYYYMMDD, 마지막 동기화 시각 epoch)
+SyncCoverage = Tuple[str, str, float]
+
+# (실적 관련 IR 여부, 원문에서 찾은 행사 일시 ISO 문자열 또는 None)
+IrClassification = Tuple[bool, Optional[str]]
+
+
+class DartFilingIndex:
+    """(pblntf_ty, rcept_no) 단위 공시 목록 색인"""
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def coverage(self, pblntf_ty: str) -> Optional[SyncCoverage]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT synced_from, synced_through, synced_at FROM sync_state WHERE pblntf_ty = ?",
+                (pblntf_ty,),
+            ).fetchone()
+        if row is None:
+            return None
+        return row["synced_from"], row["synced_through"], row["synced_at"]
+
+    def upsert(self, pblntf_ty: str, items: Iterable[Dict]) -> int:
+        records = [
+            (
+                item["rcept_no"],
+                pblntf_ty,
+                item.get("rcept_dt", ""),
+                item.get("corp_name", ""),
+                item.get("stock_code") or "",
+                item.get("report_nm", ""),
+                json.dumps(item, ensure_ascii=False),
+            )
+            for item in items
+            if item.get("rcept_no")
+        ]
+        if not records:
+            return 0
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO filings (rcept_no, pblntf_ty, rcept_dt, corp_name, stock_code, report_nm, raw)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(pblntf_ty, rcept_no) DO UPDATE SET
+                    rcept_dt = excluded.rcept_dt,
+                    corp_name = excluded.corp_name,
+                    stock_code = excluded.stock_code,
+                    report_nm = excluded.report_nm,
+                    raw = excluded.raw
+                """,
+                records,
+            )
+            conn.commit()
+        return len(records)
+
+    def mark_synced(self, pblntf_ty: str, bgn_de: str, end_de: str, synced_at: float) -> None:
+        """bgn_de~end_de 구간을 받아 두었다고 기록합니다. (기존 구간과 이어지는 구간만 넘겨야 합니다)"""
+        # 한 문장 upsert라 여러 워커가 동시에 기록해도 구간이 줄어들지 않습니다.
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO sync_state (pblntf_ty, synced_from, synced_through, synced_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(pblntf_ty) DO UPDATE SET
+                    synced_from = min(synced_from, excluded.synced_from),
+                    synced_through = max(synced_through, excluded.synced_through),
+                    synced_at = max(synced_at, excluded.synced_at)
+                """,
+                (pblntf_ty, bgn_de, end_de, synced_at),
+            )
+            conn.commit()
+
+    def query(self, pblntf_ty: str, bgn_de: str, end_de: str) -> List[Dict]:
+        """접수일이 bgn_de~end_de인 공시를 list.json 원본 형식 그대로, 접수일/접수번호 순으로 반환합니다."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT raw FROM filings
+                WHERE pblntf_ty = ? AND rcept_dt BETWEEN ? AND ?
+                ORDER BY rcept_dt, rcept_no
+                """,
+                (pblntf_ty, bgn_de, end_de),
+            ).fetchall()
+        return [json.loads(row["raw"]) for row in rows]
+
+    def load_ir_classifications(self, rcept_nos: Iterable[str]) -> Dict[str, IrClassification]:
+        wanted = [rcept_no for rcept_no in dict.fromkeys(rcept_nos) if rcept_no]
+        if not wanted:
+            return {}
+        found: Dict[str, IrClassification] = {}
+        with self._connect() as conn:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회합니다.
+            for start in range(0, len(wanted), 500):
+                batch = wanted[start:start + 500]
+                rows = conn.execute(
+                    f"""
+                    SELECT rcept_no, is_earnings_ir, event_datetime FROM ir_classifications
+                    WHERE rcept_no IN ({", ".join("?" for _ in batch)})
+                    """,
+                    batch,
+                ).fetchall()
+                for row in rows:
+                    found[row["rcept_no"]] = (bool(row["is_earnings_ir"]), row["event_datetime"])
+        return found
+
+    def save_ir_classification(self, rcept_no: str, classification: IrClassification, classified_at: float) -> None:
+        is_earnings_ir, event_datetime = classification
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO ir_classifications (rcept_no, is_earnings_ir, event_datetime, classified_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(rcept_no) DO UPDATE SET
+                    is_earnings_ir = excluded.is_earnings_ir,
+                    event_datetime = excluded.event_datetime,
+                    classified_at = excluded.classified_at
+                """,
+                (rcept_no, int(is_earnings_ir), event_datetime, classified_at),
+            )
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(
+                        """
+                        CREATE TABLE IF NOT EXISTS filings (
+                            rcept_no TEXT NOT NULL,
+                            pblntf_ty TEXT NOT NULL,
+                            rcept_dt TEXT NOT NULL,
+                            corp_name TEXT NOT NULL,
+                            stock_code TEXT NOT NULL,
+                            report_nm TEXT NOT NULL,
+                            raw TEXT NOT NULL,
+                            PRIMARY KEY (pblntf_ty, rcept_no)
+                        ) WITHOUT ROWID;
+                        CREATE INDEX IF NOT EXISTS filings_by_date ON filings (pblntf_ty, rcept_dt);
+                        CREATE TABLE IF NOT EXISTS sync_state (
+                            pblntf_ty TEXT PRIMARY KEY,
+                            synced_from TEXT NOT NULL,
+                            synced_through TEXT NOT NULL,
+                            synced_at REAL NOT NULL
+                        );
+                        CREATE TABLE IF NOT EXISTS ir_classifications (
+                            rcept_no TEXT PRIMARY KEY,
+                            is_earnings_ir INTEGER NOT NULL,
+                            event_datetime TEXT,
+                            classified_at REAL NOT NULL
+                        );
+                        """
+                    )
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+
+def open_dart_filing_index(path: Optional[str]) -> Optional[DartFilingIndex]:
+    """path 위치에 색인을 만듭니다. 빈 값이면 색인을 쓰지 않습니다(None)."""
+    if not path or not path.strip():
+        return None
+    index_path = Path(path.strip())
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    return DartFilingIndex(index_path)
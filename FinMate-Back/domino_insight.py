@@ -12,6 +12,8 @@ from bot import client
 from ecos import get_policy_rate_last_n, get_kospi_last_n
 from config import settings
 from llm_guardrails import build_prompt_reminder, ensure_safe_llm_text
+from llm_cache import cached_llm_text
+from llm_gateway import Priority, run_llm
 
 # 도미노 분석에 사용할 Gemini 모델 (예: gemini-2.0-flash)
 GEMINI_MODEL_FOR_DOMINO = settings.GEMINI_MODEL_DEFAULT
@@ -138,14 +140,25 @@ def get_domino_insight(n: int = 6) -> Dict[str, Any]:
     # -----------------------------------------------------------
     # STEP 3: Gemini API 호출 및 결과 반환
     # -----------------------------------------------------------
+    def _generate() -> str:
+        response = run_llm(
+            lambda: client.models.generate_content(
+                model=GEMINI_MODEL_FOR_DOMINO,
+                contents=prompt,
+            ),
+            priority=Priority.USER,
+        )
+        return ensure_safe_llm_text(response.text, "domino_insight")
+
     try:
-        response = client.models.generate_content(
+        # 시계열이 바뀌지 않았으면(같은 프롬프트) 캐시된 분석을 재사용
+        insight = cached_llm_text(
+            "domino_insight",
             model=GEMINI_MODEL_FOR_DOMINO,
-            contents=prompt,
+            prompt=prompt,
+            generate=_generate,
         )
         
-        insight = ensure_safe_llm_text(response.text, "domino_insight")
-        
         # 빈 응답이 올 경우에 대한 방어 코드
         if not insight:
             return {"error": "Gemini로부터 유효한 응답을 받지 못했습니다."}
@@ -3,15 +3,19 @@
 # ==============================================================================
 # [필수 라이브러리 및 모듈 임포트]
 # ==============================================================================
-import requests
 import urllib.parse
 from collections import defaultdict
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import calendar
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from config import settings  # 환경 설정 (ECOS API Key 등)
+from http_client import http_get  # 호스트별 공유 세션(keep-alive, 재시도)
+from ecos_cache import EcosStatisticCache  # 시계열 단위 TTL 캐시
+from ecos_monthly_store import MonthlyAggregateStore, open_monthly_aggregate_store  # 월별 집계 저장소
 
 # ==============================================================================
 # 1. 한국은행 ECOS API 설정
@@ -28,6 +32,7 @@ ECOS_BASE_URL = "http://ecos.bok.or.kr/api"
 def get_ecos_statistic(stat_code: str, cycle: str, start: str, end: str, item_code: str = "") -> Union[List[Dict], Dict]:
     """
     한국은행 ECOS 통계 조회 API를 호출하는 범용 함수입니다.
+    같은 시계열의 겹치는 구간은 캐시(_statistic_cache)에서 응답하고, 비어 있는 구간만 API로 조회합니다.
     
     Args:
         stat_code (str): 통계표 코드 (예: '722Y001' 기준금리)
@@ -45,6 +50,17 @@ def get_ecos_statistic(stat_code: str, cycle: str, start: str, end: str, item_co
     if not ECOS_AUTH_KEY:
         return {"error": "ECOS_AUTH_KEY가 설정되지 않았습니다."}
 
+    return _statistic_cache.get(stat_code, cycle, start, end, item_code)
+
+
+def get_ecos_cache_stats() -> Dict[str, Any]:
+    """ECOS 통계 캐시의 적중/미스 카운터를 반환합니다."""
+    return _statistic_cache.stats()
+
+
+def _fetch_ecos_statistic(stat_code: str, cycle: str, start: str, end: str, item_code: str = "") -> Union[List[Dict], Dict]:
+    """캐시를 거치지 않고 ECOS StatisticSearch API를 직접 호출합니다."""
+
     # URL 조립 (요청 인자 순서: 인증키/요청타입/언어/요청시작건수/요청종료건수/통계코드/주기/시작일/종료일/항목코드)
     url = (
         f"{ECOS_BASE_URL}/StatisticSearch/"
@@ -53,7 +69,7 @@ def get_ecos_statistic(stat_code: str, cycle: str, start: str, end: str, item_co
     )
 
     try:
-        res = requests.get(url, timeout=10)
+        res = http_get(url)
         
         # HTTP 통신 에러 체크
         if res.status_code != 200:
@@ -80,32 +96,53 @@ def get_ecos_statistic(stat_code: str, cycle: str, start: str, end: str, item_co
         return {"error": f"API 호출 오류: {str(e)}"}
 
 
+_statistic_cache = EcosStatisticCache(_fetch_ecos_statistic)
+
+
 def search_ecos_glossary_term(term: str) -> Dict[str, str]:
     """
     경제 용어 사전(Glossary) 검색 함수
     사용자가 입력한 용어에 대한 한국은행 공식 설명을 찾아줍니다.
     """
+    rows = search_ecos_glossary_rows(term)
+    if isinstance(rows, dict):
+        return rows
+
+    # 검색 결과가 하나 이상 있을 때 첫 번째 결과를 반환
+    if rows:
+        return {"용어": rows[0].get('WORD'), "용어설명": rows[0].get('CONTENT')}
+
+    return {"message": f"'{term}' 검색 결과 없음"}
+
+
+def search_ecos_glossary_rows(term: str, limit: int = 10) -> Union[List[Dict], Dict]:
+    """
+    경제 용어 사전 검색 결과(WORD, CONTENT 행)를 최대 limit개까지 그대로 반환합니다.
+    (glossary_index.py 가 로컬 용어 색인을 만들 때도 사용)
+    """
     if not ECOS_AUTH_KEY:
         return {"error": "ECOS_AUTH_KEY가 필요합니다."}
 
     # URL 인코딩 (한글 검색어 처리)
     encoded_term = urllib.parse.quote(term, encoding='utf-8')
-    url_path = f"StatisticWord/{ECOS_AUTH_KEY}/json/kr/1/10/{encoded_term}"
+    url_path = f"StatisticWord/{ECOS_AUTH_KEY}/json/kr/1/{limit}/{encoded_term}"
     request_url = f"{ECOS_BASE_URL}/{url_path}"
     
     try:
-        response = requests.get(request_url, timeout=10)
+        response = http_get(request_url)
         if response.status_code != 200:
             return {"error": f"HTTP 오류: {response.status_code}"}
             
         data = response.json()
         
-        # 검색 결과가 하나 이상 있을 때 첫 번째 결과를 반환
         if 'StatisticWord' in data and data['StatisticWord']['list_total_count'] > 0:
-            row = data['StatisticWord']['row'][0]
-            return {"용어": row.get('WORD'), "용어설명": row.get('CONTENT')}
-        
-        return {"message": f"'{term}' 검색 결과 없음"}
+            return data['StatisticWord']['row']
+
+        # INFO-200(검색 결과 없음)이 아닌 RESULT는 인증키 오류 등 실제 API 오류
+        if "RESULT" in data and data["RESULT"].get("CODE") != "INFO-200":
+            return {"error": data["RESULT"].get("MESSAGE"), "code": data["RESULT"].get("CODE")}
+
+        return []
 
     except Exception as e:
         return {"error": f"오류: {str(e)}"}
@@ -152,57 +189,110 @@ def get_policy_rate_last_n(n: int = 6) -> Union[List[Dict], Dict]:
 
 def get_kospi_last_n(n: int = 6) -> Union[List[Dict], Dict]:
     """
-    KOSPI 월평균 지수 조회 (최근 N개월)
+    KOSPI 월평균 지수 조회 (최근 N개월, 지난달까지)
     ECOS는 KOSPI '월평균' 데이터를 바로 주지 않는 경우가 있어, '일별' 데이터를 가져와 직접 평균을 냅니다.
+    마감된 달의 평균은 월별 집계 저장소에서 재사용하므로 N이 커도(24, 60개월) 빠진 달만 ECOS에서 받습니다.
     """
-    today = datetime.today()
-    
-    # 1. 기준점: 지난달
-    last_month_date = today - relativedelta(months=1)
-    
-    # 2. 종료일 계산: 지난달의 마지막 날짜 (예: 11월 -> 11월 30일)
-    last_day = calendar.monthrange(last_month_date.year, last_month_date.month)[1]
-    
-    end_dt = last_month_date.replace(day=last_day)
-    end_str = end_dt.strftime("%Y%m%d")
-    
-    # 3. 시작일 계산: 넉넉하게 잡음
-    start_dt = last_month_date - relativedelta(months=n+2)
-    start_str = start_dt.strftime("%Y%m%d")
+    try:
+        averages = _kospi_monthly_averages(n)
+    except ValueError as e:
+        return {"error": str(e)}
 
-    # API 호출 (코드: 802Y001=주식시장, 주기: D=일별, 항목: 0001000=KOSPI)
-    rows = get_ecos_statistic("802Y001", "D", start_str, end_str, "0001000")
+    # 시간순 (과거 -> 최신, 가장 최근 월이 마지막)
+    return [
+        {
+            "TIME": month_key,
+            "DATA_VALUE": f"{avg_value:.2f}",
+            "UNIT_NAME": "월평균 KOSPI 지수"
+        }
+        for month_key, avg_value in averages.items()
+    ]
 
-    if isinstance(rows, dict) and "error" in rows:
-        return rows
 
-    # [데이터 가공] 일별 데이터 -> 월별 평균 계산
-    monthly_data = defaultdict(lambda: {"total": 0.0, "count": 0})
+# ------------------------------------------------------------------------------
+# [월별 집계] KOSPI 일별 -> 월평균 (마감된 달은 저장소에 한 번만 계산해 둠)
+# ------------------------------------------------------------------------------
+
+KOSPI_MONTHLY_SERIES = "802Y001/D/0001000"
+MONTH_SETTLE_DAYS = 3          # 월말 후 이 일수가 지나야 마감된 달로 보고 저장 (늦게 반영되는 마지막 영업일 대비)
+MAX_DAILY_FETCH_MONTHS = 18    # ECOS 1회 조회 500건 제한: 영업일 약 21일 x 18개월 ≈ 380건
+
+
+@lru_cache(maxsize=1)
+def _get_monthly_store() -> Optional[MonthlyAggregateStore]:
+    return open_monthly_aggregate_store(settings.ECOS_MONTHLY_STORE_PATH)
+
+
+def _kospi_monthly_averages(n: int, today=None) -> Dict[str, float]:
+    """
+    지난달까지 최근 n개월의 {YYYYMM: KOSPI 월평균}을 시간순으로 반환합니다. (데이터가 없는 달은 제외)
+    ECOS 조회 실패 시 ValueError를 발생시킵니다.
+    """
+    today = today or datetime.today().date()
+    months = _recent_months(today, n)
+    store = _get_monthly_store()
+    aggregates = store.load(KOSPI_MONTHLY_SERIES, months) if store else {}
+
+    # 저장소에 없는 달만 연속 구간으로 묶어 일별 데이터를 받습니다.
+    missing = [m for m in months if m not in aggregates]
+    for chunk in _contiguous_month_runs(missing, MAX_DAILY_FETCH_MONTHS):
+        last_day = calendar.monthrange(int(chunk[-1][:4]), int(chunk[-1][4:]))[1]
+        rows = get_ecos_statistic("802Y001", "D", f"{chunk[0]}01", f"{chunk[-1]}{last_day:02d}", "0001000")
+        if isinstance(rows, dict) and "error" in rows:
+            raise ValueError(rows["error"])
+
+        fetched = {m: agg for m, agg in _fold_daily_rows(rows).items() if m in chunk}
+        aggregates.update(fetched)
+        closed = {m: agg for m, agg in fetched.items() if _is_closed_month(m, today)}
+        if store and closed:
+            store.save(KOSPI_MONTHLY_SERIES, closed)
+
+    return {
+        m: aggregates[m][0] / aggregates[m][1]
+        for m in months
+        if m in aggregates and aggregates[m][1] > 0
+    }
+
+
+def _fold_daily_rows(rows: List[Dict]) -> Dict[str, Tuple[float, int]]:
+    """일별 행을 월별 (합계, 일수)로 접습니다."""
+    monthly_data = defaultdict(lambda: [0.0, 0])
     for row in rows:
-        time_str = row["TIME"]
-        month_key = time_str[:6] # YYYYMM 추출
+        month_key = str(row.get("TIME", ""))[:6]  # YYYYMM 추출
         try:
             value = float(row["DATA_VALUE"])
-            monthly_data[month_key]["total"] += value
-            monthly_data[month_key]["count"] += 1
-        except (ValueError, TypeError):
+        except (KeyError, ValueError, TypeError):
             continue
+        monthly_data[month_key][0] += value
+        monthly_data[month_key][1] += 1
+    return {m: (total, count) for m, (total, count) in monthly_data.items()}
 
-    result_list = []
-    for month_key, data in monthly_data.items():
-        if data["count"] > 0:
-            avg_value = data["total"] / data["count"]
-            result_list.append({
-                "TIME": month_key,
-                "DATA_VALUE": f"{avg_value:.2f}",
-                "UNIT_NAME": "월평균 KOSPI 지수"
-            })
-    
-    # 시간순 정렬 (과거 -> 최신)
-    result_sorted = sorted(result_list, key=lambda r: r["TIME"])
-    
-    # 뒤에서 N개 자르기 (가장 최근 월이 마지막에 오도록)
-    return result_sorted[-n:] if len(result_sorted) > n else result_sorted
+
+def _recent_months(today, n: int) -> List[str]:
+    """지난달을 마지막으로 하는 최근 n개월 (YYYYMM, 과거 -> 최신)"""
+    last_month = today.replace(day=1) - relativedelta(months=1)
+    return [(last_month - relativedelta(months=i)).strftime("%Y%m") for i in range(max(n, 0) - 1, -1, -1)]
+
+
+def _contiguous_month_runs(months: List[str], max_len: int) -> List[List[str]]:
+    runs: List[List[str]] = []
+    for month in months:
+        if runs and len(runs[-1]) < max_len and _next_month(runs[-1][-1]) == month:
+            runs[-1].append(month)
+        else:
+            runs.append([month])
+    return runs
+
+
+def _next_month(month: str) -> str:
+    index = int(month[:4]) * 12 + int(month[4:])  # 다음 달의 0-based 인덱스
+    return f"{index // 12:04d}{index % 12 + 1:02d}"
+
+
+def _is_closed_month(month: str, today) -> bool:
+    last_day = calendar.monthrange(int(month[:4]), int(month[4:]))[1]
+    month_end = datetime(int(month[:4]), int(month[4:]), last_day).date()
+    return (today - month_end).days > MONTH_SETTLE_DAYS
 
 
 # ==============================================================================
@@ -214,8 +304,12 @@ def get_last_one() -> Dict[str, Any]:
     대시보드 상단 '시장 날씨' 배너에 표시할 주요 4대 지표의 최신 데이터를 가져옵니다.
     (KOSPI, KOSDAQ, 환율, 국고채)
     
+    4개 지표는 동시에 조회하므로 전체 지연은 가장 느린 ECOS 호출 하나 수준입니다.
+    일부 지표만 실패하면 해당 지표는 "-"로 표시하고 실패 사유를 errors에 담아 반환합니다.
+    (모든 지표가 실패한 경우에만 {"error": ...}를 반환)
+
     Returns:
-        { "indices": [ {name, value, change}, ... ] }
+        { "indices": [ {name, value, change}, ... ], "errors": {asset_key: message} }
     """
     today = datetime.today()
     # 최근 데이터를 찾기 위해 2주 전부터 조회 (공휴일, 주말 고려)
@@ -232,13 +326,28 @@ def get_last_one() -> Dict[str, Any]:
         "bond":   ("817Y002", "010200000")   # 국고채 3년 금리
     }
     
+    # 4개 통계를 동시에 요청 (각 호출은 http_client의 공유 세션/타임아웃을 사용)
+    with ThreadPoolExecutor(max_workers=len(assets), thread_name_prefix="ecos-last-one") as pool:
+        futures = {
+            key: pool.submit(get_ecos_statistic, code, "D", start_str, end_str, item)
+            for key, (code, item) in assets.items()
+        }
+
     results = {}
-    for key, (code, item) in assets.items():
-        rows = get_ecos_statistic(code, "D", start_str, end_str, item)
+    errors = {}
+    for key, future in futures.items():
+        try:
+            rows = future.result()
+        except Exception as e:
+            rows = {"error": f"API 호출 오류: {str(e)}"}
         if isinstance(rows, dict) and "error" in rows:
-            return {"error": f"{key} 오류: {rows['error']}"}
+            errors[key] = f"{key} 오류: {rows['error']}"
+            rows = []
         results[key] = rows
 
+    if len(errors) == len(assets):
+        return {"error": "; ".join(errors.values())}
+
     # [내부 함수] 데이터 리스트에서 가장 최신 값(오늘/전일)과 그 전날 값을 추출
     def process_asset_data(rows: List[Dict]) -> Dict[str, Any]:
         if not rows: return {"val": None, "prev": None}
@@ -261,6 +370,7 @@ def get_last_one() -> Dict[str, Any]:
     
     # 프론트엔드 포맷에 맞춰 리스트 생성
     return {
+        "errors": errors,
         "indices": [
             {
                 "name": "KOSPI",
@@ -299,16 +409,16 @@ def get_macro_points(n: int = 6) -> Any:
     try:
         # 위에서 정의한 함수들을 호출하여 데이터를 가져옵니다.
         rate_rows = get_policy_rate_last_n(n)
-        kospi_rows = get_kospi_last_n(n)
+        # KOSPI 월평균은 {YYYYMM: 값} 형태로 받아 기준금리 월과 바로 매칭합니다.
+        kospi_by_month = _kospi_monthly_averages(n)
+    except ValueError as e:
+        # ECOS 조회 오류 메시지는 그대로 전달
+        return {"error": str(e)}
     except Exception as e:
         return {"error": f"데이터 조회 오류: {e}"}
 
     # 에러 체크
     if isinstance(rate_rows, dict) and "error" in rate_rows: return rate_rows
-    if isinstance(kospi_rows, dict) and "error" in kospi_rows: return kospi_rows
-
-    # 매핑을 위해 KOSPI 데이터를 {날짜: 값} 형태의 딕셔너리로 변환
-    kospi_map = {r["TIME"]: float(r["DATA_VALUE"]) for r in kospi_rows if "DATA_VALUE" in r}
 
     points = []
     # 기준금리 데이터를 기준으로 순회하며 KOSPI 값을 매칭
@@ -327,7 +437,7 @@ def get_macro_points(n: int = 6) -> Any:
         points.append({
             "date": formatted_date,         # X축 라벨
             "rate": rate_val,               # Y1축 (금리)
-            "stock": kospi_map.get(time_key)# Y2축 (주가)
+            "stock": round(kospi_by_month[time_key], 2) if time_key in kospi_by_month else None,  # Y2축 (주가)
         })
     
     # 반환 순서: 과거(왼쪽) -> 최신(오른쪽)
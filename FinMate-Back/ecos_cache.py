@@ -0,0 +1,193 @@
+# ecos_cache.py
+# ECOS 통계 조회 캐시
+# - (통계코드, 주기, 항목코드) 시계열마다 관측값(TIME -> row)을 모아 두고 요청 구간을 이 값들로 응답합니다.
+# - 요청 구간 중 이미 받아 둔 구간은 재사용하고, 비어 있거나 만료된 구간(gap)만 ECOS에 요청합니다.
+#   (예: 14일치 배너 조회와 8개월치 KOSPI 조회가 겹치면 겹친 날짜는 한 번만 받습니다)
+# - 주기별 TTL: 일별(D)은 최근 구간만 짧게, 확정된 과거 구간과 월/분기/연(M/Q/Y)은 길게 유지합니다.
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+Rows = List[Dict[str, Any]]
+Fetcher = Callable[[str, str, str, str, str], Union[Rows, Dict[str, Any]]]
+
+# ==============================================================================
+# 1. 주기별 TTL 설정
+# ==============================================================================
+
+DAILY_RECENT_TTL_SECONDS = 3600          # 일별 최근 구간: 당일 값이 추가/수정될 수 있어 1시간
+DAILY_SETTLED_DAYS = 7                   # 이보다 오래된 일별 값은 확정된 것으로 보고 길게 캐시
+SETTLED_TTL_SECONDS = {
+    "D": 86400,                          # 확정된 일별 구간: 1일
+    "M": 86400,                          # 월: 1일
+    "Q": 7 * 86400,                      # 분기: 7일
+    "Y": 7 * 86400,                      # 연: 7일
+}
+
+# get_ecos_statistic 한 번에 받는 최대 건수 (1/500). 이만큼 꽉 찬 응답은 잘렸을 수 있어 구간을 캐시하지 않습니다.
+ECOS_PAGE_SIZE = 500
+
+_PERIOD_PATTERNS = {
+    "D": re.compile(r"^\d{8}$"),
+    "M": re.compile(r"^\d{6}$"),
+    "Q": re.compile(r"^\d{4}Q[1-4]$"),
+    "Y": re.compile(r"^\d{4}$"),
+}
+
+
+# ==============================================================================
+# 2. 시계열 저장 구조
+# ==============================================================================
+
+@dataclass
+class _Coverage:
+    start: str
+    end: str
+    expires_at: float
+
+
+@dataclass
+class _Series:
+    points: Dict[str, Dict[str, Any]] = field(default_factory=dict)   # TIME -> ECOS row
+    coverage: List[_Coverage] = field(default_factory=list)           # ECOS에서 받아 둔 구간
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class EcosStatisticCache:
+    """
+    get_ecos_statistic 결과를 시계열 단위로 캐시합니다.
+    에러 응답은 캐시하지 않으며, 지원하지 않는 주기나 형식의 날짜는 캐시를 거치지 않고 바로 조회합니다.
+    """
+
+    def __init__(
+        self,
+        fetch: Fetcher,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = date.today,
+    ):
+        self._fetch = fetch
+        self._clock = clock
+        self._today = today
+        self._series: Dict[Tuple[str, str, str], _Series] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "partial_hits": 0, "misses": 0, "bypassed": 0, "upstream_calls": 0}
+
+    def get(self, stat_code: str, cycle: str, start: str, end: str, item_code: str = "") -> Union[Rows, Dict[str, Any]]:
+        pattern = _PERIOD_PATTERNS.get(cycle)
+        if pattern is None or not pattern.match(start) or not pattern.match(end) or start > end:
+            self._count("bypassed")
+            self._count("upstream_calls")
+            return self._fetch(stat_code, cycle, start, end, item_code)
+
+        series = self._get_series((stat_code, cycle, item_code))
+        # 같은 시계열은 한 번에 하나만 갱신하므로 동시에 들어온 같은 요청은 먼저 받은 결과를 재사용합니다.
+        with series.lock:
+            now = self._clock()
+            series.coverage = [c for c in series.coverage if c.expires_at > now]
+            gaps = _find_gaps(series.coverage, start, end, cycle)
+
+            for gap_start, gap_end in gaps:
+                self._count("upstream_calls")
+                rows = self._fetch(stat_code, cycle, gap_start, gap_end, item_code)
+                if isinstance(rows, dict):
+                    self._count("misses")
+                    return rows
+                for time_key in [k for k in series.points if gap_start <= k <= gap_end]:
+                    del series.points[time_key]
+                for row in rows:
+                    time_key = row.get("TIME")
+                    if isinstance(time_key, str):
+                        series.points[time_key] = row
+                if len(rows) < ECOS_PAGE_SIZE:
+                    series.coverage.extend(self._coverage_for(cycle, gap_start, gap_end, now))
+
+            if not gaps:
+                self._count("hits")
+            elif gaps == [(start, end)]:
+                self._count("misses")
+            else:
+                self._count("partial_hits")
+
+            # 호출부가 행을 수정해도 캐시가 오염되지 않도록 복사본을 돌려줍니다.
+            return [dict(series.points[k]) for k in sorted(series.points) if start <= k <= end]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["series"] = len(self._series)
+        served = stats["hits"] + stats["partial_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["partial_hits"]) / served, 3) if served else 0.0
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def _get_series(self, key: Tuple[str, str, str]) -> _Series:
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            return series
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _coverage_for(self, cycle: str, start: str, end: str, now: float) -> List[_Coverage]:
+        settled_ttl = SETTLED_TTL_SECONDS[cycle]
+        if cycle != "D":
+            return [_Coverage(start, end, now + settled_ttl)]
+
+        # 일별은 확정된 과거 구간과 최근 구간의 TTL을 나눕니다.
+        cutoff = (self._today() - timedelta(days=DAILY_SETTLED_DAYS)).strftime("%Y%m%d")
+        if end <= cutoff:
+            return [_Coverage(start, end, now + settled_ttl)]
+        if start > cutoff:
+            return [_Coverage(start, end, now + DAILY_RECENT_TTL_SECONDS)]
+        return [
+            _Coverage(start, cutoff, now + settled_ttl),
+            _Coverage(_shift_period(cutoff, cycle, 1), end, now + DAILY_RECENT_TTL_SECONDS),
+        ]
+
+
+# ==============================================================================
+# 3. 구간 계산 유틸리티
+# ==============================================================================
+
+def _find_gaps(coverage: List[_Coverage], start: str, end: str, cycle: str) -> List[Tuple[str, str]]:
+    """[start, end] 중 coverage로 덮이지 않은 구간들을 시간순으로 반환합니다."""
+    gaps: List[Tuple[str, str]] = []
+    cursor = start
+    for covered in sorted(coverage, key=lambda c: c.start):
+        if covered.end < cursor:
+            continue
+        if covered.start > end:
+            break
+        if covered.start > cursor:
+            gaps.append((cursor, _shift_period(covered.start, cycle, -1)))
+        if covered.end >= end:
+            return gaps
+        cursor = _shift_period(covered.end, cycle, 1)
+    gaps.append((cursor, end))
+    return gaps
+
+
+def _shift_period(period: str, cycle: str, step: int) -> str:
+    """ECOS 기간 문자열을 주기 단위로 step만큼 이동합니다. (D: YYYYMMDD, M: YYYYMM, Q: YYYYQn, Y: YYYY)"""
+    if cycle == "D":
+        return (datetime.strptime(period, "%Y%m%d") + timedelta(days=step)).strftime("%Y%m%d")
+    if cycle == "M":
+        index = int(period[:4]) * 12 + int(period[4:6]) - 1 + step
+        return f"{index // 12:04d}{index % 12 + 1:02d}"
+    if cycle == "Q":
+        index = int(period[:4]) * 4 + int(period[5]) - 1 + step
+        return f"{index // 4:04d}Q{index % 4 + 1}"
+    return f"{int(period) + step:04d}"
@@ -0,0 +1,94 @@
+# ecos_monthly_store.py
+# ECOS 일별 시계열의 월별 집계(합계, 일수) 저장소 (SQLite)
+# - 마감된 달의 월평균은 한 번 계산해 저장하고 다시 계산하지 않습니다.
+# - 도미노 차트(get_kospi_last_n, get_macro_points)는 저장된 달은 그대로 쓰고, 빠진 달의 일별 데이터만 ECOS에서 받습니다.
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+SCHEMA_VERSION = 1
+
+# month(YYYYMM) -> (일별 값 합계, 일수)
+MonthlyAggregates = Dict[str, Tuple[float, int]]
+
+
+class MonthlyAggregateStore:
+    """(series_key, YYYYMM) 단위 월별 합계/일수 저장소"""
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self, series_key: str, months: Iterable[str]) -> MonthlyAggregates:
+        months = list(months)
+        if not months:
+            return {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT month, total, day_count
+                FROM monthly_aggregates
+                WHERE series_key = ? AND month BETWEEN ? AND ?
+                """,
+                (series_key, min(months), max(months)),
+            ).fetchall()
+        wanted = set(months)
+        return {row["month"]: (row["total"], row["day_count"]) for row in rows if row["month"] in wanted}
+
+    def save(self, series_key: str, aggregates: MonthlyAggregates) -> int:
+        records = [
+            (series_key, month, total, count)
+            for month, (total, count) in aggregates.items()
+            if count > 0
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO monthly_aggregates (series_key, month, total, day_count)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(series_key, month) DO UPDATE SET
+                    total = excluded.total,
+                    day_count = excluded.day_count
+                """,
+                records,
+            )
+            conn.commit()
+        return len(records)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(
+                        """
+                        CREATE TABLE IF NOT EXISTS monthly_aggregates (
+                            series_key TEXT NOT NULL,
+                            month TEXT NOT NULL,
+                            total REAL NOT NULL,
+                            day_count INTEGER NOT NULL,
+                            PRIMARY KEY (series_key, month)
+                        ) WITHOUT ROWID;
+                        """
+                    )
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+
+def open_monthly_aggregate_store(path: Optional[str]) -> Optional[MonthlyAggregateStore]:
+    """path 위치에 저장소를 만듭니다. 빈 값이면 저장하지 않습니다(None)."""
+    if not path or not path.strip():
+        return None
+    store_path = Path(path.strip())
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    return MonthlyAggregateStore(store_path)
@@ -0,0 +1,354 @@
+# glossary_index.py
+# 챗봇용 ECOS 경제 용어 로컬 색인
+# - ECOS 용어 사전(StatisticWord)에서 한 번 받아 온 용어를 정규화해 트라이(trie)에 넣고 JSON 파일로 저장합니다.
+# - /api/chat 은 이 색인으로 메시지가 "용어 질문"인지 바로 판단하고, 일반 문장은 ECOS 호출 없이 Gemini로 넘깁니다.
+# - 색인에 없는 짧은 검색어만 ECOS에 실시간으로 물어보고, 결과(없음 포함)를 색인에 학습합니다.
+# - 백그라운드 갱신 스레드가 시드 용어와 학습된 검색어의 정의를 주기적으로 다시 받아 색인을 갱신합니다.
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# ==============================================================================
+# 1. 설정 및 정규화
+# ==============================================================================
+
+MAX_LIVE_QUERY_LENGTH = 20        # 색인에 없을 때 ECOS 실시간 검색을 시도할 최대 길이 (정규화 기준)
+MAX_LIVE_QUERY_WORDS = 3          # 이보다 단어가 많으면 문장으로 보고 ECOS를 호출하지 않음
+MISS_TTL_SECONDS = 86400          # ECOS에도 없던 검색어는 하루 동안 다시 조회하지 않음
+MAX_LEARNED_QUERIES = 500         # 학습해 두고 갱신 때마다 다시 받는 실시간 검색어 수 (오래 안 쓴 것부터 버림)
+MAX_MISSES = 2000                 # 기억해 두는 "ECOS에도 없던 검색어" 수 (오래된 것부터 버림)
+DEFAULT_REFRESH_SECONDS = 7 * 86400
+
+SEED_TERMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ecos_glossary_seed.json")
+
+# 용어 뒤에 붙어도 "용어 질문"으로 보는 표현 (정규화된 형태로 비교)
+QUESTION_SUFFIXES = frozenset({
+    "", "란", "이란", "은", "는", "뜻", "의뜻", "의미", "의의미",
+    "뭐야", "이뭐야", "가뭐야", "은뭐야", "는뭐야", "란뭐야", "이란뭐야",
+    "무엇인가요", "이란무엇인가요", "란무엇인가요", "은무엇인가요", "는무엇인가요", "이무엇인가요", "가무엇인가요",
+    "설명", "설명해줘", "알려줘", "뜻알려줘", "에대해알려줘", "에대해설명해줘",
+})
+
+_STRIP_RE = re.compile(r"[\W_]+", re.UNICODE)
+_END = "\0"  # 트라이 노드에서 용어가 끝나는 지점 표시
+
+
+def normalize_term(text: str) -> str:
+    """전각/반각 통일(NFKC), 소문자화, 공백·문장부호 제거"""
+    return _STRIP_RE.sub("", unicodedata.normalize("NFKC", text or "")).lower()
+
+
+# ==============================================================================
+# 2. 용어 트라이
+# ==============================================================================
+
+class GlossaryIndex:
+    """
+    정규화된 용어(key) -> (용어, 설명) 트라이
+    match()는 메시지 길이만큼 한 번만 내려가므로 용어 수와 관계없이 수 μs 안에 끝납니다.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]] = ()):
+        self._root: Dict[str, Any] = {}
+        self._entries: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        for key, word, content in entries:
+            self.add(key, word, content)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, key: str, word: str, content: str) -> bool:
+        key = normalize_term(key)
+        if not key or not word or not content:
+            return False
+        with self._lock:
+            node = self._root
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[_END] = (word, content)
+            self._entries[key] = (word, content)
+        return True
+
+    def match(self, message: str) -> Optional[Tuple[str, str]]:
+        """메시지가 '용어 (+ 질문 표현)' 형태이면 가장 긴 용어의 (용어, 설명)을 반환합니다."""
+        text = normalize_term(message)
+        node = self._root
+        found: List[Tuple[int, Tuple[str, str]]] = []
+        for position, ch in enumerate(text):
+            node = node.get(ch)
+            if node is None:
+                break
+            if _END in node:
+                found.append((position + 1, node[_END]))
+        for end, entry in reversed(found):
+            if text[end:] in QUESTION_SUFFIXES:
+                return entry
+        return None
+
+    def entries(self) -> List[Dict[str, str]]:
+        with self._lock:
+            return [
+                {"key": key, "word": word, "content": content}
+                for key, (word, content) in sorted(self._entries.items())
+            ]
+
+
+# ==============================================================================
+# 3. 색인 관리 (조회 / 학습 / 저장 / 백그라운드 갱신)
+# ==============================================================================
+
+class EcosGlossary:
+    """
+    로컬 색인 우선 조회 + ECOS 실시간 검색 학습 + 주기적 갱신을 묶은 용어 사전
+
+    search: 검색어 -> ECOS StatisticWord 행 목록(WORD, CONTENT) 또는 {"error": ...}
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        search: Callable[[str], Union[List[Dict], Dict]],
+        seed_terms: Iterable[str] = (),
+        refresh_seconds: int = DEFAULT_REFRESH_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._path = path
+        self._search = search
+        self._seed_terms = tuple(dict.fromkeys(term.strip() for term in seed_terms if term.strip()))
+        self._refresh_seconds = max(refresh_seconds, 60)
+        self._clock = clock
+        self._index = GlossaryIndex()
+        # 조회 스레드와 갱신 스레드가 함께 쓰므로 _state_lock 안에서만 읽고 씁니다.
+        self._queries: "OrderedDict[str, str]" = OrderedDict()   # 학습된 실시간 검색어 (정규화 key -> 원문), LRU 순
+        self._misses: "OrderedDict[str, float]" = OrderedDict()  # ECOS에도 없던 검색어 -> 다시 조회 가능한 시각
+        self._state_lock = threading.Lock()
+        self._updated_at: Optional[datetime] = None
+        self._save_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def lookup(self, message: str) -> Optional[Dict[str, str]]:
+        """
+        용어 질문이면 {"용어", "용어설명"}을, 아니면 None을 반환합니다.
+        색인에 없고 짧은 검색어일 때만 ECOS를 호출합니다.
+        """
+        query = (message or "").strip()
+        key = normalize_term(query)
+        entry = self._index.match(message)
+        if entry is not None:
+            with self._state_lock:
+                if key in self._queries:
+                    self._queries.move_to_end(key)
+            return {"용어": entry[0], "용어설명": entry[1]}
+
+        if not _looks_like_term(query, key):
+            return None
+        with self._state_lock:
+            miss_until = self._misses.get(key)
+        if miss_until is not None and miss_until > self._clock():
+            return None
+
+        rows = self._search(query)
+        if isinstance(rows, dict):
+            # 키 누락/장애는 학습하지 않고 다음 요청에서 다시 시도
+            return None
+        if not self._learn(query, rows):
+            with self._state_lock:
+                self._misses[key] = self._clock() + MISS_TTL_SECONDS
+                self._misses.move_to_end(key)
+                while len(self._misses) > MAX_MISSES:
+                    self._misses.popitem(last=False)
+            return None
+        self.save()
+
+        entry = self._index.match(query)
+        return {"용어": entry[0], "용어설명": entry[1]} if entry else None
+
+    def refresh(self) -> int:
+        """
+        시드 용어와 학습된 검색어를 ECOS에서 다시 받아 색인을 갱신하고, 갱신된 검색어 수를 반환합니다.
+        모든 검색이 성공하면 새 색인으로 바꿔서, 목록에서 밀려난 검색어의 용어도 함께 정리합니다.
+        """
+        with self._state_lock:
+            learned = list(self._queries.values())
+        index = GlossaryIndex()
+        refreshed = 0
+        failed = False
+        for query in list(dict.fromkeys(self._seed_terms + tuple(learned))):
+            rows = self._search(query)
+            if isinstance(rows, dict):
+                logger.warning("glossary refresh failed for %r: %s", query, rows.get("error"))
+                failed = True
+                continue
+            if self._learn(query, rows, remember_query=query not in self._seed_terms, index=index):
+                refreshed += 1
+        if failed:
+            # 일부 검색이 실패하면 기존 용어를 잃지 않도록 새로 받은 용어만 기존 색인에 합칩니다.
+            for entry in index.entries():
+                self._index.add(entry["key"], entry["word"], entry["content"])
+        else:
+            self._index = index
+        with self._state_lock:
+            self._misses.clear()
+        self._updated_at = datetime.now()
+        self.save()
+        return refreshed
+
+    def is_stale(self) -> bool:
+        if not len(self._index) or self._updated_at is None:
+            return True
+        return datetime.now() - self._updated_at >= timedelta(seconds=self._refresh_seconds)
+
+    def save(self) -> None:
+        with self._state_lock:
+            queries = list(self._queries.values())
+        payload = {
+            "updated_at": self._updated_at.isoformat() if self._updated_at else None,
+            "queries": queries,   # 오래 안 쓴 것부터 (LRU 순서 유지)
+            "terms": self._index.entries(),
+        }
+        with self._save_lock:
+            try:
+                os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+                tmp_path = f"{self._path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False)
+                os.replace(tmp_path, self._path)
+            except OSError as exc:
+                logger.warning("glossary index save failed: %s", exc)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="ecos-glossary-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def _learn(
+        self,
+        query: str,
+        rows: List[Dict],
+        *,
+        remember_query: bool = True,
+        index: Optional[GlossaryIndex] = None,
+    ) -> bool:
+        index = index if index is not None else self._index
+        added = [
+            (row.get("WORD"), row.get("CONTENT"))
+            for row in rows
+            if index.add(row.get("WORD") or "", row.get("WORD") or "", row.get("CONTENT") or "")
+        ]
+        if not added:
+            return False
+        key = normalize_term(query)
+        # 기존 ECOS 검색과 같게, 검색어와 정확히 같은 용어가 없으면 첫 번째 결과를 그 검색어의 답으로 둡니다.
+        if index.match(query) is None:
+            index.add(key, added[0][0], added[0][1])
+        with self._state_lock:
+            if remember_query:
+                self._remember_query(key, query)
+            self._misses.pop(key, None)
+        return True
+
+    def _remember_query(self, key: str, query: str) -> None:
+        self._queries[key] = query
+        self._queries.move_to_end(key)
+        while len(self._queries) > MAX_LEARNED_QUERIES:
+            self._queries.popitem(last=False)
+
+    def _load(self) -> None:
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning("glossary index load failed, rebuilding: %s", exc)
+            return
+
+        for term in payload.get("terms", []):
+            self._index.add(term.get("key", ""), term.get("word", ""), term.get("content", ""))
+        for query in payload.get("queries", []):
+            if normalize_term(query):
+                self._remember_query(normalize_term(query), query)
+        try:
+            self._updated_at = datetime.fromisoformat(payload["updated_at"]) if payload.get("updated_at") else None
+        except (TypeError, ValueError):
+            self._updated_at = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            if self.is_stale():
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception("glossary refresh crashed")
+            if self._stop.wait(self._refresh_seconds):
+                break
+
+
+def _looks_like_term(query: str, key: str) -> bool:
+    return 0 < len(key) <= MAX_LIVE_QUERY_LENGTH and len(query.split()) <= MAX_LIVE_QUERY_WORDS
+
+
+# ==============================================================================
+# 4. 앱 전역 인스턴스
+# ==============================================================================
+
+def load_seed_terms(path: str = SEED_TERMS_PATH) -> List[str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [term for term in json.load(f) if isinstance(term, str)]
+    except (OSError, ValueError):
+        return []
+
+
+@lru_cache(maxsize=1)
+def get_ecos_glossary() -> EcosGlossary:
+    from ecos import search_ecos_glossary_rows
+
+    return EcosGlossary(
+        path=settings.ECOS_GLOSSARY_INDEX_PATH,
+        search=search_ecos_glossary_rows,
+        seed_terms=load_seed_terms(),
+        refresh_seconds=settings.ECOS_GLOSSARY_REFRESH_HOURS * 3600,
+    )
+
+
+def lookup_glossary_term(message: str) -> Optional[Dict[str, str]]:
+    """/api/chat 용 용어 조회 (색인 우선, 필요할 때만 ECOS 호출)"""
+    return get_ecos_glossary().lookup(message)
+
+
+def start_glossary_refresher() -> None:
+    if settings.ECOS_GLOSSARY_REFRESH_ENABLED and settings.ECOS_AUTH_KEY:
+        get_ecos_glossary().start()
+
+
+def stop_glossary_refresher() -> None:
+    if get_ecos_glossary.cache_info().currsize:
+        get_ecos_glossary().stop()
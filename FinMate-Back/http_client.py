@@ -0,0 +1,125 @@
+# http_client.py
+# ECOS / DART / Naver / 공공데이터포털 호출이 함께 쓰는 HTTP 클라이언트
+# - 호스트별 requests.Session 을 하나씩 재사용해 keep-alive 연결 풀을 유지합니다.
+# - 호스트별 기본 타임아웃과 재시도(연결 오류, 5xx, 짧은 타임아웃 호스트의 읽기 타임아웃) 정책을 한 곳에서 관리합니다.
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ==============================================================================
+# 1. 호스트별 정책
+# ==============================================================================
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    timeout: Timeout = (3.05, 10)      # (연결, 읽기) 초
+    retries: int = 2                    # 연결 오류/5xx 재시도 횟수 (GET만)
+    read_retries: int = 0               # 읽기 타임아웃/응답 중 끊김 재시도 횟수. 읽기 타임아웃만큼 지연이 늘어나므로 기본은 0
+    backoff_factor: float = 0.3         # 0.3s, 0.6s, ... 간격으로 재시도
+    pool_maxsize: int = 16              # 호스트당 유지할 연결 수 (동시 요청 수 이상으로)
+
+
+DEFAULT_POLICY = HostPolicy()
+
+HOST_POLICIES: Dict[str, HostPolicy] = {
+    # 읽기 타임아웃이 짧은 호스트만 한 번 더 시도합니다. (최악 약 20초, 20초 타임아웃 호스트는 재시도하지 않음)
+    "ecos.bok.or.kr": HostPolicy(timeout=(3.05, 10), read_retries=1),
+    "opendart.fss.or.kr": HostPolicy(timeout=(3.05, 20)),
+    "openapi.naver.com": HostPolicy(timeout=(3.05, 10), read_retries=1),
+    "apis.data.go.kr": HostPolicy(timeout=(3.05, 20)),
+}
+
+# 429는 재시도하면 오히려 한도를 더 소모하므로 서버 오류만 재시도합니다.
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+# ==============================================================================
+# 2. 세션 풀
+# ==============================================================================
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_policy(url_or_host: str) -> HostPolicy:
+    return HOST_POLICIES.get(_host_of(url_or_host), DEFAULT_POLICY)
+
+
+def get_session(url_or_host: str) -> requests.Session:
+    """
+    호스트별로 공유되는 Session 을 반환합니다. 처음 요청 시 연결 풀과 재시도 정책을 붙여 생성합니다.
+    """
+    host = _host_of(url_or_host)
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _build_session(HOST_POLICIES.get(host, DEFAULT_POLICY))
+            _sessions[host] = session
+        return session
+
+
+def http_get(
+    url: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[Timeout] = None,
+    stream: bool = False,
+) -> requests.Response:
+    """
+    requests.get 과 같은 방식으로 쓰되, 호스트별 공유 세션과 기본 타임아웃을 사용합니다.
+    """
+    return get_session(url).get(
+        url,
+        params=params,
+        headers=headers,
+        timeout=timeout if timeout is not None else get_policy(url).timeout,
+        stream=stream,
+    )
+
+
+def close_all_sessions() -> None:
+    """서버 종료 시 열린 연결을 정리합니다."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+def _build_session(policy: HostPolicy) -> requests.Session:
+    retry = Retry(
+        total=policy.retries,
+        connect=policy.retries,
+        read=policy.read_retries,
+        status=policy.retries,
+        backoff_factor=policy.backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,  # 최종 응답은 그대로 돌려주고 status_code 처리는 호출부에 맡깁니다.
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=policy.pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _host_of(url_or_host: str) -> str:
+    if "://" not in url_or_host:
+        return url_or_host.lower()
+    return (urlsplit(url_or_host).hostname or "").lower()
@@ -0,0 +1,86 @@
+# keyword_matcher.py
+# 여러 키워드를 한 번에 찾는 Aho-Corasick 매처
+# - 키워드 목록으로 오토마톤을 한 번 만들어 두고, 문자열을 한 글자씩 한 번만 훑어 포함된 키워드를 모두 찾습니다.
+# - 키워드마다 `in` 검사를 반복하거나 매번 키워드를 정규화하지 않아도 되므로,
+#   DART 공시 목록(수백 건)의 보고서명/회사명을 분류할 때 사용합니다.
+# - 상태 전이는 키워드에 나오는 글자에 대해서만 미리 계산해 둡니다. (그 외 글자는 시작 상태로 돌아감)
+
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+
+class KeywordMatcher:
+    """
+    keywords 중 text에 부분 문자열로 들어 있는 것을 찾습니다.
+    ignore_whitespace=True면 공백을 모두 지운 뒤, ignore_case=True면 소문자로 바꾼 뒤 비교합니다.
+    (키워드에도 같은 정규화를 적용합니다)
+    """
+
+    def __init__(self, keywords: Iterable[str], *, ignore_case: bool = False, ignore_whitespace: bool = False):
+        self._ignore_case = ignore_case
+        self._ignore_whitespace = ignore_whitespace
+
+        # 정규화 결과가 같은 키워드(예: "경영실적 발표"/"경영실적발표")는 같은 상태에서 함께 보고합니다.
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Set[str]] = [set()]
+        for keyword in dict.fromkeys(keywords):
+            pattern = self.normalize(keyword)
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(keyword)
+
+        # BFS로 실패 링크를 구하면서 전이표를 완성합니다. 시작 상태로 가는 전이는 저장하지 않습니다.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in range(len(goto) - 1)]
+        queue = list(goto[0].values())
+        for state in queue:
+            fallback = delta[fail[state]]
+            transitions = dict(fallback)
+            for char, child in goto[state].items():
+                fail[child] = fallback.get(char, 0)
+                outputs[child] |= outputs[fail[child]]
+                transitions[char] = child
+                queue.append(child)
+            delta[state] = transitions
+
+        self._delta = delta
+        self._outputs: List[FrozenSet[str]] = [frozenset(output) for output in outputs]
+
+    def normalize(self, text: str) -> str:
+        text = text or ""
+        if self._ignore_whitespace:
+            text = "".join(text.split())
+        if self._ignore_case:
+            text = text.lower()
+        return text
+
+    def find(self, text: str) -> Set[str]:
+        """text에 들어 있는 키워드(원래 표기)를 모두 반환합니다."""
+        delta = self._delta
+        outputs = self._outputs
+        found: Set[str] = set()
+        state = 0
+        for char in self.normalize(text):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return found
+
+    def search(self, text: str) -> bool:
+        """키워드가 하나라도 들어 있으면 True (처음 찾은 곳에서 멈춤)"""
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+        for char in self.normalize(text):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                return True
+        return False
@@ -0,0 +1,250 @@
+# llm_cache.py
+# Gemini 응답 캐시 (챗봇 / 캘린더 인사이트 / 도미노 인사이트 / 뉴스 날씨 공용)
+# - 키: (모델명, 시스템 지침, 가드레일 surface와 규칙, 프롬프트)의 SHA-256 해시
+#   → 같은 실적 일정을 여러 사용자가 눌러도, 같은 6개월 시계열로 도미노 분석을 해도 Gemini는 한 번만 호출합니다.
+# - surface별 TTL, LRU 최대 개수 제한, 선택적 SQLite 저장(서버 재시작 후에도 재사용)
+# - 같은 키의 동시 요청은 첫 요청의 결과를 함께 기다립니다. (429/비용 절감)
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from config import settings
+from llm_guardrails import Surface, build_guardrail_instruction
+
+# ==============================================================================
+# 1. surface별 TTL
+# ==============================================================================
+
+SURFACE_TTL_SECONDS: Dict[str, int] = {
+    "chat": 600,                      # 검색 도구로 최신 정보를 쓰므로 짧게 (10분)
+    "news_weather": 3000,             # 뉴스 날씨 캐시 주기와 같게 (50분)
+    "domino_insight": 12 * 3600,      # 월별 시계열은 하루 안에 바뀌지 않음
+    "calendar_insight": 7 * 86400,    # 일정 설명은 이벤트 정보가 같으면 그대로 재사용
+}
+DEFAULT_TTL_SECONDS = 600
+
+
+def make_cache_key(surface: Surface, *, model: str, prompt: str, system_instruction: str = "") -> str:
+    payload = json.dumps(
+        {
+            "model": model or "",
+            "system": system_instruction or "",
+            "surface": surface,
+            "guardrail": build_guardrail_instruction(surface),
+            "prompt": prompt,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ==============================================================================
+# 2. 캐시 본체 (메모리 LRU + 선택적 SQLite)
+# ==============================================================================
+
+class LLMResponseCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = 512,
+        path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._max_entries = max(max_entries, 1)
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # key -> (응답, 만료 시각)
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._path = Path(path) if path else None
+        self._db_lock = threading.Lock()
+        self._db_initialized = False
+        self._writes_since_prune = 0
+
+    def get_or_generate(
+        self,
+        surface: Surface,
+        *,
+        model: str,
+        prompt: str,
+        generate: Callable[[], str],
+        system_instruction: str = "",
+    ) -> str:
+        """
+        캐시에 있으면 저장된 응답을, 없으면 generate()로 만든 응답을 저장 후 반환합니다.
+        generate()가 예외를 내거나 빈 문자열을 반환하면 캐시하지 않습니다.
+        """
+        key = make_cache_key(surface, model=model, prompt=prompt, system_instruction=system_instruction)
+        cached = self.get(key)
+        if cached is not None:
+            self._count(surface, "hits")
+            return cached
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+        if not leader:
+            self._count(surface, "shared")
+            return future.result()
+
+        self._count(surface, "misses")
+        try:
+            text = generate()
+            if text:
+                self.set(key, surface, text)
+            future.set_result(text)
+            return text
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def get(self, key: str) -> Optional[str]:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(key)
+                    return entry[0]
+                del self._entries[key]
+
+        if self._path is None:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, expires_at FROM llm_responses WHERE cache_key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        if row is None:
+            return None
+        self._remember(key, row[0], row[1])
+        return row[0]
+
+    def set(self, key: str, surface: Surface, text: str) -> None:
+        now = self._clock()
+        expires_at = now + SURFACE_TTL_SECONDS.get(surface, DEFAULT_TTL_SECONDS)
+        self._remember(key, text, expires_at)
+        if self._path is None:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO llm_responses (cache_key, surface, response, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    response = excluded.response,
+                    created_at = excluded.created_at,
+                    expires_at = excluded.expires_at
+                """,
+                (key, surface, text, now, expires_at),
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= 100:
+                # 만료된 행을 주기적으로 정리하고, 디스크에도 최대 개수의 몇 배까지만 남깁니다.
+                self._writes_since_prune = 0
+                conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    """
+                    DELETE FROM llm_responses WHERE cache_key NOT IN (
+                        SELECT cache_key FROM llm_responses ORDER BY created_at DESC LIMIT ?
+                    )
+                    """,
+                    (self._max_entries * 4,),
+                )
+            conn.commit()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            stats = {surface: dict(counts) for surface, counts in self._stats.items()}
+            stats["_memory"] = {"entries": len(self._entries), "max_entries": self._max_entries}
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+        if self._path is not None:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_responses")
+                conn.commit()
+
+    def _remember(self, key: str, text: str, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (text, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _count(self, surface: str, name: str) -> None:
+        with self._lock:
+            counts = self._stats.setdefault(surface, {"hits": 0, "misses": 0, "shared": 0})
+            counts[name] += 1
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=10)
+        if not self._db_initialized:
+            with self._db_lock:
+                if not self._db_initialized:
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS llm_responses (
+                            cache_key TEXT PRIMARY KEY,
+                            surface TEXT NOT NULL,
+                            response TEXT NOT NULL,
+                            created_at REAL NOT NULL,
+                            expires_at REAL NOT NULL
+                        )
+                        """
+                    )
+                    conn.commit()
+                    self._db_initialized = True
+        return conn
+
+
+# ==============================================================================
+# 3. 앱 전역 인스턴스
+# ==============================================================================
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    path = (settings.LLM_CACHE_PATH or "").strip() or None
+    if path:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return LLMResponseCache(max_entries=settings.LLM_CACHE_MAX_ENTRIES, path=path)
+
+
+def cached_llm_text(
+    surface: Surface,
+    *,
+    model: str,
+    prompt: str,
+    generate: Callable[[], str],
+    system_instruction: str = "",
+) -> str:
+    """Gemini 호출부에서 사용하는 진입점. 캐시가 꺼져 있으면 generate()를 그대로 호출합니다."""
+    cache = get_llm_cache()
+    if cache is None:
+        return generate()
+    return cache.get_or_generate(
+        surface,
+        model=model,
+        prompt=prompt,
+        generate=generate,
+        system_instruction=system_instruction,
+    )
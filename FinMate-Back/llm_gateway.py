@@ -0,0 +1,196 @@
+# llm_gateway.py
+# Gemini 호출 게이트웨이 (bot / calendar_insight / domino_insight / news_weather 공용)
+# - 분당 요청 수(RPM) 토큰 버킷 + 최대 동시 호출 수 세마포어로 Gemini 사용량을 한 곳에서 조절합니다.
+# - 한도에 걸린 요청은 바로 429로 실패하지 않고 우선순위 큐에서 잠시(마감 시간까지) 기다립니다.
+#   우선순위: 챗봇(INTERACTIVE) > 인사이트(USER) > 뉴스 날씨 갱신(BACKGROUND)
+# - Gemini가 429를 돌려주면 잠시 전체 호출을 멈추고(cooldown) 마감 시간 안에서 한 번 더 시도합니다.
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from config import settings
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0   # 사용자가 화면에서 답을 기다리는 챗봇
+    USER = 1          # 클릭 시 생성하는 캘린더/도미노 인사이트
+    BACKGROUND = 2    # 뉴스 날씨 갱신 등 배치 작업
+
+
+# 우선순위별 최대 대기 시간 (초)
+QUEUE_TIMEOUT_SECONDS: Dict[Priority, float] = {
+    Priority.INTERACTIVE: 10.0,
+    Priority.USER: 15.0,
+    Priority.BACKGROUND: 60.0,
+}
+RATE_LIMIT_COOLDOWN_SECONDS = 5.0   # Gemini 429 이후 전체 호출을 멈추는 시간
+MAX_RATE_LIMIT_RETRIES = 1
+
+
+class LLMRateLimited(RuntimeError):
+    """마감 시간 안에 Gemini 호출 슬롯을 얻지 못했거나, 재시도 후에도 429가 난 경우"""
+
+
+class LLMGateway:
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int,
+        max_concurrency: int,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._rate = max(requests_per_minute, 1) / 60.0
+        self._max_concurrency = max(max_concurrency, 1)
+        self._capacity = float(max(burst if burst is not None else self._max_concurrency, 1))
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._active = 0
+        self._cond = threading.Condition()
+        self._waiters: List[Tuple[int, int]] = []   # (우선순위, 도착 순서) 힙
+        self._sequence = itertools.count()
+        self._stats = {"calls": 0, "queued": 0, "timeouts": 0, "rate_limited": 0}
+
+    def call(self, fn: Callable[[], T], *, priority: Priority = Priority.USER, timeout: Optional[float] = None) -> T:
+        """슬롯을 얻은 뒤 fn()을 실행합니다. 마감 시간 안에 슬롯을 못 얻으면 LLMRateLimited를 발생시킵니다."""
+        deadline = self._clock() + (QUEUE_TIMEOUT_SECONDS[priority] if timeout is None else timeout)
+        retries = 0
+        while True:
+            self.acquire(priority, deadline)
+            try:
+                return fn()
+            except Exception as exc:
+                if not is_rate_limit_error(exc):
+                    raise
+                self._count("rate_limited")
+                self._pause(RATE_LIMIT_COOLDOWN_SECONDS)
+                if retries >= MAX_RATE_LIMIT_RETRIES or self._clock() + RATE_LIMIT_COOLDOWN_SECONDS > deadline:
+                    raise LLMRateLimited(f"Gemini 요청 한도 초과(429): {exc}") from exc
+                retries += 1
+            finally:
+                self.release()
+
+    @contextmanager
+    def slot(self, priority: Priority = Priority.USER, timeout: Optional[float] = None) -> Iterator[None]:
+        """
+        스트리밍 응답처럼 호출 하나가 블록 전체에 걸쳐 있는 경우에 사용합니다.
+        블록이 끝날 때까지 동시 호출 슬롯을 잡고 있으며, 429는 재시도하지 않고 전체 호출만 잠시 멈춥니다.
+        """
+        deadline = self._clock() + (QUEUE_TIMEOUT_SECONDS[priority] if timeout is None else timeout)
+        self.acquire(priority, deadline)
+        try:
+            yield
+        except Exception as exc:
+            if is_rate_limit_error(exc):
+                self._count("rate_limited")
+                self._pause(RATE_LIMIT_COOLDOWN_SECONDS)
+                raise LLMRateLimited(f"Gemini 요청 한도 초과(429): {exc}") from exc
+            raise
+        finally:
+            self.release()
+
+    def acquire(self, priority: Priority, deadline: float) -> None:
+        ticket = (int(priority), next(self._sequence))
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            queued = False
+            while True:
+                now = self._clock()
+                self._refill(now)
+                if (
+                    self._waiters[0] == ticket
+                    and self._active < self._max_concurrency
+                    and self._tokens >= 1
+                    and now >= self._paused_until
+                ):
+                    heapq.heappop(self._waiters)
+                    self._tokens -= 1
+                    self._active += 1
+                    self._stats["calls"] += 1
+                    # 다음 대기자가 바로 조건을 다시 확인할 수 있도록 깨웁니다.
+                    self._cond.notify_all()
+                    return
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    self._waiters.remove(ticket)
+                    heapq.heapify(self._waiters)
+                    self._stats["timeouts"] += 1
+                    self._cond.notify_all()
+                    raise LLMRateLimited("Gemini 요청이 많아 대기 시간을 초과했습니다. 잠시 후 다시 시도해 주세요.")
+
+                if not queued:
+                    queued = True
+                    self._stats["queued"] += 1
+                # 토큰이 다시 찰 때까지, 또는 다른 호출이 끝날 때까지 기다립니다.
+                wait_for = remaining
+                if self._tokens < 1:
+                    wait_for = min(wait_for, (1 - self._tokens) / self._rate)
+                if now < self._paused_until:
+                    wait_for = min(wait_for, self._paused_until - now)
+                self._cond.wait(max(wait_for, 0.001))
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, float]:
+        with self._cond:
+            self._refill(self._clock())
+            return {
+                **self._stats,
+                "active": self._active,
+                "waiting": len(self._waiters),
+                "tokens": round(self._tokens, 2),
+            }
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def _pause(self, seconds: float) -> None:
+        with self._cond:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def _count(self, name: str) -> None:
+        with self._cond:
+            self._stats[name] += 1
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    msg = str(exc)
+    return "429" in msg or "RESOURCE_EXHAUSTED" in msg or "TooManyRequests" in msg
+
+
+# ==============================================================================
+# 앱 전역 게이트웨이
+# ==============================================================================
+
+@lru_cache(maxsize=1)
+def get_llm_gateway() -> LLMGateway:
+    return LLMGateway(
+        requests_per_minute=settings.GEMINI_REQUESTS_PER_MINUTE,
+        max_concurrency=settings.GEMINI_MAX_CONCURRENCY,
+    )
+
+
+def run_llm(fn: Callable[[], T], *, priority: Priority) -> T:
+    """Gemini 호출부에서 사용하는 진입점"""
+    return get_llm_gateway().call(fn, priority=priority)
+
+
+def llm_slot(priority: Priority):
+    """스트리밍 Gemini 호출부에서 사용하는 진입점 (with 블록 동안 슬롯 점유)"""
+    return get_llm_gateway().slot(priority)
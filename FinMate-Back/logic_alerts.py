@@ -80,6 +80,8 @@ def _build_usdkrw_alert() -> dict[str, Any]:
         market_weather = get_last_one()
         if isinstance(market_weather, dict) and "error" in market_weather:
             raise ValueError(market_weather["error"])
+        if "fx" in market_weather.get("errors", {}):
+            raise ValueError(market_weather["errors"]["fx"])
         fx_item = next(
             item for item in market_weather.get("indices", [])
             if item.get("name") == "USD/KRW"
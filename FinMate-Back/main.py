@@ -4,9 +4,11 @@
 # [필수 라이브러리 및 모듈 임포트]
 # ==============================================================================
 from fastapi import FastAPI, HTTPException
+from fastapi import Path as PathParam  # pathlib.Path와 이름이 겹치지 않도록
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import Literal, List, Optional, Dict, Any, Union
+from typing import Literal, List, Optional, Dict, Any, Iterator, Union
 from pathlib import Path
 import json
 
@@ -15,11 +17,16 @@ import json
 # 프로젝트 내 다른 파일에서 정의된 핵심 기능들을 가져옵니다.
 # ------------------------------------------------------------------------------
 from bot import generate_finmate_reply          # Google Gemini AI를 통해 챗봇 답변 생성
-from ecos import search_ecos_glossary_term      # 한국은행 ECOS 용어 사전 검색 기능
+from bot import stream_finmate_reply            # 챗봇 답변 스트리밍 (SSE)
+from chat_sessions import SESSION_ID_PATTERN, get_chat_session_store  # 서버 측 대화 세션 (history 재전송 대신 sessionId 사용)
+from glossary_index import lookup_glossary_term  # ECOS 용어 사전 로컬 색인 조회 (필요할 때만 ECOS 호출)
+from glossary_index import start_glossary_refresher, stop_glossary_refresher
+from llm_gateway import LLMRateLimited, is_rate_limit_error  # Gemini 대기열 초과/429 판별
 from ecos import get_policy_rate_last_n         # 기준금리 데이터 조회
 from ecos import get_kospi_last_n               # KOSPI 월평균 데이터 조회
 from ecos import get_last_one                   # 주요 시장 지수(KOSPI, 환율 등) 최신값 조회
 from ecos import get_macro_points               # 도미노 그래프용 데이터(금리+주가) 가공
+from ecos import get_ecos_cache_stats           # ECOS 통계 캐시 적중/미스 카운터
 
 from news_weather import get_news_weather       # 네이버 뉴스 크롤링 + AI 요약("시장 날씨") 생성
 from logic_alerts import get_logic_alerts       # 실제 시장 데이터 기반 로직 알림
@@ -34,9 +41,11 @@ from calendar_post_result import (
     get_calendar_post_result_provider,
 )
 from dart import get_dart_calendar, get_dart_raw_sample  # DART 실적·IR 일정 실시간 조회
+from http_client import close_all_sessions
 from plan_db import init_db
 from plan_routes import router as planner_router
 from strategy_routes import router as strategy_router
+from strategy_routes import start_market_data_prewarmer, stop_market_data_prewarmer
 
 # ==============================================================================
 # 1. FastAPI 앱 초기화 및 설정
@@ -64,6 +73,17 @@ app.add_middleware(
 @app.on_event("startup")
 def on_startup():
     init_db()
+    # 13:10 KST 공공데이터 갱신 직후 지원 종목 일봉 캐시를 미리 채우는 스케줄러
+    start_market_data_prewarmer()
+    # ECOS 용어 사전 로컬 색인 주기적 갱신
+    start_glossary_refresher()
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+    stop_market_data_prewarmer()
+    stop_glossary_refresher()
+    close_all_sessions()
 
 
 app.include_router(planner_router, prefix="/api/planner")
@@ -85,11 +105,22 @@ class ChatRequest(BaseModel):
     """클라이언트가 보내는 채팅 요청 구조"""
     mode: Literal["easy", "pro"]        # 답변 스타일 (쉬운 모드 / 전문가 모드)
     message: str                        # 사용자의 현재 질문
-    history: List[HistoryMessage] = []  # 대화 맥락 유지를 위한 히스토리
+    history: List[HistoryMessage] = []  # 세션이 없을 때만 사용하는 히스토리 (기존 클라이언트 호환)
+    # 이전 응답에서 받은 세션 id. 있으면 서버에 저장된 대화를 이어서 사용하므로 history를 다시 보낼 필요가 없습니다.
+    session_id: Optional[str] = Field(default=None, alias="sessionId", pattern=SESSION_ID_PATTERN)
+
+    class Config:
+        allow_population_by_field_name = True  # (Pydantic v1)
+        populate_by_name = True                # (Pydantic v2)
 
 class ChatResponse(BaseModel):
     """클라이언트에게 보낼 채팅 응답 구조"""
     reply: str
+    session_id: str = Field(alias="sessionId")  # 다음 요청에 그대로 보내면 대화가 이어집니다.
+
+    class Config:
+        allow_population_by_field_name = True  # (Pydantic v1)
+        populate_by_name = True                # (Pydantic v2)
 
 # [거시경제 그래프 관련 모델]
 class MacroPoint(BaseModel):
@@ -161,43 +192,55 @@ class CalendarInsightResponse(BaseModel):
 # [3-a] 메인 채팅 API (/api/chat)
 # 사용자의 질문을 받아 1차로 경제 용어 사전을 검색하고, 없으면 AI에게 질문합니다.
 # ------------------------------------------------------------------------------
+def _glossary_answer(mode: str, user_msg: str) -> Optional[str]:
+    """
+    ECOS 용어 사전 우선 검색
+    사용자가 경제 용어를 물어봤을 경우, 정확한 정의를 먼저 제공합니다.
+    로컬 색인으로 먼저 판단하므로 일반 문장은 ECOS 호출 없이 바로 None을 반환합니다.
+    """
+    ecos_result = lookup_glossary_term(user_msg)
+
+    # 검색 결과가 있고 "용어설명"이 존재하는 경우 -> 사전 정의 반환
+    if not (isinstance(ecos_result, dict) and ecos_result.get("용어설명")):
+        return None
+
+    term = ecos_result["용어"]
+    desc = ecos_result["용어설명"]
+
+    # 모드에 따라 말투를 다르게 포장
+    if mode == "easy":
+        return (
+            f"📘 **[{term}] 용어 설명 (쉬운 버전)**\n\n"
+            f"{desc}\n\n"
+            f"👉 한국은행 ECOS 공식 용어사전 데이터를 기반으로 한 설명이에요!"
+        )
+    return (
+        f"📊 **[{term}] ECOS 공식 정의**\n\n"
+        f"{desc}\n\n"
+        f"(출처: 한국은행 ECOS)"
+    )
+
+
 @app.post("/api/chat", response_model=ChatResponse)
 def chat_endpoint(req: ChatRequest):
 
-    # 1. Pydantic 모델을 딕셔너리 형태로 변환 (Gemini 모듈 호환성 위해)
+    # 1. 서버 세션에서 대화 기록을 가져옵니다. (처음이면 클라이언트 history로 세션 생성)
     history_dicts = [
         {"role": h.role, "text": h.text}
         for h in req.history
     ]
+    store = get_chat_session_store()
+    session = store.get_or_create(req.session_id, history_dicts)
 
     user_msg = req.message.strip()
 
     # --------------------------------------
     # STEP 1: ECOS 용어 사전 우선 검색
-    # 사용자가 경제 용어를 물어봤을 경우, 정확한 정의를 먼저 제공합니다.
     # --------------------------------------
-    ecos_result = search_ecos_glossary_term(user_msg)
-
-    # 검색 결과가 있고 "용어설명"이 존재하는 경우 -> 사전 정의 반환
-    if isinstance(ecos_result, dict) and ecos_result.get("용어설명"):
-        term = ecos_result["용어"]
-        desc = ecos_result["용어설명"]
-
-        # 모드에 따라 말투를 다르게 포장
-        if req.mode == "easy":
-            answer = (
-                f"📘 **[{term}] 용어 설명 (쉬운 버전)**\n\n"
-                f"{desc}\n\n"
-                f"👉 한국은행 ECOS 공식 용어사전 데이터를 기반으로 한 설명이에요!"
-            )
-        else:
-            answer = (
-                f"📊 **[{term}] ECOS 공식 정의**\n\n"
-                f"{desc}\n\n"
-                f"(출처: 한국은행 ECOS)"
-            )
-
-        return ChatResponse(reply=answer)
+    answer = _glossary_answer(req.mode, user_msg)
+    if answer:
+        store.append_turn(session.id, user_msg, answer)
+        return ChatResponse(reply=answer, session_id=session.id)
 
     # --------------------------------------
     # STEP 2: 사전에 없으면 Gemini AI 호출
@@ -207,13 +250,77 @@ def chat_endpoint(req: ChatRequest):
         reply_text = generate_finmate_reply(
             mode=req.mode,
             message=req.message,
-            history=history_dicts,
+            history=session.history(),
+            summary=session.summary,
         )
+    except LLMRateLimited:
+        raise HTTPException(status_code=429, detail="Gemini 요청이 많습니다. 잠시 후 다시 시도해 주세요.", headers={"Retry-After": "10"})
     except Exception as e:
         # AI 호출 중 에러 발생 시 500 에러 반환
         raise HTTPException(status_code=500, detail=f"Gemini 호출 오류: {e}")
 
-    return ChatResponse(reply=reply_text)
+    store.append_turn(session.id, user_msg, reply_text)
+    return ChatResponse(reply=reply_text, session_id=session.id)
+
+
+# ------------------------------------------------------------------------------
+# [3-a-2] 스트리밍 채팅 API (/api/chat/stream)
+# /api/chat과 같은 요청을 받아 답변을 Server-Sent Events로 조각조각 보냅니다.
+# - event: delta   → {"text": 답변 조각}
+# - event: replace → {"text": 안전 문구} (가드레일이 금지 표현을 감지해 지금까지의 답변을 대체)
+# - event: done    → {"reply": 최종 답변, "sessionId": 세션 id} (/api/chat 응답과 같은 값)
+# - event: error   → {"status": HTTP 상태 코드, "detail": 오류 메시지}
+# ------------------------------------------------------------------------------
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _chat_event_stream(req: ChatRequest) -> Iterator[str]:
+    history_dicts = [{"role": h.role, "text": h.text} for h in req.history]
+    store = get_chat_session_store()
+    session = store.get_or_create(req.session_id, history_dicts)
+
+    user_msg = req.message.strip()
+    answer = _glossary_answer(req.mode, user_msg)
+    if answer:
+        store.append_turn(session.id, user_msg, answer)
+        yield _sse("delta", {"text": answer})
+        yield _sse("done", {"reply": answer, "sessionId": session.id})
+        return
+
+    try:
+        for item in stream_finmate_reply(
+            mode=req.mode,
+            message=req.message,
+            history=session.history(),
+            summary=session.summary,
+        ):
+            event = item["event"]
+            data = {key: value for key, value in item.items() if key != "event"}
+            if event == "done":
+                store.append_turn(session.id, user_msg, data["reply"])
+                data["sessionId"] = session.id
+            yield _sse(event, data)
+    except LLMRateLimited:
+        yield _sse("error", {"status": 429, "detail": "Gemini 요청이 많습니다. 잠시 후 다시 시도해 주세요."})
+    except Exception as e:
+        yield _sse("error", {"status": 500, "detail": f"Gemini 호출 오류: {e}"})
+
+
+@app.post("/api/chat/stream")
+def chat_stream_endpoint(req: ChatRequest):
+    return StreamingResponse(
+        _chat_event_stream(req),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.delete("/api/chat/sessions/{session_id}")
+def delete_chat_session(session_id: str = PathParam(pattern=SESSION_ID_PATTERN)):
+    """대화 초기화: 서버에 저장된 세션 기록을 지웁니다."""
+    get_chat_session_store().delete(session_id)
+    return {"deleted": session_id}
 
 
 # ------------------------------------------------------------------------------
@@ -260,6 +367,15 @@ def market_weather():
     return data  # 구조: { "indices": [ {name, value, change}, ... ] }
 
 
+# ------------------------------------------------------------------------------
+# [3-c-1] ECOS 캐시 상태 API (/api/ecos/cache-stats)
+# ------------------------------------------------------------------------------
+@app.get("/api/ecos/cache-stats")
+def ecos_cache_stats():
+    """ECOS 통계 캐시의 적중(hits/partial_hits)/미스, 실제 ECOS 호출 수를 반환합니다."""
+    return get_ecos_cache_stats()
+
+
 # ------------------------------------------------------------------------------
 # [3-c-2] 실제 데이터 기반 로직 알림 API (/api/logic-alerts)
 # ------------------------------------------------------------------------------
@@ -373,10 +489,12 @@ def calendar_insight(req: CalendarInsightRequest):
             event_type=req.type,
         )
         return CalendarInsightResponse(insight=text)
+    except LLMRateLimited:
+        # 게이트웨이 대기 시간 안에 처리하지 못한 경우에만 429 (짧은 폭주는 큐에서 흡수)
+        raise HTTPException(status_code=429, detail="Gemini rate limit exceeded", headers={"Retry-After": "10"})
     except Exception as e:
-        msg = str(e)
-        if "429" in msg or "TooManyRequests" in msg:
-            raise HTTPException(status_code=429, detail="Gemini rate limit exceeded")
+        if is_rate_limit_error(e):
+            raise HTTPException(status_code=429, detail="Gemini rate limit exceeded", headers={"Retry-After": "10"})
         raise HTTPException(status_code=500, detail=f"insight 생성 오류: {e}")
 
 
@@ -1,9 +1,11 @@
+from .bar_store import SqliteDailyBarStore
 from .mock_provider import MockMarketDataProvider
 from .provider import MarketDataProvider
 from .public_data_provider import PublicDataMarketDataProvider
 from .types import (
     BenchmarkDefinition,
     DailyBar,
+    DailyBarColumns,
     DailyBarSeries,
     MarketDataSourceInfo,
     MarketDataStatus,
@@ -14,6 +16,7 @@ from .types import (
 __all__ = [
     "BenchmarkDefinition",
     "DailyBar",
+    "DailyBarColumns",
     "DailyBarSeries",
     "MarketDataProvider",
     "MarketDataSourceInfo",
@@ -21,5 +24,6 @@ __all__ = [
     "MarketInstrumentType",
     "MockMarketDataProvider",
     "PublicDataMarketDataProvider",
+    "SqliteDailyBarStore",
     "SupportedTicker",
 ]
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable
+
+
+SCHEMA_VERSION = 1
+BAS_DT_FORMAT = "%Y%m%d"
+
+
+class SqliteDailyBarStore:
+    """On-disk daily OHLCV rows keyed by (symbol_code, basDt).
+
+    Rows are kept in the data.go.kr item shape so the provider can feed them through the same
+    parsing path as a fresh API response. ``history_start`` records how far back the last full
+    pull reached, which tells the provider whether a small delta fetch is enough.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def history_start(self, symbol_code: str) -> date | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT history_start FROM daily_bar_symbols WHERE symbol_code = ?",
+                (symbol_code,),
+            ).fetchone()
+        return _parse_bas_dt(row["history_start"]) if row and row["history_start"] else None
+
+    def latest_bar_date(self, symbol_code: str) -> date | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(bas_dt) AS latest FROM daily_bars WHERE symbol_code = ?",
+                (symbol_code,),
+            ).fetchone()
+        return _parse_bas_dt(row["latest"]) if row and row["latest"] else None
+
+    def load_rows(self, symbol_code: str, *, since: date, limit: int) -> list[dict[str, Any]]:
+        """Return up to ``limit`` most recent rows on or after ``since``, newest first like the API."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT bas_dt, itms_nm, mkp, hipr, lopr, clpr, trqu
+                FROM daily_bars
+                WHERE symbol_code = ? AND bas_dt >= ?
+                ORDER BY bas_dt DESC
+                LIMIT ?
+                """,
+                (symbol_code, _format_bas_dt(since), limit),
+            ).fetchall()
+        return [
+            {
+                "basDt": row["bas_dt"],
+                "srtnCd": symbol_code,
+                "itmsNm": row["itms_nm"],
+                "mkp": row["mkp"],
+                "hipr": row["hipr"],
+                "lopr": row["lopr"],
+                "clpr": row["clpr"],
+                "trqu": row["trqu"],
+            }
+            for row in rows
+        ]
+
+    def save_rows(
+        self,
+        symbol_code: str,
+        rows: Iterable[dict[str, Any]],
+        *,
+        history_start: date | None = None,
+        prune_before: date | None = None,
+    ) -> int:
+        """Upsert API rows for one symbol and return how many were written.
+
+        ``history_start`` is only advanced backwards, so a delta fetch never shrinks the range a
+        previous full pull already covered.
+        """
+        records = [record for record in (_row_to_record(symbol_code, row) for row in rows) if record]
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO daily_bars (symbol_code, bas_dt, itms_nm, mkp, hipr, lopr, clpr, trqu)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(symbol_code, bas_dt) DO UPDATE SET
+                    itms_nm = excluded.itms_nm,
+                    mkp = excluded.mkp,
+                    hipr = excluded.hipr,
+                    lopr = excluded.lopr,
+                    clpr = excluded.clpr,
+                    trqu = excluded.trqu
+                """,
+                records,
+            )
+            if history_start is not None:
+                conn.execute(
+                    """
+                    INSERT INTO daily_bar_symbols (symbol_code, history_start) VALUES (?, ?)
+                    ON CONFLICT(symbol_code) DO UPDATE SET
+                        history_start = MIN(COALESCE(daily_bar_symbols.history_start, excluded.history_start), excluded.history_start)
+                    """,
+                    (symbol_code, _format_bas_dt(history_start)),
+                )
+            if prune_before is not None:
+                cutoff = _format_bas_dt(prune_before)
+                conn.execute(
+                    "DELETE FROM daily_bars WHERE symbol_code = ? AND bas_dt < ?",
+                    (symbol_code, cutoff),
+                )
+                conn.execute(
+                    "UPDATE daily_bar_symbols SET history_start = ? WHERE symbol_code = ? AND history_start < ?",
+                    (cutoff, symbol_code, cutoff),
+                )
+            conn.commit()
+        return len(records)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self._init_schema(conn)
+                    self._initialized = True
+        return conn
+
+    def _init_schema(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS daily_bars (
+                symbol_code TEXT NOT NULL,
+                bas_dt TEXT NOT NULL,
+                itms_nm TEXT,
+                mkp REAL NOT NULL,
+                hipr REAL NOT NULL,
+                lopr REAL NOT NULL,
+                clpr REAL NOT NULL,
+                trqu INTEGER NOT NULL,
+                PRIMARY KEY (symbol_code, bas_dt)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS daily_bar_symbols (
+                symbol_code TEXT PRIMARY KEY,
+                history_start TEXT
+            );
+            """
+        )
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+
+
+def open_daily_bar_store(path: str | None) -> SqliteDailyBarStore | None:
+    """Create the store at ``path``; an empty path disables persistence."""
+    if not path or not path.strip():
+        return None
+    store_path = Path(path.strip())
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    return SqliteDailyBarStore(store_path)
+
+
+def _row_to_record(symbol_code: str, row: dict[str, Any]) -> tuple[Any, ...] | None:
+    row_code = str(row.get("srtnCd") or symbol_code).strip()
+    if row_code != symbol_code:
+        return None
+    try:
+        bas_dt = str(row["basDt"]).strip()
+        _parse_bas_dt(bas_dt)
+        values = [_to_float(row.get(key)) for key in ("mkp", "hipr", "lopr", "clpr")]
+        volume = int(_to_float(row.get("trqu")))
+    except (KeyError, TypeError, ValueError):
+        return None
+    name = str(row.get("itmsNm") or "").strip() or None
+    return (symbol_code, bas_dt, name, *values, volume)
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        raise ValueError("missing numeric value")
+    return float(str(value).replace(",", "").strip())
+
+
+def _parse_bas_dt(value: str) -> date:
+    return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+
+
+def _format_bas_dt(value: date) -> str:
+    return value.strftime(BAS_DT_FORMAT)
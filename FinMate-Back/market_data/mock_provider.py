@@ -66,7 +66,7 @@ class MockMarketDataProvider(MarketDataProvider):
 
     @property
     def source_info(self) -> MarketDataSourceInfo:
-        return self._source_info.model_copy(deep=True)
+        return self._source_info
 
     def list_supported_tickers(self) -> list[SupportedTicker]:
         return [self._to_supported_ticker(symbol) for symbol in self._supported_tickers]
@@ -135,6 +135,17 @@ class MockMarketDataProvider(MarketDataProvider):
 
         return self._build_series_from_benchmark(benchmark, lookback=lookback)
 
+    def get_benchmark_daily_bars_by_id(
+        self,
+        benchmark_id: str,
+        *,
+        lookback: int | None = None,
+    ) -> DailyBarSeries:
+        benchmark = self._benchmarks_by_id.get(benchmark_id)
+        if benchmark is None:
+            return super().get_benchmark_daily_bars_by_id(benchmark_id, lookback=lookback)
+        return self._build_series_from_benchmark(benchmark, lookback=lookback)
+
     def _build_lookup_tables(self) -> None:
         for symbol in self._supported_tickers:
             lookup_keys = {
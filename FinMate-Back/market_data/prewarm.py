@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable
+
+from .public_data_provider import (
+    PublicDataMarketDataProvider,
+    next_public_data_cache_expiry,
+    now_kst,
+    to_kst,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREWARM_DELAY_SECONDS = 30
+DEFAULT_PREWARM_MAX_ATTEMPTS = 4
+DEFAULT_PREWARM_BACKOFF_SECONDS = 30.0
+MAX_PREWARM_BACKOFF_SECONDS = 600.0
+
+
+@dataclass(frozen=True)
+class PrewarmTargetResult:
+    target: str
+    kind: str
+    ok: bool
+    attempts: int
+    bar_count: int = 0
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class PrewarmRun:
+    trigger: str
+    started_at: datetime
+    finished_at: datetime
+    results: tuple[PrewarmTargetResult, ...] = ()
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (self.finished_at - self.started_at).total_seconds() * 1000
+
+    @property
+    def failed(self) -> tuple[PrewarmTargetResult, ...]:
+        return tuple(result for result in self.results if not result.ok)
+
+
+@dataclass(frozen=True)
+class PrewarmStatus:
+    enabled: bool
+    running: bool
+    next_run_at: datetime | None
+    last_run: PrewarmRun | None = None
+
+
+@dataclass
+class _PendingTarget:
+    target: str
+    kind: str
+    refresh: Callable[[], int]
+    attempts: int = 0
+    error: str | None = None
+    bar_count: int = 0
+
+
+class MarketDataPrewarmer:
+    """Refreshes every supported symbol and benchmark just after the 13:10 KST data.go.kr window.
+
+    Each refresh bypasses the provider cache and replaces the entry only once the new snapshot is
+    parsed, so readers keep seeing the previous data until then; readers that miss meanwhile join
+    the in-flight refresh instead of issuing their own upstream call. Failed targets are retried
+    with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        provider: PublicDataMarketDataProvider,
+        *,
+        delay_seconds: int = DEFAULT_PREWARM_DELAY_SECONDS,
+        max_attempts: int = DEFAULT_PREWARM_MAX_ATTEMPTS,
+        backoff_seconds: float = DEFAULT_PREWARM_BACKOFF_SECONDS,
+        warm_on_start: bool = True,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._provider = provider
+        self._delay = timedelta(seconds=max(delay_seconds, 0))
+        self._max_attempts = max(max_attempts, 1)
+        self._backoff_seconds = max(backoff_seconds, 0.0)
+        self._warm_on_start = warm_on_start
+        self._clock = clock or now_kst
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._running = False
+        self._next_run_at: datetime | None = None
+        self._last_run: PrewarmRun | None = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="market-data-prewarm", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def status(self) -> PrewarmStatus:
+        with self._lock:
+            return PrewarmStatus(
+                enabled=self._thread is not None and self._thread.is_alive(),
+                running=self._running,
+                next_run_at=self._next_run_at,
+                last_run=self._last_run,
+            )
+
+    def next_run_at(self, now: datetime | None = None) -> datetime:
+        current = to_kst(now or self._clock())
+        return next_public_data_cache_expiry(current - self._delay) + self._delay
+
+    def run_once(self, *, trigger: str = "manual") -> PrewarmRun:
+        started_at = to_kst(self._clock())
+        with self._lock:
+            self._running = True
+        try:
+            pending = self._targets()
+            finished: list[_PendingTarget] = []
+            backoff = self._backoff_seconds
+            for attempt in range(1, self._max_attempts + 1):
+                retry: list[_PendingTarget] = []
+                for target in pending:
+                    target.attempts = attempt
+                    try:
+                        target.bar_count = target.refresh()
+                        target.error = None
+                        finished.append(target)
+                    except Exception as exc:
+                        target.error = str(exc) or exc.__class__.__name__
+                        retry.append(target)
+                pending = retry
+                if not pending or attempt == self._max_attempts:
+                    break
+                logger.warning(
+                    "market data prewarm: %d target(s) failed, retrying in %.0fs", len(pending), backoff
+                )
+                if self._stop.wait(backoff):
+                    break
+                backoff = min(backoff * 2, MAX_PREWARM_BACKOFF_SECONDS)
+            finished.extend(pending)
+
+            run = PrewarmRun(
+                trigger=trigger,
+                started_at=started_at,
+                finished_at=to_kst(self._clock()),
+                results=tuple(
+                    PrewarmTargetResult(
+                        target=target.target,
+                        kind=target.kind,
+                        ok=target.error is None,
+                        attempts=target.attempts,
+                        bar_count=target.bar_count,
+                        error=target.error,
+                    )
+                    for target in finished
+                ),
+            )
+        finally:
+            with self._lock:
+                self._running = False
+
+        with self._lock:
+            self._last_run = run
+        if run.failed:
+            logger.warning("market data prewarm finished with failures: %s", [result.target for result in run.failed])
+        return run
+
+    def _targets(self) -> list[_PendingTarget]:
+        provider = self._provider
+        targets = [
+            _PendingTarget(
+                target=ticker.symbol_code,
+                kind="stock",
+                refresh=lambda code=ticker.symbol_code: provider.refresh_stock_daily_bars(code),
+            )
+            for ticker in provider.list_supported_tickers()
+        ]
+        targets.extend(
+            _PendingTarget(
+                target=benchmark.benchmark_id,
+                kind="benchmark",
+                refresh=lambda benchmark_id=benchmark.benchmark_id: provider.refresh_benchmark_daily_bars(benchmark_id),
+            )
+            for benchmark in provider.list_supported_benchmarks()
+        )
+        return targets
+
+    def _loop(self) -> None:
+        if self._warm_on_start:
+            self._run_safely("startup")
+        while not self._stop.is_set():
+            next_run_at = self.next_run_at()
+            with self._lock:
+                self._next_run_at = next_run_at
+            wait_seconds = (next_run_at - to_kst(self._clock())).total_seconds()
+            if self._stop.wait(max(wait_seconds, 0.0)):
+                break
+            self._run_safely("scheduled")
+
+    def _run_safely(self, trigger: str) -> None:
+        try:
+            self.run_once(trigger=trigger)
+        except Exception:
+            logger.exception("market data prewarm run crashed")
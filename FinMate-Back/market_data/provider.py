@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from .types import BenchmarkDefinition, DailyBarSeries, MarketDataSourceInfo, SupportedTicker
+from .types import (
+    BenchmarkDefinition,
+    DailyBarSeries,
+    MarketDataSourceInfo,
+    MarketDataStatus,
+    MarketInstrumentType,
+    SupportedTicker,
+)
 
 
 class MarketDataProvider(ABC):
@@ -34,3 +41,24 @@ class MarketDataProvider(ABC):
     @abstractmethod
     def get_benchmark_daily_bars(self, ticker: str, *, lookback: int | None = None) -> DailyBarSeries:
         """Return normalized daily OHLCV for the benchmark associated with a symbol."""
+
+    def get_benchmark_daily_bars_by_id(
+        self,
+        benchmark_id: str,
+        *,
+        lookback: int | None = None,
+    ) -> DailyBarSeries:
+        """Return benchmark daily OHLCV by benchmark id so callers can share one series across symbols."""
+        for ticker in self.list_supported_tickers():
+            if ticker.primary_benchmark_id == benchmark_id:
+                return self.get_benchmark_daily_bars(ticker.symbol_code, lookback=lookback)
+        return DailyBarSeries(
+            instrument_type=MarketInstrumentType.BENCHMARK,
+            instrument_code=benchmark_id,
+            data_status=MarketDataStatus.UNAVAILABLE,
+            source=self.source_info,
+            bars=[],
+            benchmark_id=benchmark_id,
+            requested_lookback=lookback,
+            status_reason="No supported ticker is bound to the requested benchmark.",
+        )
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from array import array
 from datetime import date
 from enum import Enum
-from typing import Literal
+from typing import Any, Iterable, Literal, Sequence
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 
 class MarketDataStatus(str, Enum):
@@ -20,7 +21,7 @@ class MarketInstrumentType(str, Enum):
 
 
 class MarketDataSourceInfo(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     provider_id: str = Field(min_length=1)
     provider_name: str = Field(min_length=1)
@@ -29,17 +30,17 @@ class MarketDataSourceInfo(BaseModel):
 
 
 class BenchmarkDefinition(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     benchmark_id: str = Field(min_length=1)
     benchmark_code: str = Field(min_length=1)
     benchmark_name: str = Field(min_length=1)
     market: str = Field(default="KRX", min_length=1)
-    aliases: list[str] = Field(default_factory=list)
+    aliases: tuple[str, ...] = ()
 
     @field_validator("aliases")
     @classmethod
-    def _normalize_aliases(cls, value: list[str]) -> list[str]:
+    def _normalize_aliases(cls, value: tuple[str, ...]) -> tuple[str, ...]:
         cleaned: list[str] = []
         seen: set[str] = set()
         for alias in value:
@@ -48,21 +49,21 @@ class BenchmarkDefinition(BaseModel):
                 continue
             cleaned.append(normalized)
             seen.add(normalized)
-        return cleaned
+        return tuple(cleaned)
 
 
 class SupportedTicker(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     symbol_code: str = Field(pattern=r"^\d{6}$")
     symbol_name: str = Field(min_length=1)
     market: str = Field(default="KRX", min_length=1)
-    aliases: list[str] = Field(default_factory=list)
+    aliases: tuple[str, ...] = ()
     primary_benchmark_id: str = Field(min_length=1)
 
     @field_validator("aliases")
     @classmethod
-    def _normalize_aliases(cls, value: list[str]) -> list[str]:
+    def _normalize_aliases(cls, value: tuple[str, ...]) -> tuple[str, ...]:
         cleaned: list[str] = []
         seen: set[str] = set()
         for alias in value:
@@ -71,11 +72,11 @@ class SupportedTicker(BaseModel):
                 continue
             cleaned.append(normalized)
             seen.add(normalized)
-        return cleaned
+        return tuple(cleaned)
 
 
 class DailyBar(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     date: date
     open: float = Field(gt=0)
@@ -95,6 +96,135 @@ class DailyBar(BaseModel):
         return self
 
 
+class DailyBarColumns:
+    """Struct-of-arrays daily OHLCV series, sorted by date with one row per date.
+
+    Providers parse upstream rows straight into these columns and validate the whole series in
+    one pass instead of running the ``DailyBar``/``DailyBarSeries`` validators per model.
+    Columns are read-only float64/int64 memoryviews, so one instance can be cached and shared;
+    ``tail`` slices the views without copying, and ``DailyBar`` models are materialized once
+    per parent series and reused by every tail cut from it.
+    """
+
+    __slots__ = ("dates", "opens", "highs", "lows", "closes", "volumes", "_bars", "_parent", "_offset")
+
+    def __init__(
+        self,
+        dates: tuple[date, ...],
+        opens: memoryview,
+        highs: memoryview,
+        lows: memoryview,
+        closes: memoryview,
+        volumes: memoryview,
+        *,
+        parent: DailyBarColumns | None = None,
+        offset: int = 0,
+    ) -> None:
+        self.dates = dates
+        self.opens = opens
+        self.highs = highs
+        self.lows = lows
+        self.closes = closes
+        self.volumes = volumes
+        self._bars: tuple[DailyBar, ...] | None = None
+        self._parent = parent
+        self._offset = offset
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[date, float, float, float, float, int]]) -> "DailyBarColumns":
+        """Build validated columns from (date, open, high, low, close, volume) records.
+
+        Later records win when a date repeats, matching the provider's previous dedupe rule.
+        """
+        by_date = {record[0]: record for record in records}
+        ordered = [by_date[bar_date] for bar_date in sorted(by_date)]
+        columns = cls(
+            dates=tuple(record[0] for record in ordered),
+            opens=_readonly_column("d", [record[1] for record in ordered]),
+            highs=_readonly_column("d", [record[2] for record in ordered]),
+            lows=_readonly_column("d", [record[3] for record in ordered]),
+            closes=_readonly_column("d", [record[4] for record in ordered]),
+            volumes=_readonly_column("q", [record[5] for record in ordered]),
+        )
+        columns.validate()
+        return columns
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[DailyBar]) -> "DailyBarColumns":
+        """Wrap already-validated pydantic bars without re-checking them."""
+        columns = cls(
+            dates=tuple(bar.date for bar in bars),
+            opens=_readonly_column("d", [bar.open for bar in bars]),
+            highs=_readonly_column("d", [bar.high for bar in bars]),
+            lows=_readonly_column("d", [bar.low for bar in bars]),
+            closes=_readonly_column("d", [bar.close for bar in bars]),
+            volumes=_readonly_column("q", [bar.volume for bar in bars]),
+        )
+        columns._bars = tuple(bars)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def latest_date(self) -> date | None:
+        return self.dates[-1] if self.dates else None
+
+    def tail(self, count: int) -> "DailyBarColumns":
+        if count >= len(self.dates):
+            return self
+        start = len(self.dates) - max(count, 0)
+        return DailyBarColumns(
+            dates=self.dates[start:],
+            opens=self.opens[start:],
+            highs=self.highs[start:],
+            lows=self.lows[start:],
+            closes=self.closes[start:],
+            volumes=self.volumes[start:],
+            parent=self._parent or self,
+            offset=self._offset + start,
+        )
+
+    def validate(self) -> None:
+        """Apply the ``DailyBar`` and ``DailyBarSeries`` rules to every row at once."""
+        # A positive low plus the range checks below keeps open/high/close positive too.
+        if min(self.lows, default=1.0) <= 0:
+            raise ValueError("prices must be greater than zero")
+        if min(self.volumes, default=0) < 0:
+            raise ValueError("volume must not be negative")
+        for index, (open_price, high, low, close) in enumerate(zip(self.opens, self.highs, self.lows, self.closes)):
+            if low > high:
+                raise ValueError(f"bar {self.dates[index]}: low must not be greater than high")
+            if low > open_price or low > close:
+                raise ValueError(f"bar {self.dates[index]}: low must be less than or equal to open and close")
+            if high < open_price or high < close:
+                raise ValueError(f"bar {self.dates[index]}: high must be greater than or equal to open and close")
+        if any(earlier >= later for earlier, later in zip(self.dates, self.dates[1:])):
+            raise ValueError("bars must be sorted by ascending date without duplicates")
+
+    def to_bars(self) -> list[DailyBar]:
+        return list(self._materialized_bars())
+
+    def _materialized_bars(self) -> tuple[DailyBar, ...]:
+        if self._bars is None:
+            if self._parent is not None:
+                self._bars = self._parent._materialized_bars()[self._offset :]
+            else:
+                construct = DailyBar.model_construct
+                self._bars = tuple(
+                    construct(date=bar_date, open=open_price, high=high, low=low, close=close, volume=volume)
+                    for bar_date, open_price, high, low, close, volume in zip(
+                        self.dates,
+                        self.opens,
+                        self.highs,
+                        self.lows,
+                        self.closes,
+                        self.volumes,
+                    )
+                )
+        return self._bars
+
+
 class DailyBarSeries(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -112,6 +242,31 @@ class DailyBarSeries(BaseModel):
     available_bar_count: int = Field(default=0, ge=0)
     as_of_date: date | None = None
 
+    _columns: DailyBarColumns | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_columns(cls, columns: DailyBarColumns, **fields: Any) -> "DailyBarSeries":
+        """Build a provider-side series from columns that already passed ``DailyBarColumns.validate``.
+
+        Skips pydantic validation entirely, so callers pass typed values (enums, source models).
+        """
+        if (fields.get("data_status") == MarketDataStatus.UNAVAILABLE) == bool(len(columns)):
+            raise ValueError("only unavailable series may be empty")
+        series = cls.model_construct(
+            **fields,
+            bars=columns.to_bars(),
+            available_bar_count=len(columns),
+            as_of_date=fields.get("as_of_date") or columns.latest_date,
+        )
+        series._columns = columns
+        return series
+
+    @property
+    def columns(self) -> DailyBarColumns:
+        if self._columns is None:
+            self._columns = DailyBarColumns.from_bars(self.bars)
+        return self._columns
+
     @model_validator(mode="after")
     def _validate_series(self) -> "DailyBarSeries":
         if self.data_status == MarketDataStatus.UNAVAILABLE and self.bars:
@@ -131,3 +286,7 @@ class DailyBarSeries(BaseModel):
 
         self.available_bar_count = len(self.bars)
         return self
+
+
+def _readonly_column(typecode: str, values: Iterable[float | int]) -> memoryview:
+    return memoryview(array(typecode, values)).toreadonly()
@@ -3,25 +3,32 @@
 # ==============================================================================
 # [필수 라이브러리 및 모듈 임포트]
 # ==============================================================================
-import requests
 import urllib.parse
 from datetime import datetime
 import email.utils as eut
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from config import settings  # 환경 설정 (API Key 등)
+from http_client import http_get  # 호스트별 공유 세션(keep-alive, 재시도)
 from bot import client       # bot.py에서 이미 초기화된 Gemini Client 재사용 (리소스 절약)
 from llm_guardrails import build_prompt_reminder, sanitize_llm_payload
+from llm_cache import cached_llm_text  # 같은 뉴스 목록이면 Gemini 결과 재사용
+from llm_gateway import Priority, run_llm  # 뉴스 갱신은 챗봇/인사이트보다 낮은 우선순위
 
 
 # ==============================================================================
 # [전역 캐시 설정]
 # 외부 API(네이버, Gemini) 호출 횟수를 줄이고 응답 속도를 높이기 위한 간단한 인메모리 캐시입니다.
+# TTL이 지나면 이전 결과를 바로 반환하고, 새 결과는 백그라운드 스레드 하나가 만듭니다. (stale-while-revalidate)
 # ==============================================================================
 _cached_result = None   # 가장 최근에 생성된 분석 결과(JSON) 저장
 _cached_at = 0          # 마지막으로 데이터를 갱신한 시간 (Epoch time)
 CACHE_TTL = 3000        # 캐시 유효 시간 (초 단위, 3000초 = 50분)
+STALE_MAX_AGE = 3 * 3600  # 이보다 오래된 결과는 반환하지 않고 새로 생성 (3시간)
+_refresh_lock = threading.Lock()  # 갱신 작업은 한 번에 하나만 (동시 요청이 같은 작업을 반복하지 않도록)
 
 
 # ==============================================================================
@@ -33,6 +40,8 @@ NAVER_CLIENT_SECRET = settings.NAVER_CLIENT_SECRET
 GEMINI_API_KEY = settings.GEMINI_API_KEY
 MODEL_NAME = settings.GEMINI_MODEL_DEFAULT
 NAVER_BASE_URL = "https://openapi.naver.com/v1/search/news.json"
+NAVER_MAX_WORKERS = 6          # 키워드 검색 동시 실행 수 (네이버 API 초당 호출 한도 고려)
+NAVER_COLLECT_DEADLINE = 8.0   # 전체 키워드 검색 마감 시간 (초). 넘긴 키워드는 건너뜁니다.
 
 
 def search_naver_news(query: str, display: int = 10, start: int = 1, sort: str = "date"):
@@ -49,7 +58,7 @@ def search_naver_news(query: str, display: int = 10, start: int = 1, sort: str =
         "X-Naver-Client-Secret": NAVER_CLIENT_SECRET,
     }
 
-    resp = requests.get(url, headers=headers, timeout=10)
+    resp = http_get(url, headers=headers)
     
     # 통신 실패 시 None 반환 후 로그 출력
     if resp.status_code != 200:
@@ -118,22 +127,53 @@ def extract_news_list(data: dict):
     return result
 
 
-def collect_market_news(queries, per_query: int = 5, sort: str = "date", top_n: int = 10):
+def search_naver_news_batch(queries, per_query: int = 5, sort: str = "date", deadline: float = NAVER_COLLECT_DEADLINE):
+    """
+    여러 키워드를 동시에 검색하고 {키워드: 원본 응답}을 반환합니다.
+    - 최대 NAVER_MAX_WORKERS개를 동시에 요청하고, deadline(초) 안에 끝나지 않은 키워드는 제외합니다.
+    - 실패(비정상 응답, 예외)한 키워드도 제외하므로 느린 키워드 하나가 전체를 붙잡지 않습니다.
+    """
+    queries = list(dict.fromkeys(queries))
+    if not queries:
+        return {}
+
+    pool = ThreadPoolExecutor(max_workers=min(NAVER_MAX_WORKERS, len(queries)), thread_name_prefix="naver-news")
+    futures = {pool.submit(search_naver_news, q, display=per_query, sort=sort): q for q in queries}
+    done, not_done = wait(futures, timeout=deadline)
+    # 마감을 넘긴 요청은 기다리지 않음 (실행 중인 요청은 자체 타임아웃으로 종료)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    results = {}
+    for future in done:
+        q = futures[future]
+        try:
+            raw = future.result()
+        except Exception as exc:
+            print(f"❌ '{q}' 검색 오류: {exc}")
+            continue
+        if raw is not None:
+            results[q] = raw
+    for future in not_done:
+        print(f"⏱️ '{futures[future]}' 검색이 {deadline:.0f}초 안에 끝나지 않아 제외합니다.")
+    return results
+
+
+def collect_market_news(queries, per_query: int = 5, sort: str = "date", top_n: int = 10, deadline: float = NAVER_COLLECT_DEADLINE):
     """
     여러 키워드(queries)로 뉴스를 검색한 뒤, 중요도와 최신성을 기준으로 상위 N개를 선정합니다.
     
     [알고리즘]
-    1. 여러 키워드로 검색된 뉴스들을 하나로 합칩니다.
+    0. 키워드 검색은 동시에 실행하고, 실패하거나 deadline을 넘긴 키워드는 건너뜁니다.
+    1. 여러 키워드로 검색된 뉴스들을 하나로 합칩니다. (응답 도착 순서와 관계없이 queries 순서대로)
     2. 중복 제거: URL이나 제목이 같으면 동일 뉴스로 간주합니다.
     3. 점수(Score) 계산: 여러 키워드에서 동시에 검색된 뉴스일수록 점수를 높게 부여합니다.
     4. 정렬: 점수가 높고, 날짜가 최신인 순서로 정렬하여 상위 top_n개를 반환합니다.
     """
     merged = {}
+    raw_by_query = search_naver_news_batch(queries, per_query=per_query, sort=sort, deadline=deadline)
 
-    for q in queries:
-        # 각 키워드별로 뉴스 검색
-        raw = search_naver_news(q, display=per_query, sort=sort)
-        articles = extract_news_list(raw)
+    for q in dict.fromkeys(queries):
+        articles = extract_news_list(raw_by_query.get(q))
 
         for art in articles:
             # 중복 식별 키 (링크 우선, 없으면 제목)
@@ -141,11 +181,11 @@ def collect_market_news(queries, per_query: int = 5, sort: str = "date", top_n:
 
             if key not in merged:
                 merged[key] = art
-                merged[key]["keywords"] = set()
+                merged[key]["keywords"] = {}  # 키워드 순서 유지를 위해 set 대신 dict 사용
                 merged[key]["score"] = 0
 
             # 해당 뉴스가 발견된 키워드 추가 및 점수 증가
-            merged[key]["keywords"].add(q)
+            merged[key]["keywords"][q] = None
             merged[key]["score"] += 1
 
     # 딕셔너리를 리스트로 변환
@@ -319,23 +359,30 @@ weather 의미:
 {context_text}
 """
 
-    # Gemini API 호출 (bot.py의 client 사용)
-    response = client.models.generate_content(
-        model=MODEL_NAME,
-        contents=prompt,
-    )
+    def _generate() -> str:
+        # Gemini API 호출 (bot.py의 client 사용)
+        response = run_llm(
+            lambda: client.models.generate_content(
+                model=MODEL_NAME,
+                contents=prompt,
+            ),
+            priority=Priority.BACKGROUND,
+        )
 
-    raw = response.text.strip()
+        raw = response.text.strip()
 
-    # AI가 응답을 마크다운 코드 블록(```json ... ```)으로 감쌀 경우 제거
-    if raw.startswith("```"):
-        lines = raw.splitlines()
-        lines = [ln for ln in lines if not ln.strip().startswith("```")]
-        raw = "\n".join(lines).strip()
+        # AI가 응답을 마크다운 코드 블록(```json ... ```)으로 감쌀 경우 제거
+        if raw.startswith("```"):
+            lines = raw.splitlines()
+            lines = [ln for ln in lines if not ln.strip().startswith("```")]
+            raw = "\n".join(lines).strip()
 
-    # 문자열을 Python 딕셔너리로 변환
-    data = json.loads(raw)
-    return sanitize_llm_payload(data, "news_weather")
+        # 문자열을 Python 딕셔너리로 변환 (파싱에 실패하면 예외가 나서 캐시되지 않음)
+        data = json.loads(raw)
+        return json.dumps(sanitize_llm_payload(data, "news_weather"), ensure_ascii=False)
+
+    # 뉴스 목록이 이전과 같으면(같은 프롬프트) 캐시된 결과를 재사용
+    return json.loads(cached_llm_text("news_weather", model=MODEL_NAME, prompt=prompt, generate=_generate))
 
 
 # ==============================================================================
@@ -348,20 +395,50 @@ def get_news_weather():
     
     [로직]
     1. 메모리 캐시를 확인합니다. 유효 기간(50분) 내의 데이터가 있으면 바로 반환합니다.
-    2. 캐시가 없거나 만료되었으면:
+    2. 유효 기간이 지났지만 STALE_MAX_AGE 이내라면 이전 결과를 바로 반환하고,
+       백그라운드 스레드 하나에서 새 결과를 만들어 캐시를 교체합니다.
+    3. 캐시가 없거나 너무 오래되었으면 직접 생성합니다.
+       (동시에 들어온 요청은 락에서 기다렸다가 먼저 만든 결과를 함께 사용)
        a. 네이버 뉴스 API로 주요 키워드(증시, 금리 등) 검색
        b. 검색 결과를 AI에게 전달하여 요약 및 분석 요청
        c. 결과를 캐시에 저장하고 반환
     """
-    global _cached_result, _cached_at
-
     now = time.time()
+    cached_result, cached_at = _cached_result, _cached_at
 
     # 1. 캐시 히트 (Cache Hit): 유효한 데이터가 있으면 즉시 반환
-    if _cached_result is not None and (now - _cached_at) < CACHE_TTL:
-        return _cached_result
+    if cached_result is not None and (now - cached_at) < CACHE_TTL:
+        return cached_result
+
+    # 2. 만료된 캐시 (Stale): 이전 결과를 반환하고 백그라운드에서 갱신
+    if cached_result is not None and (now - cached_at) < STALE_MAX_AGE:
+        if _refresh_lock.acquire(blocking=False):
+            threading.Thread(target=_refresh_in_background, name="news-weather-refresh", daemon=True).start()
+        return cached_result
+
+    # 3. 캐시 미스 (Cache Miss): 데이터를 새로 생성
+    with _refresh_lock:
+        # 기다리는 동안 다른 요청이 이미 갱신했으면 그 결과 사용
+        if _cached_result is not None and (time.time() - _cached_at) < CACHE_TTL:
+            return _cached_result
+        return _rebuild_news_weather()
+
+
+def _refresh_in_background():
+    """get_news_weather 에서 획득한 _refresh_lock 을 넘겨받아 갱신 후 해제합니다."""
+    try:
+        _rebuild_news_weather()
+    except Exception as exc:
+        # 실패해도 이전 캐시는 그대로 두고 다음 요청에서 다시 시도합니다.
+        print(f"⚠️ 뉴스 날씨 백그라운드 갱신 실패: {exc}")
+    finally:
+        _refresh_lock.release()
+
+
+def _rebuild_news_weather():
+    """뉴스 수집 + AI 분석으로 결과를 새로 만들어 캐시에 저장합니다. (_refresh_lock 을 잡은 상태에서 호출)"""
+    global _cached_result, _cached_at
 
-    # 2. 캐시 미스 (Cache Miss): 데이터를 새로 생성
     queries = [
         "코스피",
         "증시",
@@ -394,8 +471,8 @@ def get_news_weather():
     else:
         result = build_news_weather_fallback(top_news)
 
-    # 3. 결과 캐싱 (Cache Update)
+    # 결과 캐싱 (Cache Update)
     _cached_result = result
-    _cached_at = now
+    _cached_at = time.time()
 
     return result
@@ -11,7 +11,15 @@ from .contracts import (
     StrategyRule,
     StrategySymbol,
 )
-from .registry import evaluate_live_strategy, get_live_strategy_evaluator, list_live_strategy_ids
+from .registry import (
+    SymbolMarketSnapshot,
+    evaluate_live_strategies,
+    evaluate_live_strategy,
+    get_live_strategy_evaluator,
+    list_live_strategy_ids,
+    load_symbol_market_snapshot,
+)
+from .screener import SymbolScreenResult, screen_live_strategies
 
 __all__ = [
     "PriceZone",
@@ -24,10 +32,15 @@ __all__ = [
     "StrategyKind",
     "StrategyRule",
     "StrategySymbol",
+    "SymbolMarketSnapshot",
+    "SymbolScreenResult",
+    "evaluate_live_strategies",
     "evaluate_live_strategy",
     "get_live_strategy_evaluator",
     "get_strategy_definition",
     "list_live_strategy_ids",
     "list_strategy_definitions",
     "load_strategy_catalog",
+    "load_symbol_market_snapshot",
+    "screen_live_strategies",
 ]
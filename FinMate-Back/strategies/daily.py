@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate
+from typing import Callable
 
 from market_data.types import DailyBarSeries
 
@@ -18,22 +22,52 @@ class BreakoutAnchor:
     support: float
 
 
+@dataclass(frozen=True)
+class _SparseTable:
+    """Idempotent range query table: level k holds pick() over windows of 2**k values."""
+
+    levels: tuple[array, ...]
+    pick: Callable[[float, float], float]
+
+    @classmethod
+    def build(cls, values: memoryview, pick: Callable[[float, float], float]) -> "_SparseTable":
+        levels = [array("d", values)]
+        span = 1
+        while span * 2 <= len(values):
+            previous = levels[-1]
+            levels.append(array("d", map(pick, previous[: len(previous) - span], previous[span:])))
+            span *= 2
+        return cls(levels=tuple(levels), pick=pick)
+
+    def query(self, start: int, end: int) -> float:
+        level = (end - start).bit_length() - 1
+        values = self.levels[level]
+        return self.pick(values[start], values[end - (1 << level)])
+
+
 @dataclass(frozen=True)
 class DailySeriesView:
+    """Read-only float64/int64 columns over a daily bar series.
+
+    Prefix sums and sparse tables are built lazily on first use and then shared by every
+    evaluator reading the same view, so window averages and rolling extremes are O(1).
+    """
+
     series: DailyBarSeries
-    closes: tuple[float, ...]
-    highs: tuple[float, ...]
-    lows: tuple[float, ...]
-    volumes: tuple[int, ...]
+    closes: memoryview
+    highs: memoryview
+    lows: memoryview
+    volumes: memoryview
 
     @classmethod
     def from_series(cls, series: DailyBarSeries) -> "DailySeriesView":
+        columns = series.columns
         return cls(
             series=series,
-            closes=tuple(bar.close for bar in series.bars),
-            highs=tuple(bar.high for bar in series.bars),
-            lows=tuple(bar.low for bar in series.bars),
-            volumes=tuple(bar.volume for bar in series.bars),
+            closes=columns.closes,
+            highs=columns.highs,
+            lows=columns.lows,
+            volumes=columns.volumes,
         )
 
     @property
@@ -53,16 +87,18 @@ class DailySeriesView:
         return self.volumes[-1]
 
     def sma(self, window: int, *, offset: int = 0) -> float | None:
-        values = self._window_slice(self.closes, window, exclude_recent=offset)
-        if values is None:
+        bounds = self._window_bounds(len(self.closes), window, exclude_recent=offset)
+        if bounds is None:
             return None
-        return sum(values) / len(values)
+        start, end = bounds
+        return (self._close_prefix_sums[end] - self._close_prefix_sums[start]) / window
 
     def average_volume(self, window: int, *, offset: int = 0) -> float | None:
-        values = self._window_slice(self.volumes, window, exclude_recent=offset)
-        if values is None:
+        bounds = self._window_bounds(len(self.volumes), window, exclude_recent=offset)
+        if bounds is None:
             return None
-        return sum(values) / len(values)
+        start, end = bounds
+        return (self._volume_prefix_sums[end] - self._volume_prefix_sums[start]) / window
 
     def volume_ratio(self, window: int, *, offset: int = 0) -> float | None:
         average_volume = self.average_volume(window, offset=offset)
@@ -74,20 +110,16 @@ class DailySeriesView:
         return self.volumes[target_index] / average_volume
 
     def rolling_high(self, window: int, *, exclude_recent: int = 0) -> float | None:
-        values = self._window_slice(self.highs, window, exclude_recent=exclude_recent)
-        return max(values) if values is not None else None
+        return self._range_query(self._high_max_table, len(self.highs), window, exclude_recent)
 
     def rolling_low(self, window: int, *, exclude_recent: int = 0) -> float | None:
-        values = self._window_slice(self.lows, window, exclude_recent=exclude_recent)
-        return min(values) if values is not None else None
+        return self._range_query(self._low_min_table, len(self.lows), window, exclude_recent)
 
     def rolling_close_high(self, window: int, *, exclude_recent: int = 0) -> float | None:
-        values = self._window_slice(self.closes, window, exclude_recent=exclude_recent)
-        return max(values) if values is not None else None
+        return self._range_query(self._close_max_table, len(self.closes), window, exclude_recent)
 
     def rolling_close_low(self, window: int, *, exclude_recent: int = 0) -> float | None:
-        values = self._window_slice(self.closes, window, exclude_recent=exclude_recent)
-        return min(values) if values is not None else None
+        return self._range_query(self._close_min_table, len(self.closes), window, exclude_recent)
 
     def range_box(self, window: int, *, exclude_recent: int = 0) -> RangeBox | None:
         high = self.rolling_high(window, exclude_recent=exclude_recent)
@@ -104,27 +136,57 @@ class DailySeriesView:
         return BreakoutAnchor(resistance=resistance, support=support)
 
     def any_close_below(self, level: float, *, window: int, exclude_recent: int = 0) -> bool:
-        values = self._window_slice(self.closes, window, exclude_recent=exclude_recent)
-        return any(value < level for value in values or ())
+        lowest_close = self.rolling_close_low(window, exclude_recent=exclude_recent)
+        return lowest_close is not None and lowest_close < level
 
     def last_n_closes_above(self, level: float, *, window: int) -> bool:
-        values = self._window_slice(self.closes, window, exclude_recent=0)
-        if values is None:
-            return False
-        return all(value > level for value in values)
+        lowest_close = self.rolling_close_low(window)
+        return lowest_close is not None and lowest_close > level
 
-    def _window_slice(
+    @cached_property
+    def _close_prefix_sums(self) -> array:
+        return array("d", accumulate(self.closes, initial=0.0))
+
+    @cached_property
+    def _volume_prefix_sums(self) -> array:
+        return array("q", accumulate(self.volumes, initial=0))
+
+    @cached_property
+    def _high_max_table(self) -> _SparseTable:
+        return _SparseTable.build(self.highs, max)
+
+    @cached_property
+    def _low_min_table(self) -> _SparseTable:
+        return _SparseTable.build(self.lows, min)
+
+    @cached_property
+    def _close_max_table(self) -> _SparseTable:
+        return _SparseTable.build(self.closes, max)
+
+    @cached_property
+    def _close_min_table(self) -> _SparseTable:
+        return _SparseTable.build(self.closes, min)
+
+    def _range_query(
         self,
-        values: tuple[float, ...] | tuple[int, ...],
+        table: _SparseTable,
+        length: int,
         window: int,
-        *,
-        exclude_recent: int = 0,
-    ) -> tuple[float, ...] | tuple[int, ...] | None:
+        exclude_recent: int,
+    ) -> float | None:
+        bounds = self._window_bounds(length, window, exclude_recent=exclude_recent)
+        if bounds is None:
+            return None
+        return table.query(*bounds)
+
+    @staticmethod
+    def _window_bounds(length: int, window: int, *, exclude_recent: int = 0) -> tuple[int, int] | None:
         if window <= 0 or exclude_recent < 0:
             return None
 
-        end = len(values) - exclude_recent
+        end = length - exclude_recent
         start = end - window
         if start < 0 or end <= 0:
             return None
-        return values[start:end]
+        return start, end
+
@@ -29,6 +29,14 @@ from .contracts import (
 from .daily import DailySeriesView
 
 
+@dataclass(frozen=True)
+class SymbolMarketSnapshot:
+    symbol: StrategySymbol
+    stock_view: DailySeriesView
+    benchmark_view: DailySeriesView
+    data_status: MarketDataStatus
+
+
 @dataclass(frozen=True)
 class EvaluationContext:
     strategy: StrategyDefinition
@@ -43,30 +51,60 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def build_evaluation_context(
+def load_symbol_market_snapshot(
     provider: MarketDataProvider,
-    strategy: StrategyDefinition,
     ticker: str,
     *,
-    evaluated_at: datetime | None = None,
-) -> EvaluationContext:
+    benchmark_view: DailySeriesView | None = None,
+) -> SymbolMarketSnapshot:
     normalized = provider.normalize_ticker(ticker)
     if normalized is None:
         raise ValueError("Ticker is not supported by the current provider.")
 
     stock_series = provider.get_stock_daily_bars(normalized.symbol_code)
-    benchmark_series = provider.get_benchmark_daily_bars(normalized.symbol_code)
+    if benchmark_view is None:
+        benchmark_view = DailySeriesView.from_series(provider.get_benchmark_daily_bars(normalized.symbol_code))
 
-    return EvaluationContext(
-        strategy=strategy,
-        symbol=StrategySymbol(
+    return build_symbol_market_snapshot(
+        StrategySymbol(
             symbol_code=normalized.symbol_code,
             symbol_name=normalized.symbol_name,
             market=normalized.market,
         ),
         stock_view=DailySeriesView.from_series(stock_series),
-        benchmark_view=DailySeriesView.from_series(benchmark_series),
-        data_status=combine_data_status(stock_series.data_status, benchmark_series.data_status),
+        benchmark_view=benchmark_view,
+    )
+
+
+def build_symbol_market_snapshot(
+    symbol: StrategySymbol,
+    *,
+    stock_view: DailySeriesView,
+    benchmark_view: DailySeriesView,
+) -> SymbolMarketSnapshot:
+    return SymbolMarketSnapshot(
+        symbol=symbol,
+        stock_view=stock_view,
+        benchmark_view=benchmark_view,
+        data_status=combine_data_status(stock_view.series.data_status, benchmark_view.series.data_status),
+    )
+
+
+def build_evaluation_context(
+    provider: MarketDataProvider,
+    strategy: StrategyDefinition,
+    ticker: str,
+    *,
+    evaluated_at: datetime | None = None,
+    snapshot: SymbolMarketSnapshot | None = None,
+) -> EvaluationContext:
+    snapshot = snapshot or load_symbol_market_snapshot(provider, ticker)
+    return EvaluationContext(
+        strategy=strategy,
+        symbol=snapshot.symbol,
+        stock_view=snapshot.stock_view,
+        benchmark_view=snapshot.benchmark_view,
+        data_status=snapshot.data_status,
         evaluated_at=evaluated_at or _utc_now(),
     )
 
@@ -634,6 +672,7 @@ def evaluate_live_strategy(
     strategy_id: str,
     ticker: str,
     evaluated_at: datetime | None = None,
+    snapshot: SymbolMarketSnapshot | None = None,
 ) -> StrategyEvaluation:
     strategy = get_strategy_definition(strategy_id)
     if strategy is None:
@@ -650,6 +689,7 @@ def evaluate_live_strategy(
         strategy,
         ticker,
         evaluated_at=evaluated_at,
+        snapshot=snapshot,
     )
     if (
         context.data_status == MarketDataStatus.UNAVAILABLE
@@ -664,3 +704,25 @@ def evaluate_live_strategy(
     ):
         return _data_unavailable_evaluation(context)
     return evaluator(context)
+
+
+def evaluate_live_strategies(
+    provider: MarketDataProvider,
+    *,
+    ticker: str,
+    evaluated_at: datetime | None = None,
+    snapshot: SymbolMarketSnapshot | None = None,
+) -> list[StrategyEvaluation]:
+    """Evaluate every live strategy for one symbol against a single market snapshot."""
+    snapshot = snapshot or load_symbol_market_snapshot(provider, ticker)
+    evaluated_at = evaluated_at or _utc_now()
+    return [
+        evaluate_live_strategy(
+            provider,
+            strategy_id=strategy_id,
+            ticker=ticker,
+            evaluated_at=evaluated_at,
+            snapshot=snapshot,
+        )
+        for strategy_id in list_live_strategy_ids()
+    ]
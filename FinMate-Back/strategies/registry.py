@@ -1,7 +1,17 @@
-from .live import evaluate_live_strategy, get_live_strategy_evaluator, list_live_strategy_ids
+from .live import (
+    SymbolMarketSnapshot,
+    evaluate_live_strategies,
+    evaluate_live_strategy,
+    get_live_strategy_evaluator,
+    list_live_strategy_ids,
+    load_symbol_market_snapshot,
+)
 
 __all__ = [
+    "SymbolMarketSnapshot",
+    "evaluate_live_strategies",
     "evaluate_live_strategy",
     "get_live_strategy_evaluator",
     "list_live_strategy_ids",
+    "load_symbol_market_snapshot",
 ]
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterator, Sequence
+
+from config import settings
+from market_data.provider import MarketDataProvider
+from market_data.types import DailyBarSeries, MarketDataStatus, SupportedTicker
+
+from .contracts import StrategyEvaluation, StrategySymbol
+from .daily import DailySeriesView
+from .live import build_symbol_market_snapshot, evaluate_live_strategies
+
+
+logger = logging.getLogger(__name__)
+
+SCREEN_FAILED_REASON = "Screening failed for this symbol. Try again later."
+
+
+@dataclass(frozen=True)
+class SymbolScreenResult:
+    position: int
+    query: str
+    symbol: StrategySymbol | None
+    data_status: MarketDataStatus
+    fetch_ms: float
+    evaluate_ms: float
+    evaluations: list[StrategyEvaluation] = field(default_factory=list)
+    status_reason: str | None = None
+
+    @property
+    def elapsed_ms(self) -> float:
+        return self.fetch_ms + self.evaluate_ms
+
+
+class _SharedBenchmarkViews:
+    """Fetch each benchmark series once per screen, even when workers ask for it concurrently."""
+
+    def __init__(self, provider: MarketDataProvider) -> None:
+        self._provider = provider
+        self._lock = threading.Lock()
+        self._views: dict[str, Future] = {}
+
+    def get(self, benchmark_id: str) -> DailySeriesView:
+        with self._lock:
+            pending = self._views.get(benchmark_id)
+            is_owner = pending is None
+            if is_owner:
+                pending = Future()
+                self._views[benchmark_id] = pending
+
+        if is_owner:
+            try:
+                series = self._provider.get_benchmark_daily_bars_by_id(benchmark_id)
+                pending.set_result(DailySeriesView.from_series(series))
+            except BaseException as exc:
+                pending.set_exception(exc)
+        return pending.result()
+
+
+def screen_live_strategies(
+    provider: MarketDataProvider,
+    queries: Sequence[str],
+    *,
+    max_workers: int | None = None,
+    evaluated_at: datetime | None = None,
+) -> Iterator[SymbolScreenResult]:
+    """Evaluate every live strategy for each query, yielding results as symbols finish.
+
+    Stock series are fetched on a bounded thread pool; benchmark series are fetched once per
+    benchmark id and shared by every symbol that points at it. ``max_workers`` defaults to
+    ``settings.STRATEGY_SCREEN_MAX_CONCURRENCY``.
+    """
+    if max_workers is None:
+        max_workers = settings.STRATEGY_SCREEN_MAX_CONCURRENCY
+    evaluated_at = evaluated_at or _utc_now()
+    benchmarks = _SharedBenchmarkViews(provider)
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="strategy-screen")
+    try:
+        futures = [
+            executor.submit(_screen_symbol, provider, benchmarks, position, query, evaluated_at)
+            for position, query in enumerate(queries)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _screen_symbol(
+    provider: MarketDataProvider,
+    benchmarks: _SharedBenchmarkViews,
+    position: int,
+    query: str,
+    evaluated_at: datetime,
+) -> SymbolScreenResult:
+    started = time.perf_counter()
+    try:
+        normalized = provider.normalize_ticker(query)
+        stock_series = provider.get_stock_daily_bars(normalized.symbol_code if normalized else query)
+        symbol, benchmark_id = _resolve_screen_symbol(normalized, stock_series)
+        if symbol is None or benchmark_id is None:
+            return SymbolScreenResult(
+                position=position,
+                query=query,
+                symbol=None,
+                data_status=MarketDataStatus.UNAVAILABLE,
+                fetch_ms=_elapsed_ms(started),
+                evaluate_ms=0.0,
+                status_reason=stock_series.status_reason or "Unsupported symbol for the current Korean daily-bar universe.",
+            )
+
+        snapshot = build_symbol_market_snapshot(
+            symbol,
+            stock_view=DailySeriesView.from_series(stock_series),
+            benchmark_view=benchmarks.get(benchmark_id),
+        )
+        fetched = time.perf_counter()
+        evaluations = evaluate_live_strategies(
+            provider,
+            ticker=symbol.symbol_code,
+            evaluated_at=evaluated_at,
+            snapshot=snapshot,
+        )
+    except Exception:
+        # 예외 메시지에는 업스트림 URL/제공자 응답이 섞일 수 있어 로그에만 남깁니다.
+        logger.exception("strategy screen failed for %r", query)
+        return SymbolScreenResult(
+            position=position,
+            query=query,
+            symbol=None,
+            data_status=MarketDataStatus.UNAVAILABLE,
+            fetch_ms=_elapsed_ms(started),
+            evaluate_ms=0.0,
+            status_reason=SCREEN_FAILED_REASON,
+        )
+
+    return SymbolScreenResult(
+        position=position,
+        query=query,
+        symbol=symbol,
+        data_status=snapshot.data_status,
+        fetch_ms=(fetched - started) * 1000,
+        evaluate_ms=_elapsed_ms(fetched),
+        evaluations=evaluations,
+        status_reason=stock_series.status_reason,
+    )
+
+
+def _resolve_screen_symbol(
+    normalized: SupportedTicker | None,
+    stock_series: DailyBarSeries,
+) -> tuple[StrategySymbol | None, str | None]:
+    if normalized is not None:
+        symbol = StrategySymbol(
+            symbol_code=normalized.symbol_code,
+            symbol_name=normalized.symbol_name,
+            market=normalized.market,
+        )
+        return symbol, normalized.primary_benchmark_id
+
+    # Codes outside the curated universe are accepted when the provider could bind them to a benchmark.
+    code = stock_series.instrument_code
+    if stock_series.benchmark_id is None or not code.isdigit() or len(code) != 6:
+        return None, None
+    symbol = StrategySymbol(
+        symbol_code=code,
+        symbol_name=stock_series.instrument_name or code,
+        market=stock_series.market,
+    )
+    return symbol, stock_series.benchmark_id
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
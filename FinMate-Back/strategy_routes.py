@@ -1,25 +1,29 @@
 from __future__ import annotations
 
+import time
 from datetime import date, datetime, timezone
 from functools import lru_cache
-from typing import Literal
+from typing import Iterator, Literal
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from config import settings
 from market_data.mock_provider import MockMarketDataProvider
+from market_data.prewarm import MarketDataPrewarmer, PrewarmRun
 from market_data.provider import MarketDataProvider
-from market_data.public_data_provider import get_public_data_market_data_provider
+from market_data.public_data_provider import PublicDataMarketDataProvider, get_public_data_market_data_provider
 from market_data.types import MarketDataSourceInfo, MarketDataStatus
 from strategies import (
     StrategyActivationState,
     StrategyCheckStatus,
     StrategyDefinition,
     StrategyEvaluation,
-    evaluate_live_strategy,
-    list_live_strategy_ids,
+    SymbolScreenResult,
+    evaluate_live_strategies,
     load_strategy_catalog,
+    screen_live_strategies,
 )
 from strategies.catalog import StrategyCatalogPayload
 from strategies.checks import combine_data_status
@@ -43,6 +47,28 @@ class StrategyEvaluateRequest(BaseModel):
         return cleaned
 
 
+class StrategyScreenRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    universe: Literal["custom", "supported"] = "custom"
+    symbols: list[str] = Field(default_factory=list)
+    max_concurrency: int | None = Field(default=None, ge=1)
+
+    @field_validator("symbols")
+    @classmethod
+    def _normalize_symbols(cls, value: list[str]) -> list[str]:
+        cleaned = [symbol.strip() for symbol in value]
+        if any(not symbol for symbol in cleaned):
+            raise ValueError("symbols must not contain blank values")
+        return list(dict.fromkeys(cleaned))
+
+    @model_validator(mode="after")
+    def _require_symbols_for_custom_universe(self) -> "StrategyScreenRequest":
+        if self.universe == "custom" and not self.symbols:
+            raise ValueError("symbols are required when universe is 'custom'")
+        return self
+
+
 class StrategyEvaluationGroup(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -92,6 +118,64 @@ class StrategyEvaluateResponse(BaseModel):
     non_live_catalog_groups: list[NonLiveCatalogGroup]
 
 
+class StrategyScreenSymbolResult(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    query: str
+    symbol: StrategySymbol | None = None
+    data_status: MarketDataStatus
+    status_reason: str | None = None
+    fetch_ms: float = Field(ge=0)
+    evaluate_ms: float = Field(ge=0)
+    elapsed_ms: float = Field(ge=0)
+    live_evaluation_groups: list[StrategyEvaluationGroup]
+
+
+class StrategyScreenResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    catalog_version: str = Field(min_length=1)
+    timeframe: Literal["1d"] = "1d"
+    evaluated_at: datetime
+    data_status: MarketDataStatus
+    source: MarketDataSourceInfo
+    max_concurrency: int = Field(ge=1)
+    elapsed_ms: float = Field(ge=0)
+    results: list[StrategyScreenSymbolResult]
+
+
+class MarketDataPrewarmTargetResult(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    target: str
+    kind: Literal["stock", "benchmark"]
+    ok: bool
+    attempts: int = Field(ge=0)
+    bar_count: int = Field(ge=0)
+    error: str | None = None
+
+
+class MarketDataPrewarmRun(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    trigger: str
+    started_at: datetime
+    finished_at: datetime
+    elapsed_ms: float = Field(ge=0)
+    warmed_count: int = Field(ge=0)
+    failed_count: int = Field(ge=0)
+    results: list[MarketDataPrewarmTargetResult]
+
+
+class MarketDataPrewarmStatusResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool
+    running: bool
+    next_run_at: datetime | None = None
+    last_run: MarketDataPrewarmRun | None = None
+
+
 _LIVE_GROUPS: tuple[tuple[str, str], ...] = (
     ("applicable", "적용 가능"),
     ("conditions_insufficient", "지금은 조건 부족"),
@@ -112,6 +196,26 @@ def get_market_data_provider() -> MarketDataProvider:
     return MockMarketDataProvider()
 
 
+@lru_cache(maxsize=1)
+def get_market_data_prewarmer() -> MarketDataPrewarmer | None:
+    provider = get_market_data_provider()
+    if not settings.MARKET_DATA_PREWARM_ENABLED or not isinstance(provider, PublicDataMarketDataProvider):
+        return None
+    return MarketDataPrewarmer(provider, delay_seconds=settings.MARKET_DATA_PREWARM_DELAY_SECONDS)
+
+
+def start_market_data_prewarmer() -> None:
+    prewarmer = get_market_data_prewarmer()
+    if prewarmer is not None:
+        prewarmer.start()
+
+
+def stop_market_data_prewarmer() -> None:
+    prewarmer = get_market_data_prewarmer()
+    if prewarmer is not None:
+        prewarmer.stop()
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -203,6 +307,45 @@ def _build_symbol_quote(provider: MarketDataProvider, ticker_code: str) -> Strat
     )
 
 
+def _resolve_screen_queries(provider: MarketDataProvider, payload: StrategyScreenRequest) -> list[str]:
+    queries = list(payload.symbols)
+    if payload.universe == "supported":
+        supported_codes = [ticker.symbol_code for ticker in provider.list_supported_tickers()]
+        queries = supported_codes + queries
+
+    # "005930"과 "005930.KS"처럼 같은 종목을 가리키는 입력은 처음 것만 평가합니다.
+    unique: dict[str, str] = {}
+    for query in queries:
+        normalized = provider.normalize_ticker(query)
+        unique.setdefault(normalized.symbol_code if normalized else query.upper(), query)
+    queries = list(unique.values())
+
+    if len(queries) > settings.STRATEGY_SCREEN_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {settings.STRATEGY_SCREEN_MAX_SYMBOLS} symbols can be screened per request.",
+        )
+    return queries
+
+
+def _resolve_screen_concurrency(payload: StrategyScreenRequest) -> int:
+    limit = max(settings.STRATEGY_SCREEN_MAX_CONCURRENCY, 1)
+    return min(payload.max_concurrency or limit, limit)
+
+
+def _build_screen_symbol_result(result: SymbolScreenResult) -> StrategyScreenSymbolResult:
+    return StrategyScreenSymbolResult(
+        query=result.query,
+        symbol=result.symbol,
+        data_status=result.data_status,
+        status_reason=result.status_reason,
+        fetch_ms=round(result.fetch_ms, 3),
+        evaluate_ms=round(result.evaluate_ms, 3),
+        elapsed_ms=round(result.elapsed_ms, 3),
+        live_evaluation_groups=_build_live_evaluation_groups(result.evaluations),
+    )
+
+
 @router.get("/catalog", response_model=StrategyCatalogPayload)
 def get_strategy_catalog() -> StrategyCatalogPayload:
     return load_strategy_catalog()
@@ -230,15 +373,11 @@ def evaluate_strategies(
     symbol = _build_symbol_or_422(provider, payload.symbol)
     evaluated_at = _utc_now()
 
-    evaluations = [
-        evaluate_live_strategy(
-            provider,
-            strategy_id=strategy_id,
-            ticker=symbol.symbol_code,
-            evaluated_at=evaluated_at,
-        )
-        for strategy_id in list_live_strategy_ids()
-    ]
+    evaluations = evaluate_live_strategies(
+        provider,
+        ticker=symbol.symbol_code,
+        evaluated_at=evaluated_at,
+    )
 
     overall_data_status = combine_data_status(*(evaluation.data_status for evaluation in evaluations))
 
@@ -251,3 +390,92 @@ def evaluate_strategies(
         live_evaluation_groups=_build_live_evaluation_groups(evaluations),
         non_live_catalog_groups=_build_non_live_catalog_groups(),
     )
+
+
+@router.post("/screen", response_model=StrategyScreenResponse)
+def screen_strategies(
+    payload: StrategyScreenRequest,
+    provider: MarketDataProvider = Depends(get_market_data_provider),
+) -> StrategyScreenResponse:
+    queries = _resolve_screen_queries(provider, payload)
+    max_concurrency = _resolve_screen_concurrency(payload)
+    evaluated_at = _utc_now()
+    started = time.perf_counter()
+
+    screened = sorted(
+        screen_live_strategies(
+            provider,
+            queries,
+            max_workers=max_concurrency,
+            evaluated_at=evaluated_at,
+        ),
+        key=lambda result: result.position,
+    )
+
+    return StrategyScreenResponse(
+        catalog_version=load_strategy_catalog().version,
+        evaluated_at=evaluated_at,
+        data_status=combine_data_status(*(result.data_status for result in screened)),
+        source=provider.source_info,
+        max_concurrency=max_concurrency,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+        results=[_build_screen_symbol_result(result) for result in screened],
+    )
+
+
+@router.post("/screen/stream")
+def stream_screen_strategies(
+    payload: StrategyScreenRequest,
+    provider: MarketDataProvider = Depends(get_market_data_provider),
+) -> StreamingResponse:
+    queries = _resolve_screen_queries(provider, payload)
+    max_concurrency = _resolve_screen_concurrency(payload)
+    evaluated_at = _utc_now()
+
+    def _ndjson_lines() -> Iterator[str]:
+        for result in screen_live_strategies(
+            provider,
+            queries,
+            max_workers=max_concurrency,
+            evaluated_at=evaluated_at,
+        ):
+            yield _build_screen_symbol_result(result).model_dump_json() + "\n"
+
+    return StreamingResponse(_ndjson_lines(), media_type="application/x-ndjson")
+
+
+@router.get("/market-data/prewarm", response_model=MarketDataPrewarmStatusResponse)
+def get_market_data_prewarm_status(
+    prewarmer: MarketDataPrewarmer | None = Depends(get_market_data_prewarmer),
+) -> MarketDataPrewarmStatusResponse:
+    if prewarmer is None:
+        return MarketDataPrewarmStatusResponse(enabled=False, running=False)
+    status = prewarmer.status()
+    return MarketDataPrewarmStatusResponse(
+        enabled=status.enabled,
+        running=status.running,
+        next_run_at=status.next_run_at,
+        last_run=_build_prewarm_run(status.last_run) if status.last_run else None,
+    )
+
+
+def _build_prewarm_run(run: PrewarmRun) -> MarketDataPrewarmRun:
+    return MarketDataPrewarmRun(
+        trigger=run.trigger,
+        started_at=run.started_at,
+        finished_at=run.finished_at,
+        elapsed_ms=round(run.elapsed_ms, 3),
+        warmed_count=len(run.results) - len(run.failed),
+        failed_count=len(run.failed),
+        results=[
+            MarketDataPrewarmTargetResult(
+                target=result.target,
+                kind=result.kind,
+                ok=result.ok,
+                attempts=result.attempts,
+                bar_count=result.bar_count,
+                error=result.error,
+            )
+            for result in run.results
+        ],
+    )
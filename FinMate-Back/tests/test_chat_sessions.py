@@ -0,0 +1,141 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from chat_sessions import MAX_RECENT_TURNS, ChatSessionStore, estimate_tokens
+
+
+class ChatSessionStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1_000_000.0
+        self.store = ChatSessionStore(max_sessions=2, token_budget=200, ttl_seconds=3600, clock=lambda: self.now)
+
+    def test_new_session_is_seeded_from_client_history(self) -> None:
+        session = self.store.get_or_create(None, [{"role": "user", "text": "안녕"}, {"role": "ai", "text": "반가워요"}])
+
+        again = self.store.get_or_create(session.id, [{"role": "user", "text": "무시되는 기록"}])
+
+        self.assertEqual(again.history(), [{"role": "user", "text": "안녕"}, {"role": "ai", "text": "반가워요"}])
+
+    def test_prompt_size_stays_flat_over_long_conversations(self) -> None:
+        session = self.store.get_or_create(None)
+        sizes = []
+        for turn in range(40):
+            session = self.store.append_turn(session.id, f"{turn}번째 질문입니다. 금리와 환율의 관계를 알려 주세요.", "답변 " * 30)
+            sizes.append(estimate_tokens(session.summary) + sum(estimate_tokens(t["text"]) for t in session.turns))
+
+        self.assertLessEqual(max(sizes), 200)
+        self.assertEqual(session.turns[-1]["role"], "ai")
+        self.assertIn("39번째 질문", session.turns[-2]["text"])
+        self.assertTrue(session.summary.startswith("- "))
+
+    def test_turns_past_the_prompt_window_are_folded_not_dropped(self) -> None:
+        store = ChatSessionStore(token_budget=10_000, clock=lambda: self.now)
+        session = store.get_or_create(None)
+        for turn in range(6):
+            session = store.append_turn(session.id, f"질문{turn}", f"답{turn}")
+
+        self.assertEqual(len(session.turns), MAX_RECENT_TURNS)
+        folded = session.summary.split("\n")
+        self.assertEqual(folded[0], "- 사용자: 질문0")
+        self.assertEqual(len(folded) + len(session.turns), 12)
+
+    def test_concurrent_turns_on_one_session_are_all_kept(self) -> None:
+        store = ChatSessionStore(token_budget=100_000, clock=lambda: self.now)
+        start = threading.Barrier(8)
+        shared = store.get_or_create(None).id
+
+        def talk(worker):
+            start.wait()
+            for turn in range(10):
+                store.append_turn(shared, f"{worker}-{turn}", "답")
+
+        threads = [threading.Thread(target=talk, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        session = store.get(shared)
+        self.assertEqual(len(session.turns) + len(session.summary.split("\n")), 160)
+
+    def test_least_recently_used_session_is_evicted(self) -> None:
+        first = self.store.get_or_create(None)
+        second = self.store.get_or_create(None)
+        self.store.get(first.id)
+        self.store.get_or_create(None)
+
+        self.assertIsNotNone(self.store.get(first.id))
+        self.assertIsNone(self.store.get(second.id))
+
+    def test_idle_sessions_expire(self) -> None:
+        session = self.store.append_turn(self.store.get_or_create(None).id, "질문", "답변")
+
+        self.now += 3601
+
+        self.assertIsNone(self.store.get(session.id))
+        renewed = self.store.get_or_create(session.id)
+        self.assertEqual(renewed.turns, [])
+        self.assertNotEqual(renewed.id, session.id)
+
+    def test_unknown_client_id_gets_a_server_minted_session(self) -> None:
+        first = self.store.get_or_create("default", [{"role": "user", "text": "내 질문"}])
+        second = self.store.get_or_create("default")
+
+        self.assertRegex(first.id, r"^[0-9a-f]{32}$")
+        self.assertNotEqual(first.id, "default")
+        self.assertNotEqual(second.id, first.id)
+        self.assertEqual(second.turns, [])
+
+    def test_sqlite_persistence_survives_restart(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chat_sessions.db")
+            first = ChatSessionStore(path=path, clock=lambda: self.now)
+            saved = first.append_turn(first.get_or_create(None).id, "기준금리가 뭐야?", "한국은행이 정하는 정책 금리예요.")
+
+            restarted = ChatSessionStore(path=path, clock=lambda: self.now)
+            session = restarted.get(saved.id)
+
+        self.assertEqual(session.turns[0]["text"], "기준금리가 뭐야?")
+
+
+class ChatEndpointSessionTest(unittest.TestCase):
+    def test_follow_up_turn_uses_server_history(self) -> None:
+        from fastapi.testclient import TestClient
+
+        import main
+
+        store = ChatSessionStore()
+        seen = []
+
+        def fake_reply(mode, message, history, summary=""):
+            seen.append(history)
+            return f"{message}에 대한 답변"
+
+        with patch("main.get_chat_session_store", return_value=store), patch(
+            "main._glossary_answer", return_value=None
+        ), patch("main.generate_finmate_reply", side_effect=fake_reply):
+            client = TestClient(main.app)
+            first = client.post("/api/chat", json={"mode": "easy", "message": "금리"}).json()
+            client.post("/api/chat", json={"mode": "easy", "message": "환율", "sessionId": first["sessionId"]})
+
+        self.assertEqual(seen[0], [])
+        self.assertEqual(seen[1], [{"role": "user", "text": "금리"}, {"role": "ai", "text": "금리에 대한 답변"}])
+
+    def test_malformed_session_ids_are_rejected(self) -> None:
+        from fastapi.testclient import TestClient
+
+        import main
+
+        client = TestClient(main.app)
+        chat = client.post("/api/chat", json={"mode": "easy", "message": "금리", "sessionId": "default"})
+        delete = client.delete("/api/chat/sessions/" + "x" * 300)
+
+        self.assertEqual(chat.status_code, 422)
+        self.assertEqual(delete.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
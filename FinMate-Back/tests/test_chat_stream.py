@@ -0,0 +1,146 @@
+import json
+import threading
+import unittest
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import bot
+from chat_sessions import ChatSessionStore
+from llm_cache import LLMResponseCache
+from llm_gateway import LLMRateLimited
+from llm_guardrails import SAFE_FALLBACKS
+
+
+def fake_client(chunks):
+    session = MagicMock()
+    session.send_message_stream.return_value = iter(SimpleNamespace(text=chunk) for chunk in chunks)
+    client = MagicMock()
+    client.chats.create.return_value = session
+    return client
+
+
+class StreamFinmateReplyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = LLMResponseCache()
+        cache_patch = patch("bot.get_llm_cache", return_value=self.cache)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def events(self, chunks, message="금리와 주가 관계 알려줘"):
+        with patch("bot.client", fake_client(chunks)) as client:
+            events = list(bot.stream_finmate_reply("easy", message, []))
+        return events, client
+
+    def test_deltas_add_up_to_the_final_reply_and_are_cached(self) -> None:
+        events, _ = self.events(["금리가 오르면 ", "기업의 이자 부담이 ", "커질 수 있어요."])
+        _, client = self.events(["다른 답변"])
+
+        deltas = "".join(event["text"] for event in events if event["event"] == "delta")
+        self.assertEqual(deltas, "금리가 오르면 기업의 이자 부담이 커질 수 있어요.")
+        self.assertEqual(events[-1], {"event": "done", "reply": deltas})
+        client.chats.create.assert_not_called()
+
+    def test_prohibited_advice_is_replaced_and_not_cached(self) -> None:
+        events, _ = self.events(["지금 삼성전자는 ", "매수", "하세요. 확실히 오릅니다."])
+
+        kinds = [event["event"] for event in events]
+        self.assertEqual(kinds[-2:], ["replace", "done"])
+        self.assertNotIn("매수", "".join(event.get("text", "") for event in events if event["event"] == "delta"))
+        self.assertEqual(events[-2]["text"], SAFE_FALLBACKS["chat"])
+        self.assertEqual(events[-1]["reply"], SAFE_FALLBACKS["chat"])
+        self.assertEqual(self.cache.stats()["_memory"]["entries"], 0)
+
+    def test_gateway_slot_is_released_before_the_client_finishes_reading(self) -> None:
+        released = threading.Event()
+
+        @contextmanager
+        def slot(priority):
+            try:
+                yield
+            finally:
+                released.set()
+
+        with patch("bot.client", fake_client(["첫 조각입니다. ", "둘째 조각입니다."])), patch("bot.llm_slot", slot):
+            stream = bot.stream_finmate_reply("easy", "슬롯 반납 확인", [])
+            first = next(stream)
+
+            self.assertEqual(first["event"], "delta")
+            self.assertTrue(released.wait(1))  # the client has read only one event so far
+            rest = list(stream)
+
+        self.assertEqual(rest[-1]["event"], "done")
+
+    def test_stalled_gemini_stream_times_out_instead_of_hanging(self) -> None:
+        unblock = threading.Event()
+        self.addCleanup(unblock.set)
+
+        def never_yields():
+            unblock.wait(5)
+            return
+            yield
+
+        client = fake_client([])
+        client.chats.create.return_value.send_message_stream.return_value = never_yields()
+        with patch("bot.client", client), patch.object(bot, "STREAM_FIRST_CHUNK_TIMEOUT_SECONDS", 0.2):
+            with self.assertRaises(TimeoutError):
+                list(bot.stream_finmate_reply("easy", "멈춘 스트림", []))
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class ChatStreamEndpointTest(unittest.TestCase):
+    def post(self, **patches):
+        from fastapi.testclient import TestClient
+
+        import main
+
+        with patch("main.get_chat_session_store", return_value=ChatSessionStore()), patch(
+            "main._glossary_answer", return_value=None
+        ), patch("main.stream_finmate_reply", **patches):
+            response = TestClient(main.app).post("/api/chat/stream", json={"mode": "easy", "message": "금리"})
+        return response
+
+    def test_events_are_framed_as_server_sent_events(self) -> None:
+        response = self.post(
+            return_value=iter(
+                [
+                    {"event": "delta", "text": "금리는 "},
+                    {"event": "delta", "text": "돈의 가격이에요."},
+                    {"event": "done", "reply": "금리는 돈의 가격이에요."},
+                ]
+            )
+        )
+
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        events = parse_sse(response.text)
+        self.assertEqual([name for name, _ in events], ["delta", "delta", "done"])
+        self.assertEqual(events[0][1], {"text": "금리는 "})
+        self.assertEqual(events[-1][1]["reply"], "금리는 돈의 가격이에요.")
+        self.assertTrue(events[-1][1]["sessionId"])
+
+    def test_rate_limit_is_sent_as_an_error_event(self) -> None:
+        response = self.post(side_effect=LLMRateLimited("queue timeout"))
+
+        self.assertEqual(response.status_code, 200)
+        events = parse_sse(response.text)
+        self.assertEqual([name for name, _ in events], ["error"])
+        self.assertEqual(events[0][1]["status"], 429)
+
+    def test_stream_timeout_is_sent_as_an_error_event(self) -> None:
+        response = self.post(side_effect=TimeoutError("Gemini 스트리밍 응답이 30초 동안 멈췄습니다."))
+
+        events = parse_sse(response.text)
+        self.assertEqual([name for name, _ in events], ["error"])
+        self.assertEqual(events[0][1]["status"], 500)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
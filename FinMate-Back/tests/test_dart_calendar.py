@@ -1,12 +1,78 @@
+import io
+import os
+import tempfile
+import threading
+import time
 import unittest
+import zipfile
+from datetime import datetime
 from unittest.mock import patch
 
 import dart
+from config import settings
+from dart_filing_index import DartFilingIndex
+
+_module_patches = []
+
+
+def setUpModule() -> None:
+    # 테스트가 기본 색인 파일(data/dart_filings.db)에 쓰지 않도록, 패치하지 않은 경로도 임시 파일을 가리키게 합니다.
+    tmp = tempfile.TemporaryDirectory()
+    _module_patches.append(tmp)
+    index_path = patch.object(settings, "DART_FILING_INDEX_PATH", os.path.join(tmp.name, "dart_filings.db"))
+    index_path.start()
+    _module_patches.append(index_path)
+    dart._get_filing_index.cache_clear()
+
+
+def tearDownModule() -> None:
+    dart._get_filing_index.cache_clear()
+    while _module_patches:
+        target = _module_patches.pop()
+        if isinstance(target, tempfile.TemporaryDirectory):
+            target.cleanup()
+        else:
+            target.stop()
+
+
+class DartListFilterTest(unittest.TestCase):
+    def test_report_names_are_classified_in_one_pass(self) -> None:
+        cases = {
+            "연결재무제표기준영업(잠정)실적(공정공시)": (True, False),
+            "[기재정정]영업 (잠정) 실적(공정공시)": (True, False),
+            "기업설명회(IR)개최(안내공시)": (False, True),
+            "기업설명회(IR)개최 (경영실적 발표)": (False, True),
+            "현금ㆍ현물배당결정": (False, False),
+        }
+        for report_name, expected in cases.items():
+            with self.subTest(report_name=report_name):
+                self.assertEqual(
+                    (dart._is_direct_earnings_report(report_name), dart._is_ir_report(report_name)), expected
+                )
+
+    def test_company_names(self) -> None:
+        self.assertTrue(dart._is_calendar_company("LG"))
+        self.assertTrue(dart._is_calendar_company("LG전자"))
+        self.assertTrue(dart._is_calendar_company("삼성 바이오로직스"))
+        self.assertFalse(dart._is_calendar_company("LS ELECTRIC"))
+        self.assertFalse(dart._is_calendar_company("SK바이오팜"))  # short names only match exactly
+        self.assertEqual(dart._get_importance("삼성전자"), "very_high")
+        self.assertEqual(dart._get_importance("LG전자"), "high")
+
+
+def document_chunks(text: str):
+    """_iter_dart_document_text 대역: 원문을 몇 글자씩 나눠 흘려보냄"""
+    for start in range(0, len(text), 16):
+        yield text[start:start + 16]
 
 
 class DartCalendarTest(unittest.TestCase):
     def setUp(self) -> None:
         dart._cache.clear()
+        dart._ir_memo.clear()
+        index_patch = patch("dart._get_filing_index", return_value=None)
+        index_patch.start()
+        self.addCleanup(index_patch.stop)
 
     def test_calendar_keeps_earnings_reports_and_earnings_ir_only(self) -> None:
         sample_items = [
@@ -44,8 +110,8 @@ class DartCalendarTest(unittest.TestCase):
             return_value=sample_items,
         ) as fetch_list, patch.object(
             dart,
-            "_fetch_dart_document_text",
-            side_effect=fake_document_text,
+            "_iter_dart_document_text",
+            side_effect=lambda rcept_no: document_chunks(fake_document_text(rcept_no)),
         ) as fetch_document:
             result = dart.get_dart_calendar(days_back=1, days_ahead=1)
 
@@ -63,5 +129,371 @@ class DartCalendarTest(unittest.TestCase):
         self.assertEqual(kia_event["calendarCategory"], "earnings_schedule")
 
 
+class FakeDartList:
+    """list.json stand-in: one filing per day, two pages per request when asked."""
+
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+        self.total_pages = lambda bgn_de, end_de: 2
+
+    def __call__(self, bgn_de, end_de, pblntf_ty, page_no, page_count=100):
+        self.calls.append((bgn_de, end_de, page_no))
+        if self.fail:
+            raise RuntimeError("DART list.json HTTP 오류: 503")
+        items = []
+        day = datetime.strptime(bgn_de, "%Y%m%d")
+        while day.strftime("%Y%m%d") <= end_de:
+            de = day.strftime("%Y%m%d")
+            items.append(
+                {
+                    "rcept_dt": de,
+                    "rcept_no": f"{de}8{page_no:05d}",
+                    "corp_name": "카카오",
+                    "stock_code": "035720",
+                    "report_nm": "연결재무제표기준영업(잠정)실적(공정공시)",
+                }
+            )
+            day = day.fromordinal(day.toordinal() + 1)
+        return items, self.total_pages(bgn_de, end_de)
+
+
+class DartFilingIndexSyncTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.index = DartFilingIndex(os.path.join(tmp.name, "dart.db"))
+        self.fake = FakeDartList()
+        for target in (
+            patch("dart._request_dart_list", side_effect=self.fake),
+            patch("dart._get_filing_index", return_value=self.index),
+            patch.object(dart, "DART_API_KEY", "test-key"),
+        ):
+            target.start()
+            self.addCleanup(target.stop)
+        dart._cache.clear()
+
+    def sync(self, bgn_de, end_de, today, now=1_000_000.0):
+        with patch("dart.datetime") as fake_datetime, patch("dart.time.time", return_value=now):
+            fake_datetime.today.return_value = datetime.strptime(today, "%Y%m%d")
+            fake_datetime.strptime = datetime.strptime
+            return dart._sync_filing_index(self.index, "I", bgn_de, end_de)
+
+    def test_first_sync_pulls_the_window_in_week_chunks_with_all_pages(self) -> None:
+        self.assertEqual(self.sync("20260501", "20260630", today="20260510"), dart.SYNC_DONE)
+
+        # Future dates are never requested: 05/08~05/10 then 05/01~05/07 (newest first), two pages each.
+        self.assertEqual(
+            self.fake.calls,
+            [("20260508", "20260510", 1), ("20260508", "20260510", 2), ("20260501", "20260507", 1), ("20260501", "20260507", 2)],
+        )
+        self.assertEqual(self.index.coverage("I")[:2], ("20260501", "20260510"))
+        self.assertEqual(len(self.index.query("I", "20260501", "20260510")), 20)
+
+    def test_next_day_pulls_only_the_new_dates(self) -> None:
+        self.sync("20260501", "20260630", today="20260510")
+        self.fake.calls.clear()
+
+        self.sync("20260502", "20260701", today="20260511", now=1_000_100.0)
+
+        self.assertEqual({call[:2] for call in self.fake.calls}, {("20260510", "20260511")})
+
+    def test_same_day_refreshes_only_after_the_refresh_interval(self) -> None:
+        self.sync("20260501", "20260630", today="20260510")
+        self.fake.calls.clear()
+
+        self.sync("20260501", "20260630", today="20260510", now=1_000_060.0)
+        self.assertEqual(self.fake.calls, [])
+
+        self.sync("20260501", "20260630", today="20260510", now=1_000_000.0 + dart._INDEX_REFRESH_SECONDS)
+        self.assertEqual({call[:2] for call in self.fake.calls}, {("20260510", "20260510")})
+
+    def test_earlier_window_backfills_toward_existing_coverage(self) -> None:
+        self.sync("20260501", "20260630", today="20260510")
+        self.fake.calls.clear()
+
+        self.sync("20260420", "20260505", today="20260510", now=1_000_060.0)
+
+        self.assertEqual([call[:2] for call in self.fake.calls[::2]], [("20260427", "20260430"), ("20260420", "20260426")])
+        self.assertEqual(self.index.coverage("I")[:2], ("20260420", "20260510"))
+
+    def test_failed_sync_keeps_coverage_and_serves_indexed_filings(self) -> None:
+        self.sync("20260501", "20260630", today="20260510")
+        self.fake.fail = True
+
+        self.assertEqual(self.sync("20260501", "20260630", today="20260512", now=1_000_100.0), dart.SYNC_FAILED)
+        self.assertEqual(self.index.coverage("I")[:2], ("20260501", "20260510"))
+        self.assertEqual(len(self.index.query("I", "20260501", "20260512")), 20)
+
+
+    def test_ranges_over_the_page_limit_are_split_until_every_page_fits(self) -> None:
+        self.fake.total_pages = lambda bgn_de, end_de: 2 if bgn_de == end_de else dart.INDEX_SYNC_MAX_PAGES + 1
+
+        self.assertEqual(self.sync("20260508", "20260510", today="20260510"), dart.SYNC_DONE)
+
+        fetched = {call[:2] for call in self.fake.calls if call[2] == 2}
+        self.assertEqual(fetched, {("20260508", "20260508"), ("20260509", "20260509"), ("20260510", "20260510")})
+        self.assertEqual(self.index.coverage("I")[:2], ("20260508", "20260510"))
+
+    def test_day_over_the_page_limit_fails_without_advancing_coverage(self) -> None:
+        self.fake.total_pages = lambda bgn_de, end_de: dart.INDEX_SYNC_MAX_PAGES + 1
+
+        self.assertEqual(self.sync("20260508", "20260510", today="20260510"), dart.SYNC_FAILED)
+        self.assertIsNone(self.index.coverage("I"))
+
+    def test_each_call_syncs_at_most_the_chunk_budget(self) -> None:
+        self.assertEqual(self.sync("20260401", "20260510", today="20260510"), dart.SYNC_PARTIAL)
+        # 04/01~05/10 is six week chunks; the newest two come first.
+        self.assertEqual(self.index.coverage("I")[:2], ("20260429", "20260510"))
+
+        self.assertEqual(self.sync("20260401", "20260510", today="20260510", now=1_000_060.0), dart.SYNC_PARTIAL)
+        self.assertEqual(self.sync("20260401", "20260510", today="20260510", now=1_000_120.0), dart.SYNC_DONE)
+        self.assertEqual(self.index.coverage("I")[:2], ("20260401", "20260510"))
+        self.assertEqual(len(self.index.query("I", "20260401", "20260510")), 80)  # one filing per day per page
+
+    def test_partially_synced_calendar_is_not_cached(self) -> None:
+        with patch.object(dart, "INDEX_SYNC_MAX_CHUNKS_PER_CALL", 1), patch("dart.datetime", FixedDatetime):
+            result = dart.get_dart_calendar(days_back=30, days_ahead=0)
+
+        self.assertEqual(result["source"], "dart_partial")
+        self.assertEqual(dart._cache, {})
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def today(cls):
+        return cls(2026, 5, 20)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 5, 20)
+
+
+class IrClassificationMemoTest(unittest.TestCase):
+    IR_ITEM = {
+        "rcept_dt": "20260514",
+        "rcept_no": "20260514800111",
+        "corp_name": "기아",
+        "stock_code": "000270",
+        "report_nm": "기업설명회(IR)개최(안내공시)",
+    }
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.index = DartFilingIndex(os.path.join(tmp.name, "dart.db"))
+        self.index.upsert("I", [self.IR_ITEM])
+        for target in (
+            patch("dart._get_filing_index", return_value=self.index),
+            patch("dart._sync_filing_index", return_value=dart.SYNC_DONE),
+            patch.object(dart, "DART_API_KEY", "test-key"),
+        ):
+            target.start()
+            self.addCleanup(target.stop)
+        dart._cache.clear()
+        dart._ir_memo.clear()
+
+    def build(self, document_text):
+        with patch(
+            "dart._iter_dart_document_text", side_effect=lambda rcept_no: document_chunks(document_text)
+        ) as fetch_document, patch(
+            "dart.datetime", FixedDatetime
+        ):
+            result = dart.get_dart_calendar(days_back=30, days_ahead=30)
+        dart._cache.clear()
+        return result, fetch_document
+
+    def test_classification_survives_cache_and_process_restart(self) -> None:
+        first, first_fetch = self.build("개최 일시 2026년 5월 15일 10:00 2026년 1분기 경영실적 발표")
+        dart._ir_memo.clear()  # new process: only the SQLite memo remains
+        second, second_fetch = self.build("")
+
+        self.assertEqual(first_fetch.call_count, 1)
+        self.assertEqual(second_fetch.call_count, 0)
+        self.assertEqual(second["events"], first["events"])
+        self.assertEqual(second["events"][0]["datetime"], "2026-05-15T10:00:00")
+
+    def test_non_earnings_ir_is_remembered_as_hidden(self) -> None:
+        self.build("개최일시 2026년 5월 14일 14:00 회사 소개 및 사업 현황 설명")
+        result, fetch_document = self.build("2026년 1분기 경영실적 발표")
+
+        self.assertEqual(fetch_document.call_count, 0)
+        self.assertEqual(result["events"], [])
+
+    def test_failed_download_is_retried_next_time(self) -> None:
+        self.build("")
+        result, fetch_document = self.build("2026년 1분기 경영실적 발표")
+
+        self.assertEqual(fetch_document.call_count, 1)
+        self.assertEqual(len(result["events"]), 1)
+
+    def test_fetch_cap_only_counts_downloads(self) -> None:
+        items = [
+            dict(self.IR_ITEM, rcept_no=f"2026051480{number:04d}", rcept_dt="20260514")
+            for number in range(dart.MAX_IR_DETAIL_FETCHES + 20)
+        ]
+        self.index.upsert("I", items)
+
+        first, first_fetch = self.build("2026년 1분기 경영실적 발표")
+        second, second_fetch = self.build("2026년 1분기 경영실적 발표")
+
+        self.assertEqual(first_fetch.call_count, dart.MAX_IR_DETAIL_FETCHES)
+        self.assertEqual(second_fetch.call_count, 21)
+        # The capped build is partial so it is not cached; the follow-up build covers everything.
+        self.assertEqual(first["source"], "dart_partial")
+        self.assertEqual(second["source"], "dart")
+
+
+class FakeStreamResponse:
+    def __init__(self, body: bytes):
+        self.status_code = 200
+        self.body = body
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class StreamingDocumentTest(unittest.TestCase):
+    DOCUMENT = (
+        '<?xml version="1.0" encoding="{encoding}"?><DOCUMENT><TITLE>기업설명회(IR) 개최</TITLE>'
+        "<TABLE><TR><TD>개최일시</TD><TD>2026년 5월 15일 10:00</TD></TR>"
+        "<TR><TD>목적</TD><TD><![CDATA[2026년 1분기 경영실적 발표 &amp; Q&amp;A]]></TD></TR></TABLE>"
+        "<P>{filler}</P></DOCUMENT>"
+    )
+
+    def document(self, encoding="utf-8", filler="사업 현황 설명 "):
+        return self.DOCUMENT.format(encoding=encoding, filler=filler * 200)
+
+    def zipped(self, *members):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for number, body in enumerate(members):
+                archive.writestr(f"{number}.xml", body)
+        return buffer.getvalue()
+
+    def stream(self, body, read_bytes=7):
+        response = FakeStreamResponse(body)
+        with patch.object(dart, "DART_API_KEY", "test-key"), patch(
+            "dart.http_get", return_value=response
+        ), patch.object(dart, "DOCUMENT_READ_BYTES", read_bytes):
+            chunks = list(dart._iter_dart_document_text("20260514800111"))
+        return chunks, response
+
+    def test_streamed_text_matches_whole_document_strip(self) -> None:
+        for encoding in ("utf-8", "euc-kr"):
+            with self.subTest(encoding=encoding):
+                raw = self.document(encoding).encode(encoding)
+                chunks, response = self.stream(self.zipped(raw))
+
+                self.assertGreater(len(chunks), 1)
+                self.assertEqual(" ".join("".join(chunks).split()), dart._strip_markup(dart._decode_bytes(raw)))
+                self.assertIn("경영실적 발표 & Q&A", "".join(chunks))
+                self.assertTrue(response.closed)
+
+    def test_all_zip_members_and_plain_bodies_are_read(self) -> None:
+        zipped, _ = self.stream(self.zipped("<P>첫 문서</P>".encode("cp949"), "<P>둘째 문서</P>".encode("utf-8")))
+        plain, _ = self.stream("<P>압축 없는 &lt;원문&gt;</P>".encode("utf-8"))
+
+        self.assertEqual(" ".join("".join(zipped).split()), "첫 문서 둘째 문서")
+        self.assertEqual(" ".join("".join(plain).split()), "압축 없는 <원문>")
+
+    def test_failed_download_yields_nothing(self) -> None:
+        response = FakeStreamResponse(b"")
+        response.status_code = 500
+        with patch.object(dart, "DART_API_KEY", "test-key"), patch("dart.http_get", return_value=response):
+            self.assertEqual(list(dart._iter_dart_document_text("20260514800111")), [])
+        self.assertTrue(response.closed)
+
+    def test_classification_stops_reading_once_settled(self) -> None:
+        read = []
+
+        def chunks():
+            for chunk in dart._MarkupStripper().feed(self.document()).split(" "):
+                read.append(chunk)
+                yield chunk + " "
+
+        classification = dart._scan_ir_document(chunks())
+
+        self.assertEqual(classification, (True, "2026-05-15T10:00:00"))
+        self.assertLess(len(read), 100)  # the filler paragraph (600 words) is never read
+
+
+class ParallelIrFetchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        for target in (
+            patch("dart._get_filing_index", return_value=None),
+            patch.object(dart, "DART_API_KEY", "test-key"),
+        ):
+            target.start()
+            self.addCleanup(target.stop)
+        dart._cache.clear()
+        dart._ir_memo.clear()
+        self.items = [
+            {
+                "rcept_dt": "20260514",
+                "rcept_no": f"2026051480{number:04d}",
+                "corp_name": "기아",
+                "stock_code": "000270",
+                "report_nm": "기업설명회(IR)개최(안내공시)",
+            }
+            for number in range(6)
+        ]
+
+    def test_documents_are_fetched_concurrently(self) -> None:
+        barrier = threading.Barrier(4, timeout=2)
+
+        def fetch_document(rcept_no):
+            barrier.wait()  # only passes if four downloads are in flight at once
+            return f"개최일시 2026년 5월 {15 + int(rcept_no[-1])}일 10:00 경영실적 발표"
+
+        with patch("dart._fetch_dart_list", return_value=self.items[:4]), patch(
+            "dart._iter_dart_document_text", side_effect=lambda rcept_no: document_chunks(fetch_document(rcept_no))
+        ):
+            result = dart.get_dart_calendar(days_back=1, days_ahead=1)
+
+        self.assertEqual(result["source"], "dart")
+        self.assertEqual(
+            [event["datetime"] for event in result["events"]],
+            ["2026-05-15T10:00:00", "2026-05-16T10:00:00", "2026-05-17T10:00:00", "2026-05-18T10:00:00"],
+        )
+
+    def test_deadline_returns_finished_events_as_partial(self) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fetch_document(rcept_no):
+            if rcept_no.endswith("5"):
+                release.wait(2)
+            return "2026년 1분기 경영실적 발표"
+
+        pools = []
+
+        class TrackingPool(dart.ThreadPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        with patch("dart._fetch_dart_list", return_value=self.items), patch(
+            "dart._iter_dart_document_text", side_effect=lambda rcept_no: document_chunks(fetch_document(rcept_no))
+        ), patch.object(dart, "IR_FETCH_DEADLINE", 0.2), patch("dart.ThreadPoolExecutor", TrackingPool):
+            started = time.monotonic()
+            result = dart.get_dart_calendar(days_back=1, days_ahead=1)
+            elapsed = time.monotonic() - started
+            # 마감 뒤에도 남은 다운로드가 패치가 풀린 다음 실제 색인에 쓰지 않도록, 패치 안에서 끝까지 기다립니다.
+            release.set()
+            for pool in pools:
+                pool.shutdown(wait=True)
+
+        self.assertLess(elapsed, 1.5)
+        self.assertEqual(result["source"], "dart_partial")
+        self.assertEqual(result["total"], 1)  # five finished filings share one company/day
+        self.assertEqual(dart._cache, {})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from datetime import date, timedelta
+
+from ecos_cache import DAILY_RECENT_TTL_SECONDS, EcosStatisticCache, _find_gaps, _shift_period
+
+
+def daily_rows(start: date, end: date) -> list[dict]:
+    rows = []
+    current = start
+    while current <= end:
+        rows.append({"TIME": current.strftime("%Y%m%d"), "DATA_VALUE": str(2500 + current.day)})
+        current += timedelta(days=1)
+    return rows
+
+
+class FakeEcos:
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, stat_code, cycle, start, end, item_code=""):
+        self.calls.append((cycle, start, end))
+        if self.fail:
+            return {"error": "HTTP 오류: 503"}
+        if cycle == "D":
+            return daily_rows(date(int(start[:4]), int(start[4:6]), int(start[6:])), date(int(end[:4]), int(end[4:6]), int(end[6:])))
+        return [{"TIME": start, "DATA_VALUE": "3.50"}]
+
+
+class EcosStatisticCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1000.0
+        self.fetch = FakeEcos()
+        self.cache = EcosStatisticCache(self.fetch, clock=lambda: self.now, today=lambda: date(2026, 6, 12))
+
+    def test_repeated_range_is_served_from_cache(self) -> None:
+        first = self.cache.get("802Y001", "D", "20260529", "20260612", "0001000")
+        second = self.cache.get("802Y001", "D", "20260529", "20260612", "0001000")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.fetch.calls), 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_overlapping_ranges_fetch_only_missing_dates(self) -> None:
+        self.cache.get("802Y001", "D", "20260529", "20260612", "0001000")
+        longer = self.cache.get("802Y001", "D", "20260501", "20260612", "0001000")
+        inner = self.cache.get("802Y001", "D", "20260510", "20260520", "0001000")
+
+        self.assertEqual(self.fetch.calls[1:], [("D", "20260501", "20260528")])
+        self.assertEqual([row["TIME"] for row in longer][:2], ["20260501", "20260502"])
+        self.assertEqual(len(longer), 43)
+        self.assertEqual(len(inner), 11)
+        self.assertEqual(self.cache.stats()["partial_hits"], 1)
+        self.assertEqual(self.cache.stats()["upstream_calls"], 2)
+
+    def test_only_recent_daily_points_expire_intraday(self) -> None:
+        self.cache.get("802Y001", "D", "20260501", "20260612", "0001000")
+        self.now += DAILY_RECENT_TTL_SECONDS + 1
+
+        self.cache.get("802Y001", "D", "20260501", "20260612", "0001000")
+
+        # 2026-06-05 and earlier are settled; only the last week is fetched again.
+        self.assertEqual(self.fetch.calls[1], ("D", "20260606", "20260612"))
+
+    def test_series_are_keyed_by_item_and_cycle(self) -> None:
+        self.cache.get("802Y001", "D", "20260601", "20260612", "0001000")
+        self.cache.get("802Y001", "D", "20260601", "20260612", "0089000")
+        self.cache.get("722Y001", "M", "202601", "202605", "0101000")
+        self.cache.get("722Y001", "M", "202602", "202604", "0101000")
+
+        self.assertEqual(len(self.fetch.calls), 3)
+        self.assertEqual(self.cache.stats()["series"], 3)
+
+    def test_errors_are_not_cached(self) -> None:
+        self.fetch.fail = True
+        self.assertEqual(self.cache.get("722Y001", "M", "202601", "202605"), {"error": "HTTP 오류: 503"})
+
+        self.fetch.fail = False
+        self.assertEqual(self.cache.get("722Y001", "M", "202601", "202605"), [{"TIME": "202601", "DATA_VALUE": "3.50"}])
+        self.assertEqual(len(self.fetch.calls), 2)
+
+    def test_returned_rows_are_copies(self) -> None:
+        rows = self.cache.get("722Y001", "M", "202601", "202605")
+        rows[0]["DATA_VALUE"] = "changed"
+
+        self.assertEqual(self.cache.get("722Y001", "M", "202601", "202605")[0]["DATA_VALUE"], "3.50")
+
+    def test_unsupported_cycle_bypasses_cache(self) -> None:
+        self.cache.get("200Y001", "S", "2025S1", "2025S2")
+        self.cache.get("200Y001", "S", "2025S1", "2025S2")
+
+        self.assertEqual(len(self.fetch.calls), 2)
+        self.assertEqual(self.cache.stats()["bypassed"], 2)
+
+    def test_period_helpers(self) -> None:
+        self.assertEqual(_shift_period("20260301", "D", -1), "20260228")
+        self.assertEqual(_shift_period("202612", "M", 1), "202701")
+        self.assertEqual(_shift_period("2026Q1", "Q", -1), "2025Q4")
+        self.assertEqual(_shift_period("2026", "Y", 1), "2027")
+        self.assertEqual(_find_gaps([], "202601", "202603", "M"), [("202601", "202603")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import ecos
+from logic_alerts import _build_usdkrw_alert
+
+ROWS_BY_ITEM = {
+    "0001000": [{"TIME": "20260611", "DATA_VALUE": "2900"}, {"TIME": "20260612", "DATA_VALUE": "2958"}],
+    "0089000": [{"TIME": "20260611", "DATA_VALUE": "800"}, {"TIME": "20260612", "DATA_VALUE": "792"}],
+    "0000001": [{"TIME": "20260611", "DATA_VALUE": "1360"}, {"TIME": "20260612", "DATA_VALUE": "1377.5"}],
+    "010200000": [{"TIME": "20260611", "DATA_VALUE": "2.50"}, {"TIME": "20260612", "DATA_VALUE": "2.55"}],
+}
+
+
+def fake_statistic(stat_code, cycle, start, end, item_code=""):
+    return ROWS_BY_ITEM[item_code]
+
+
+class GetLastOneTest(unittest.TestCase):
+    def test_series_are_requested_concurrently(self) -> None:
+        barrier = threading.Barrier(len(ROWS_BY_ITEM), timeout=2)
+
+        def wait_for_all(*args):
+            # Sequential calls would time out here: every request must be in flight at once.
+            barrier.wait()
+            return fake_statistic(*args)
+
+        with patch("ecos.get_ecos_statistic", side_effect=wait_for_all):
+            result = ecos.get_last_one()
+
+        self.assertEqual(result["errors"], {})
+        self.assertEqual(
+            [(item["name"], item["value"], item["change"]) for item in result["indices"]],
+            [
+                ("KOSPI", "2,958.00", 2.0),
+                ("KOSDAQ", "792.00", -1.0),
+                ("USD/KRW", "1,377.50", 1.3),
+                ("국고채 3년", "2.55%", 2.0),
+            ],
+        )
+
+    def test_failed_series_is_reported_without_dropping_the_others(self) -> None:
+        def bond_fails(stat_code, cycle, start, end, item_code=""):
+            if item_code == "010200000":
+                return {"error": "HTTP 오류: 503"}
+            return fake_statistic(stat_code, cycle, start, end, item_code)
+
+        with patch("ecos.get_ecos_statistic", side_effect=bond_fails):
+            result = ecos.get_last_one()
+
+        self.assertEqual(result["errors"], {"bond": "bond 오류: HTTP 오류: 503"})
+        self.assertEqual(result["indices"][0]["value"], "2,958.00")
+        self.assertEqual(result["indices"][3], {"name": "국고채 3년", "value": "-", "change": 0.0})
+
+    def test_error_only_when_every_series_fails(self) -> None:
+        with patch("ecos.get_ecos_statistic", side_effect=RuntimeError("timeout")):
+            result = ecos.get_last_one()
+
+        self.assertEqual(set(result), {"error"})
+        self.assertIn("fx 오류: API 호출 오류: timeout", result["error"])
+
+    def test_usdkrw_alert_is_unavailable_when_only_fx_fails(self) -> None:
+        def fx_fails(stat_code, cycle, start, end, item_code=""):
+            if item_code == "0000001":
+                return {"error": "HTTP 오류: 503"}
+            return fake_statistic(stat_code, cycle, start, end, item_code)
+
+        with patch("ecos.get_ecos_statistic", side_effect=fx_fails):
+            alert = _build_usdkrw_alert()
+
+        self.assertEqual(alert["status"], "unavailable")
+        self.assertIn("fx 오류", alert["message"])
+
+
+if __name__ == "__main__":
+    unittest.main()
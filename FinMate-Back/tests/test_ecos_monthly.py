@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import ecos
+from ecos_monthly_store import MonthlyAggregateStore
+
+
+def fake_daily_statistic(calls):
+    def fetch(stat_code, cycle, start, end, item_code=""):
+        calls.append((start, end))
+        rows = []
+        current = date(int(start[:4]), int(start[4:6]), int(start[6:]))
+        last = date(int(end[:4]), int(end[4:6]), int(end[6:]))
+        while current <= last:
+            if current.weekday() < 5:
+                # Month number as the index level makes every monthly average easy to check.
+                rows.append({"TIME": current.strftime("%Y%m%d"), "DATA_VALUE": str(2000 + current.month)})
+            current += timedelta(days=1)
+        return rows
+
+    return fetch
+
+
+class KospiMonthlyAggregateTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = MonthlyAggregateStore(os.path.join(tmp.name, "monthly.db"))
+        store_patch = patch("ecos._get_monthly_store", return_value=self.store)
+        store_patch.start()
+        self.addCleanup(store_patch.stop)
+        self.calls = []
+
+    def averages(self, n, today):
+        with patch("ecos.get_ecos_statistic", side_effect=fake_daily_statistic(self.calls)):
+            return ecos._kospi_monthly_averages(n, today=today)
+
+    def test_closed_months_are_computed_once(self) -> None:
+        first = self.averages(6, date(2026, 6, 12))
+        second = self.averages(6, date(2026, 6, 20))
+
+        self.assertEqual(list(first), ["202512", "202601", "202602", "202603", "202604", "202605"])
+        self.assertEqual(first["202603"], 2003.0)
+        self.assertEqual(second, first)
+        self.assertEqual(self.calls, [("20251201", "20260531")])
+
+    def test_next_month_fetches_only_the_new_month(self) -> None:
+        self.averages(6, date(2026, 6, 12))
+        self.averages(6, date(2026, 7, 10))
+
+        self.assertEqual(self.calls[1:], [("20260601", "20260630")])
+
+    def test_long_windows_are_split_to_stay_under_the_ecos_page_limit(self) -> None:
+        result = self.averages(60, date(2026, 6, 12))
+
+        self.assertEqual(len(result), 60)
+        self.assertEqual(len(self.calls), 4)
+        self.assertEqual(self.calls[0][0], "20210601")
+        self.assertEqual(self.calls[-1][1], "20260531")
+
+    def test_recent_month_is_not_persisted_until_settled(self) -> None:
+        self.averages(1, date(2026, 6, 2))  # May can still gain its last trading day: not stored
+        self.averages(1, date(2026, 6, 4))  # settled: fetched and stored
+        self.averages(1, date(2026, 6, 5))  # served from the store
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_macro_points_join_rate_months_with_kospi_averages(self) -> None:
+        rate_rows = [{"TIME": "202604", "DATA_VALUE": "2.75"}, {"TIME": "202605", "DATA_VALUE": "2.50"}]
+        kospi = {"202604": 2604.123, "202605": 2605.0}
+
+        with patch("ecos.get_policy_rate_last_n", return_value=rate_rows), patch(
+            "ecos._kospi_monthly_averages", return_value=kospi
+        ):
+            points = ecos.get_macro_points(2)
+
+        self.assertEqual(
+            points,
+            [
+                {"date": "2026.04", "rate": 2.75, "stock": 2604.12},
+                {"date": "2026.05", "rate": 2.5, "stock": 2605.0},
+            ],
+        )
+
+    def test_kospi_last_n_keeps_row_format_and_errors(self) -> None:
+        with patch("ecos._kospi_monthly_averages", return_value={"202605": 2605.0}):
+            self.assertEqual(
+                ecos.get_kospi_last_n(1),
+                [{"TIME": "202605", "DATA_VALUE": "2605.00", "UNIT_NAME": "월평균 KOSPI 지수"}],
+            )
+        with patch("ecos.get_ecos_statistic", return_value={"error": "HTTP 오류: 503"}):
+            self.assertEqual(ecos.get_kospi_last_n(1), {"error": "HTTP 오류: 503"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from glossary_index import EcosGlossary, GlossaryIndex, normalize_term
+
+ROWS = {
+    "기준금리": [{"WORD": "기준금리", "CONTENT": "한국은행이 정하는 정책금리"}],
+    "금리": [
+        {"WORD": "가산금리", "CONTENT": "기준금리에 더하는 금리"},
+        {"WORD": "시장금리", "CONTENT": "시장에서 결정되는 금리"},
+    ],
+    "GDP": [{"WORD": "GDP(국내총생산)", "CONTENT": "일정 기간 생산된 최종 생산물의 가치"}],
+}
+
+
+class FakeSearch:
+    def __init__(self):
+        self.calls = []
+        self.error = False
+
+    def __call__(self, term):
+        self.calls.append(term)
+        if self.error:
+            return {"error": "ECOS_AUTH_KEY가 필요합니다."}
+        return ROWS.get(term, [])
+
+
+class GlossaryIndexTest(unittest.TestCase):
+    def test_match_accepts_term_with_question_suffix_only(self) -> None:
+        index = GlossaryIndex([("기준금리", "기준금리", "정책금리"), ("금리", "금리", "돈의 값")])
+
+        self.assertEqual(index.match("기준금리"), ("기준금리", "정책금리"))
+        self.assertEqual(index.match(" 기준 금리가 뭐야? "), ("기준금리", "정책금리"))
+        self.assertEqual(index.match("금리란"), ("금리", "돈의 값"))
+        self.assertIsNone(index.match("기준금리 오르면 삼성전자 주가는 어떻게 돼?"))
+        self.assertIsNone(index.match("오늘 시장 분위기 어때"))
+
+    def test_normalize_term(self) -> None:
+        self.assertEqual(normalize_term("ＧＤＰ (국내총생산)"), "gdp국내총생산")
+
+
+class EcosGlossaryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "glossary.json")
+        self.search = FakeSearch()
+
+    def make(self, **kwargs) -> EcosGlossary:
+        return EcosGlossary(path=self.path, search=self.search, **kwargs)
+
+    def test_sentences_skip_ecos_entirely(self) -> None:
+        glossary = self.make(seed_terms=["기준금리"])
+        glossary.refresh()
+        self.search.calls.clear()
+
+        self.assertIsNone(glossary.lookup("요즘 반도체 업황이 어떤지 자세히 설명해 줄 수 있어?"))
+        self.assertEqual(glossary.lookup("기준금리란?")["용어"], "기준금리")
+        self.assertEqual(self.search.calls, [])
+
+    def test_live_hit_is_learned_and_persisted(self) -> None:
+        glossary = self.make()
+
+        first = glossary.lookup("금리")
+        second = glossary.lookup("금리")
+        reloaded = self.make().lookup("시장금리")
+
+        # Same answer as the previous ECOS search: the first row for a non-exact query.
+        self.assertEqual(first, {"용어": "가산금리", "용어설명": "기준금리에 더하는 금리"})
+        self.assertEqual(second, first)
+        self.assertEqual(reloaded["용어"], "시장금리")
+        self.assertEqual(self.search.calls, ["금리"])
+
+    def test_misses_are_remembered_but_errors_are_not(self) -> None:
+        glossary = self.make()
+
+        self.assertIsNone(glossary.lookup("없는용어"))
+        self.assertIsNone(glossary.lookup("없는용어"))
+        self.search.error = True
+        self.assertIsNone(glossary.lookup("기준금리"))
+        self.search.error = False
+        self.assertEqual(glossary.lookup("기준금리")["용어"], "기준금리")
+
+        self.assertEqual(self.search.calls, ["없는용어", "기준금리", "기준금리"])
+
+    def test_refresh_covers_seed_and_learned_queries(self) -> None:
+        self.make().lookup("금리")
+        glossary = self.make(seed_terms=["기준금리", "GDP"])
+        self.search.calls.clear()
+
+        self.assertTrue(glossary.is_stale())
+        self.assertEqual(glossary.refresh(), 3)
+        self.assertFalse(glossary.is_stale())
+        self.assertEqual(sorted(self.search.calls), sorted(["기준금리", "GDP", "금리"]))
+        self.assertEqual(glossary.lookup("gdp(국내총생산)")["용어"], "GDP(국내총생산)")
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["queries"], ["금리"])
+
+    def test_learned_queries_are_capped_least_recently_used_first(self) -> None:
+        glossary = self.make()
+        with patch("glossary_index.MAX_LEARNED_QUERIES", 2):
+            glossary.lookup("금리")
+            glossary.lookup("기준금리")
+            glossary.lookup("금리")  # index hit keeps 금리 recent
+            glossary.lookup("GDP")
+            self.search.calls.clear()
+            glossary.refresh()
+
+        self.assertEqual(sorted(self.search.calls), sorted(["금리", "GDP"]))
+        self.assertIsNone(glossary._index.match("기준금리"))  # the evicted query's terms go with it
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["queries"], ["금리", "GDP"])
+
+    def test_misses_are_capped(self) -> None:
+        glossary = self.make()
+        with patch("glossary_index.MAX_MISSES", 3):
+            for number in range(10):
+                glossary.lookup(f"없는용어{number}")
+
+        self.assertEqual(list(glossary._misses), ["없는용어7", "없는용어8", "없는용어9"])
+
+    def test_failed_refresh_keeps_existing_terms(self) -> None:
+        glossary = self.make(seed_terms=["기준금리"])
+        glossary.refresh()
+        self.search.error = True
+
+        glossary.refresh()
+
+        self.assertEqual(glossary.lookup("기준금리")["용어"], "기준금리")
+
+
+
+if __name__ == "__main__":
+    unittest.main()
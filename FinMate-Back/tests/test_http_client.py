@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch
+
+import http_client
+
+
+class HttpClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        http_client.close_all_sessions()
+        self.addCleanup(http_client.close_all_sessions)
+
+    def test_sessions_are_shared_per_host(self) -> None:
+        ecos = http_client.get_session("https://ecos.bok.or.kr/api/StatisticSearch/key/json/kr/1/10")
+        same_host = http_client.get_session("https://ECOS.bok.or.kr/api/StatisticWord/key/json/kr/1/5")
+        dart = http_client.get_session("https://opendart.fss.or.kr/api/list.json")
+
+        self.assertIs(ecos, same_host)
+        self.assertIsNot(ecos, dart)
+
+    def test_session_pools_connections_and_retries_server_errors(self) -> None:
+        adapter = http_client.get_session("https://apis.data.go.kr/stock").get_adapter("https://apis.data.go.kr/stock")
+
+        self.assertEqual(adapter._pool_maxsize, http_client.DEFAULT_POLICY.pool_maxsize)
+        self.assertEqual(adapter.max_retries.total, http_client.DEFAULT_POLICY.retries)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertNotIn(429, adapter.max_retries.status_forcelist)
+        self.assertEqual(adapter.max_retries.allowed_methods, frozenset({"GET"}))
+
+    def test_read_timeouts_are_retried_only_on_short_timeout_hosts(self) -> None:
+        def read_retries(url):
+            return http_client.get_session(url).get_adapter(url).max_retries.read
+
+        self.assertEqual(read_retries("https://opendart.fss.or.kr/api/list.json"), 0)
+        self.assertEqual(read_retries("https://apis.data.go.kr/stock"), 0)
+        self.assertEqual(read_retries("https://ecos.bok.or.kr/api"), 1)
+        self.assertEqual(http_client.get_session("https://opendart.fss.or.kr").get_adapter(
+            "https://opendart.fss.or.kr"
+        ).max_retries.connect, 2)
+
+    def test_http_get_applies_host_timeout_unless_overridden(self) -> None:
+        session = http_client.get_session("https://opendart.fss.or.kr")
+
+        with patch.object(session, "get") as get:
+            http_client.http_get("https://opendart.fss.or.kr/api/list.json", params={"corp_code": "00126380"})
+            http_client.http_get("https://opendart.fss.or.kr/api/list.json", timeout=1)
+
+        self.assertEqual(get.call_args_list[0].kwargs["timeout"], http_client.HOST_POLICIES["opendart.fss.or.kr"].timeout)
+        self.assertEqual(get.call_args_list[0].kwargs["params"], {"corp_code": "00126380"})
+        self.assertEqual(get.call_args_list[1].kwargs["timeout"], 1)
+
+    def test_close_all_sessions_starts_fresh_pools(self) -> None:
+        before = http_client.get_session("openapi.naver.com")
+        http_client.close_all_sessions()
+
+        self.assertIsNot(http_client.get_session("https://openapi.naver.com/v1/search/news.json"), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
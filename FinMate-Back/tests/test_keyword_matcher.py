@@ -0,0 +1,40 @@
+import random
+import unittest
+
+from keyword_matcher import KeywordMatcher
+
+
+class KeywordMatcherTest(unittest.TestCase):
+    def test_finds_overlapping_and_nested_keywords(self) -> None:
+        matcher = KeywordMatcher(["he", "she", "his", "hers"])
+
+        self.assertEqual(matcher.find("ushers"), {"he", "she", "hers"})
+        self.assertTrue(matcher.search("this"))
+        self.assertFalse(matcher.search("hx"))
+
+    def test_matches_naive_substring_search(self) -> None:
+        rng = random.Random(7)
+        for _ in range(2000):
+            keywords = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 6))]
+            text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 12)))
+            with self.subTest(keywords=keywords, text=text):
+                matcher = KeywordMatcher(keywords)
+                self.assertEqual(matcher.find(text), {keyword for keyword in keywords if keyword in text})
+                self.assertEqual(matcher.search(text), any(keyword in text for keyword in keywords))
+
+    def test_normalization_applies_to_keywords_and_text(self) -> None:
+        matcher = KeywordMatcher(["경영실적 발표", "경영실적발표", "Earnings"], ignore_case=True, ignore_whitespace=True)
+
+        self.assertEqual(matcher.find("2026년 1분기 경영실적  발표"), {"경영실적 발표", "경영실적발표"})
+        self.assertEqual(matcher.find("Q1 EARNINGS call"), {"Earnings"})
+        self.assertFalse(KeywordMatcher(["Earnings"]).search("EARNINGS"))
+
+    def test_empty_keywords_never_match(self) -> None:
+        matcher = KeywordMatcher(["", "  "], ignore_whitespace=True)
+
+        self.assertEqual(matcher.find("아무 문자열"), set())
+        self.assertFalse(matcher.search(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from llm_cache import SURFACE_TTL_SECONDS, LLMResponseCache, make_cache_key
+
+
+class Generator:
+    def __init__(self, text="답변"):
+        self.text = text
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.text
+
+
+class LLMResponseCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1_000_000.0
+        self.cache = LLMResponseCache(max_entries=2, clock=lambda: self.now)
+
+    def ask(self, prompt, generate, surface="calendar_insight", **kwargs):
+        return self.cache.get_or_generate(surface, model="gemini-test", prompt=prompt, generate=generate, **kwargs)
+
+    def test_identical_prompts_call_gemini_once(self) -> None:
+        generate = Generator()
+
+        self.assertEqual(self.ask("삼성전자 실적 발표", generate), "답변")
+        self.assertEqual(self.ask("삼성전자 실적 발표", generate), "답변")
+
+        self.assertEqual(generate.calls, 1)
+        self.assertEqual(self.cache.stats()["calendar_insight"], {"hits": 1, "misses": 1, "shared": 0})
+
+    def test_key_covers_model_system_instruction_surface_and_prompt(self) -> None:
+        base = make_cache_key("chat", model="m1", prompt="p", system_instruction="s")
+
+        self.assertNotEqual(base, make_cache_key("chat", model="m2", prompt="p", system_instruction="s"))
+        self.assertNotEqual(base, make_cache_key("chat", model="m1", prompt="p", system_instruction="s2"))
+        self.assertNotEqual(base, make_cache_key("domino_insight", model="m1", prompt="p", system_instruction="s"))
+        self.assertNotEqual(base, make_cache_key("chat", model="m1", prompt="p2", system_instruction="s"))
+
+    def test_entries_expire_by_surface_ttl(self) -> None:
+        generate = Generator()
+        self.ask("질문", generate, surface="chat")
+        self.ask("금리와 KOSPI", generate, surface="domino_insight")
+
+        self.now += SURFACE_TTL_SECONDS["chat"] + 1
+        self.ask("질문", generate, surface="chat")
+        self.ask("금리와 KOSPI", generate, surface="domino_insight")
+
+        self.assertEqual(generate.calls, 3)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        generate = Generator()
+        self.ask("a", generate)
+        self.ask("b", generate)
+        self.ask("a", generate)
+        self.ask("c", generate)  # evicts "b"
+
+        self.ask("a", generate)
+        self.ask("b", generate)
+
+        self.assertEqual(generate.calls, 4)
+
+    def test_failures_and_empty_answers_are_not_cached(self) -> None:
+        def boom():
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+
+        with self.assertRaises(RuntimeError):
+            self.ask("질문", boom)
+        empty = Generator(text="")
+        self.ask("빈 응답", empty)
+        self.ask("빈 응답", empty)
+
+        self.assertEqual(empty.calls, 2)
+        self.assertEqual(self.ask("질문", Generator("회복")), "회복")
+
+    def test_concurrent_identical_prompts_share_one_call(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return "공유된 답변"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(self.ask("같은 이벤트", slow)))
+        leader.start()
+        started.wait(2)
+        followers = [threading.Thread(target=lambda: results.append(self.ask("같은 이벤트", slow))) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["공유된 답변"] * 4)
+
+    def test_sqlite_persistence_survives_restart(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "llm_cache.db")
+            first = LLMResponseCache(path=path, clock=lambda: self.now)
+            first.get_or_generate("calendar_insight", model="m", prompt="p", generate=Generator("저장된 답변"))
+
+            restarted = LLMResponseCache(path=path, clock=lambda: self.now)
+            generate = Generator("새 답변")
+            answer = restarted.get_or_generate("calendar_insight", model="m", prompt="p", generate=generate)
+
+        self.assertEqual(answer, "저장된 답변")
+        self.assertEqual(generate.calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
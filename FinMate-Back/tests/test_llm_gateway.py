@@ -0,0 +1,116 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from llm_gateway import LLMGateway, LLMRateLimited, Priority
+
+
+class LLMGatewayTest(unittest.TestCase):
+    def test_concurrency_is_capped(self) -> None:
+        gateway = LLMGateway(requests_per_minute=6000, max_concurrency=2, burst=10)
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def work():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return "ok"
+
+        threads = [threading.Thread(target=lambda: gateway.call(work, timeout=2)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(gateway.stats()["calls"], 6)
+
+    def test_requests_over_the_rate_wait_instead_of_failing(self) -> None:
+        # 1200 RPM = one token every 50 ms, burst of 1.
+        gateway = LLMGateway(requests_per_minute=1200, max_concurrency=4, burst=1)
+
+        started = time.monotonic()
+        results = [gateway.call(lambda: "ok", timeout=2) for _ in range(3)]
+
+        self.assertEqual(results, ["ok"] * 3)
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+        self.assertEqual(gateway.stats()["queued"], 2)
+
+    def test_deadline_raises_rate_limited(self) -> None:
+        gateway = LLMGateway(requests_per_minute=1, max_concurrency=1, burst=1)
+        gateway.call(lambda: "first")
+
+        with self.assertRaises(LLMRateLimited):
+            gateway.call(lambda: "second", timeout=0.05)
+        self.assertEqual(gateway.stats()["timeouts"], 1)
+        self.assertEqual(gateway.stats()["waiting"], 0)
+
+    def test_interactive_requests_jump_ahead_of_background(self) -> None:
+        gateway = LLMGateway(requests_per_minute=6000, max_concurrency=1, burst=10)
+        release = threading.Event()
+        order = []
+
+        holder = threading.Thread(target=lambda: gateway.call(lambda: release.wait(2), timeout=2))
+        holder.start()
+        time.sleep(0.02)
+
+        background = threading.Thread(
+            target=lambda: gateway.call(lambda: order.append("background"), priority=Priority.BACKGROUND, timeout=2)
+        )
+        background.start()
+        time.sleep(0.02)
+        interactive = threading.Thread(
+            target=lambda: gateway.call(lambda: order.append("chat"), priority=Priority.INTERACTIVE, timeout=2)
+        )
+        interactive.start()
+        time.sleep(0.02)
+
+        release.set()
+        for thread in (holder, background, interactive):
+            thread.join()
+
+        self.assertEqual(order, ["chat", "background"])
+
+    def test_upstream_429_pauses_and_retries_once(self) -> None:
+        gateway = LLMGateway(requests_per_minute=6000, max_concurrency=2, burst=10)
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("429 RESOURCE_EXHAUSTED")
+            return "ok"
+
+        def always_limited():
+            raise RuntimeError("429 Too Many Requests")
+
+        with patch("llm_gateway.RATE_LIMIT_COOLDOWN_SECONDS", 0.05):
+            self.assertEqual(gateway.call(flaky, timeout=2), "ok")
+            with self.assertRaises(LLMRateLimited):
+                gateway.call(always_limited, timeout=2)
+
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(gateway.stats()["active"], 0)
+
+    def test_other_errors_are_not_retried(self) -> None:
+        gateway = LLMGateway(requests_per_minute=6000, max_concurrency=1)
+        attempts = []
+
+        def broken():
+            attempts.append(1)
+            raise ValueError("bad prompt")
+
+        with self.assertRaises(ValueError):
+            gateway.call(broken)
+        self.assertEqual(len(attempts), 1)
+        self.assertEqual(gateway.stats()["active"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,9 @@ import unittest
 
 from llm_guardrails import (
     LLM_GUARDRAIL_EVAL_CASES,
+    PROHIBITED_INVESTMENT_ADVICE_PATTERNS,
+    SAFE_FALLBACKS,
+    StreamingGuardrail,
     build_guardrail_instruction,
     build_system_instruction,
     ensure_safe_llm_text,
@@ -81,6 +84,82 @@ class LLMGuardrailEvalTest(unittest.TestCase):
         self.assertFalse(has_prohibited_investment_advice(sanitized["weather"]["line3"]))
         self.assertFalse(has_prohibited_investment_advice(sanitized["cards"][0]["insight"]))
 
+    def test_payload_is_not_mutated(self) -> None:
+        payload = {"cards": [{"insight": "강력 매수 추천입니다.", "url": "https://example.com"}]}
+
+        sanitize_llm_payload(payload, "news_weather")
+
+        self.assertEqual(payload["cards"][0]["insight"], "강력 매수 추천입니다.")
+
+
+class AnchoredMatcherTest(unittest.TestCase):
+    def per_pattern(self, text):
+        normalized = " ".join(text.split())
+        return any(pattern.search(normalized) for pattern in PROHIBITED_INVESTMENT_ADVICE_PATTERNS)
+
+    def test_matches_per_pattern_search(self) -> None:
+        texts = [case["unsafe_output"] for case in LLM_GUARDRAIL_EVAL_CASES] + [
+            "매수익 보장",                       # keyword overlapping another keyword
+            "금리가 오를\n가능성은\n  확실하지 않아요",  # whitespace normalized across lines
+            "상승 여부는 아직 불확실합니다.",
+            "수익률과 손실 가능성을 함께 보세요.",
+            "추천 이유보다 공시 원문을 확인하세요.",
+            "100% 확률은 없어요.",
+            "",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(has_prohibited_investment_advice(text), self.per_pattern(text))
+
+
+class StreamingGuardrailTest(unittest.TestCase):
+    def stream(self, chunks, surface="chat"):
+        guard = StreamingGuardrail(surface)
+        released = [guard.feed(chunk) for chunk in chunks]
+        released.append(guard.finish())
+        return guard, "".join(released)
+
+    def test_safe_stream_is_released_in_full(self) -> None:
+        text = "금리가 오르면 할인율이 높아져 성장주 평가에 부담이 될 수 있어요. 발표 기준일도 함께 확인해 보세요."
+        chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+
+        guard, released = self.stream(chunks)
+
+        self.assertFalse(guard.tripped)
+        self.assertEqual(released, text)
+        self.assertEqual(guard.text, text)
+
+    def test_pattern_split_across_chunks_is_never_released(self) -> None:
+        for case in LLM_GUARDRAIL_EVAL_CASES:
+            with self.subTest(case=case["id"]):
+                text = case["unsafe_output"]
+                chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+
+                guard, released = self.stream(chunks, case["surface"])
+
+                self.assertTrue(guard.tripped)
+                self.assertFalse(has_prohibited_investment_advice(released))
+                self.assertEqual(guard.text, SAFE_FALLBACKS[case["surface"]])
+
+    def test_unsafe_tail_after_long_safe_prefix_is_cut(self) -> None:
+        prefix = "환율과 금리 흐름을 함께 보면 시장 심리를 이해하는 데 도움이 됩니다. " * 3
+        guard = StreamingGuardrail("chat")
+
+        released = guard.feed(prefix)
+        released += guard.feed("그러니 지금 ")
+        released += guard.feed("매수하세요.")
+        released += guard.finish()
+
+        self.assertTrue(guard.tripped)
+        self.assertTrue(prefix.startswith(released))
+        self.assertEqual(guard.feed("추가 문장"), "")
+
+    def test_empty_stream_falls_back(self) -> None:
+        guard, released = self.stream(["", "  "])
+
+        self.assertEqual(released, "")
+        self.assertEqual(guard.text, SAFE_FALLBACKS["chat"])
+
 
 if __name__ == "__main__":
     unittest.main()
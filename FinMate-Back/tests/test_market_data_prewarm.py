@@ -0,0 +1,113 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from market_data.prewarm import MarketDataPrewarmer
+from market_data.public_data_provider import SUPPORTED_BENCHMARKS, SUPPORTED_TICKERS, PublicDataMarketDataProvider
+from strategy_routes import get_market_data_prewarm_status
+from tests.test_public_data_provider import FakeResponse, stock_payload, stock_row
+
+KST = timezone(timedelta(hours=9))
+
+
+class PerSymbolSession:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params, timeout):
+        self.calls.append(params["likeSrtnCd"])
+        return FakeResponse(stock_payload([stock_row("20260612", 71000, code=params["likeSrtnCd"])]))
+
+
+ECOS_ROWS = [{"TIME": "20260612", "DATA_VALUE": "3000.5"}]
+
+
+class MarketDataPrewarmerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2026, 6, 12, 13, 10, 30, tzinfo=KST)
+        self.session = PerSymbolSession()
+        self.provider = PublicDataMarketDataProvider(
+            service_key="encoded%2Bkey%3D",
+            stock_price_url="https://example.com/stock",
+            session=self.session,
+            cache_ttl_seconds=-1,
+            clock=lambda: self.now,
+        )
+
+    def test_run_once_refreshes_every_supported_symbol_and_benchmark(self) -> None:
+        prewarmer = MarketDataPrewarmer(self.provider, clock=lambda: self.now)
+
+        with patch("ecos.get_ecos_statistic", return_value=ECOS_ROWS) as get_ecos_statistic:
+            run = prewarmer.run_once(trigger="scheduled")
+            self.provider.get_stock_daily_bars("005930")
+            self.provider.get_benchmark_daily_bars("005930")
+
+        self.assertEqual(len(run.results), len(SUPPORTED_TICKERS) + len(SUPPORTED_BENCHMARKS))
+        self.assertEqual(run.failed, ())
+        self.assertEqual(sorted(self.session.calls), sorted(ticker.symbol_code for ticker in SUPPORTED_TICKERS))
+        self.assertEqual(get_ecos_statistic.call_count, len(SUPPORTED_BENCHMARKS))
+        self.assertIs(prewarmer.status().last_run, run)
+
+    def test_refresh_replaces_cached_snapshot_even_before_expiry(self) -> None:
+        self.provider.get_stock_daily_bars("005930")
+        before = self.provider._fetch_stock_snapshot("005930", requested_lookback=260)
+
+        self.provider.refresh_stock_daily_bars("005930")
+
+        self.assertEqual(self.session.calls, ["005930", "005930"])
+        self.assertIsNot(self.provider._fetch_stock_snapshot("005930", requested_lookback=260), before)
+
+    def test_failed_targets_are_retried_with_backoff(self) -> None:
+        prewarmer = MarketDataPrewarmer(self.provider, backoff_seconds=0, max_attempts=3, clock=lambda: self.now)
+        responses = [{"error": "ECOS 503"}, {"error": "ECOS 503"}, ECOS_ROWS, ECOS_ROWS]
+
+        with patch("ecos.get_ecos_statistic", side_effect=responses):
+            run = prewarmer.run_once()
+
+        benchmark_results = {result.target: result for result in run.results if result.kind == "benchmark"}
+        self.assertTrue(all(result.ok for result in run.results))
+        self.assertEqual(benchmark_results["kospi"].attempts, 2)
+        self.assertEqual(benchmark_results["kosdaq"].attempts, 2)
+
+    def test_exhausted_retries_are_reported(self) -> None:
+        prewarmer = MarketDataPrewarmer(self.provider, backoff_seconds=0, max_attempts=2, clock=lambda: self.now)
+
+        with patch("ecos.get_ecos_statistic", return_value={"error": "ECOS 503"}):
+            run = prewarmer.run_once()
+
+        self.assertEqual({result.target for result in run.failed}, {"kospi", "kosdaq"})
+        self.assertTrue(all(result.attempts == 2 and result.error == "ECOS 503" for result in run.failed))
+
+        status = get_market_data_prewarm_status(prewarmer)
+        self.assertEqual(status.last_run.failed_count, 2)
+        self.assertEqual(status.last_run.warmed_count, len(SUPPORTED_TICKERS))
+
+    def test_next_run_follows_refresh_window_plus_delay(self) -> None:
+        prewarmer = MarketDataPrewarmer(self.provider, delay_seconds=30)
+
+        self.assertEqual(
+            prewarmer.next_run_at(datetime(2026, 6, 12, 13, 10, 10, tzinfo=KST)),
+            datetime(2026, 6, 12, 13, 10, 30, tzinfo=KST),
+        )
+        self.assertEqual(
+            prewarmer.next_run_at(datetime(2026, 6, 12, 13, 10, 30, tzinfo=KST)),
+            datetime(2026, 6, 15, 13, 10, 30, tzinfo=KST),
+        )
+
+    def test_explicit_zero_delay_setting_is_kept(self) -> None:
+        from config import _optional_int_env
+
+        with patch.dict("os.environ", {"MARKET_DATA_PREWARM_DELAY_SECONDS": "0"}):
+            self.assertEqual(_optional_int_env("MARKET_DATA_PREWARM_DELAY_SECONDS", 30), 0)
+        with patch.dict("os.environ", {"MARKET_DATA_PREWARM_DELAY_SECONDS": ""}):
+            self.assertEqual(_optional_int_env("MARKET_DATA_PREWARM_DELAY_SECONDS", 30), 30)
+
+    def test_status_route_reports_disabled_without_prewarmer(self) -> None:
+        status = get_market_data_prewarm_status(None)
+
+        self.assertFalse(status.enabled)
+        self.assertIsNone(status.last_run)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@ from datetime import date
 
 from pydantic import ValidationError
 
-from market_data.types import DailyBar, DailyBarSeries, MarketDataSourceInfo, MarketDataStatus, MarketInstrumentType
+from market_data.types import DailyBar, DailyBarColumns, DailyBarSeries, MarketDataSourceInfo, MarketDataStatus, MarketInstrumentType
 
 
 class MarketDataTypesTest(unittest.TestCase):
@@ -110,6 +110,49 @@ class MarketDataTypesTest(unittest.TestCase):
                 with self.assertRaises(ValidationError):
                     DailyBarSeries(**payload)
 
+    def test_daily_bar_columns_validate_whole_series_once(self) -> None:
+        invalid_records = [
+            [(date(2026, 4, 1), 100.0, 99.0, 95.0, 98.0, 1000)],
+            [(date(2026, 4, 1), 100.0, 105.0, 101.0, 102.0, 1000)],
+            [(date(2026, 4, 1), 100.0, 105.0, 95.0, 106.0, 1000)],
+            [(date(2026, 4, 1), 0.0, 0.0, 0.0, 0.0, 1000)],
+            [(date(2026, 4, 1), 100.0, 105.0, 95.0, 102.0, -1)],
+        ]
+        for records in invalid_records:
+            with self.subTest(records=records):
+                with self.assertRaises(ValueError):
+                    DailyBarColumns.from_records(records)
+
+        columns = DailyBarColumns.from_records(
+            [
+                (date(2026, 4, 2), 100.0, 105.0, 95.0, 102.0, 1000),
+                (date(2026, 4, 1), 90.0, 95.0, 85.0, 92.0, 500),
+                (date(2026, 4, 2), 101.0, 106.0, 96.0, 103.0, 1100),
+            ]
+        )
+        series = DailyBarSeries.from_columns(
+            columns.tail(5),
+            instrument_type=MarketInstrumentType.EQUITY,
+            instrument_code="005930",
+            data_status=MarketDataStatus.PARTIAL,
+            source=self.source,
+        )
+
+        self.assertEqual([bar.date.day for bar in series.bars], [1, 2])
+        self.assertEqual(series.bars[-1], DailyBar(date=date(2026, 4, 2), open=101.0, high=106.0, low=96.0, close=103.0, volume=1100))
+        self.assertEqual(series.available_bar_count, 2)
+        self.assertEqual(series.as_of_date, date(2026, 4, 2))
+        self.assertEqual(DailyBarSeries.model_validate(series.model_dump()).model_dump(), series.model_dump())
+        self.assertIs(columns.tail(1).to_bars()[0], columns.to_bars()[-1])
+        with self.assertRaises(ValueError):
+            DailyBarSeries.from_columns(
+                columns,
+                instrument_type=MarketInstrumentType.EQUITY,
+                instrument_code="005930",
+                data_status=MarketDataStatus.UNAVAILABLE,
+                source=self.source,
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
@@ -59,5 +61,124 @@ class NewsWeatherFallbackTest(unittest.TestCase):
         self.assertEqual(result["cards"], [])
 
 
+
+class NewsWeatherStaleWhileRevalidateTest(unittest.TestCase):
+    def setUp(self) -> None:
+        news_weather._cached_result = None
+        news_weather._cached_at = 0
+
+    def tearDown(self) -> None:
+        news_weather._cached_result = None
+        news_weather._cached_at = 0
+
+    def test_stale_result_is_served_while_one_background_refresh_runs(self) -> None:
+        stale = {"weather": {"line1": "old"}, "cards": []}
+        news_weather._cached_result = stale
+        news_weather._cached_at = time.time() - news_weather.CACHE_TTL - 1
+        release = threading.Event()
+        fresh = {"weather": {"line1": "new"}, "cards": []}
+
+        def slow_build(*args, **kwargs):
+            release.wait(2)
+            return fresh
+
+        with patch.object(news_weather, "collect_market_news", return_value=SAMPLE_NEWS) as collect, patch.object(
+            news_weather, "generate_weather_and_cards_with_gemini", side_effect=slow_build
+        ):
+            results = [news_weather.get_news_weather() for _ in range(5)]
+            release.set()
+            with news_weather._refresh_lock:
+                pass
+
+        self.assertTrue(all(result is stale for result in results))
+        self.assertEqual(collect.call_count, 1)
+        self.assertIs(news_weather.get_news_weather(), fresh)
+
+    def test_failed_background_refresh_keeps_previous_result(self) -> None:
+        stale = {"weather": {"line1": "old"}, "cards": []}
+        news_weather._cached_result = stale
+        news_weather._cached_at = time.time() - news_weather.CACHE_TTL - 1
+
+        with patch.object(news_weather, "collect_market_news", side_effect=RuntimeError("naver down")):
+            self.assertIs(news_weather.get_news_weather(), stale)
+            with news_weather._refresh_lock:
+                pass
+
+        self.assertIs(news_weather._cached_result, stale)
+        self.assertFalse(news_weather._refresh_lock.locked())
+
+    def test_concurrent_cold_requests_build_once(self) -> None:
+        calls = []
+
+        def slow_collect(**kwargs):
+            calls.append(1)
+            time.sleep(0.05)
+            return []
+
+        with patch.object(news_weather, "collect_market_news", side_effect=slow_collect):
+            threads = [threading.Thread(target=news_weather.get_news_weather) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+
+
+
+def naver_item(title: str, link: str, pub_date: str = "Fri, 12 Jun 2026 09:00:00 +0900") -> dict:
+    return {"title": title, "description": "", "link": link, "originallink": "", "pubDate": pub_date}
+
+
+class CollectMarketNewsTest(unittest.TestCase):
+    def test_queries_are_searched_concurrently(self) -> None:
+        queries = ["코스피", "증시", "환율", "금리 인하"]
+        barrier = threading.Barrier(len(queries), timeout=2)
+
+        def search(query, display=10, start=1, sort="date"):
+            barrier.wait()
+            return {"items": [naver_item(query, f"https://example.com/{query}")]}
+
+        with patch.object(news_weather, "search_naver_news", side_effect=search):
+            articles = news_weather.collect_market_news(queries, top_n=10)
+
+        self.assertEqual(len(articles), 4)
+
+    def test_slow_failing_and_raising_queries_are_skipped(self) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def search(query, display=10, start=1, sort="date"):
+            if query == "slow":
+                release.wait(5)
+            if query == "http-error":
+                return None
+            if query == "raises":
+                raise ConnectionError("reset")
+            return {"items": [naver_item(query, f"https://example.com/{query}")]}
+
+        started = time.monotonic()
+        with patch.object(news_weather, "search_naver_news", side_effect=search):
+            articles = news_weather.collect_market_news(["slow", "http-error", "raises", "ok"], deadline=0.2)
+
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual([art["title"] for art in articles], ["ok"])
+
+    def test_merge_order_does_not_depend_on_completion_order(self) -> None:
+        shared = naver_item("shared", "https://example.com/shared")
+        delays = {"a": 0.05, "b": 0.0, "c": 0.02}
+
+        def search(query, display=10, start=1, sort="date"):
+            time.sleep(delays[query])
+            return {"items": [dict(shared), naver_item(f"only-{query}", f"https://example.com/{query}")]}
+
+        with patch.object(news_weather, "search_naver_news", side_effect=search):
+            articles = news_weather.collect_market_news(["a", "b", "c"])
+
+        self.assertEqual([art["title"] for art in articles], ["shared", "only-a", "only-b", "only-c"])
+        self.assertEqual(articles[0]["score"], 3)
+        self.assertEqual(articles[0]["keywords"], ["a", "b", "c"])
+
+
 if __name__ == "__main__":
     unittest.main()
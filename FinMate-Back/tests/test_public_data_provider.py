@@ -1,8 +1,15 @@
 from datetime import datetime, timedelta, timezone
+import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import patch
 
-from market_data.public_data_provider import PublicDataMarketDataProvider, _next_public_data_cache_expiry
+from pydantic import ValidationError
+
+from market_data.bar_store import SqliteDailyBarStore
+from market_data.public_data_provider import PublicDataMarketDataProvider, next_public_data_cache_expiry
 from market_data.types import MarketDataStatus, MarketInstrumentType
 
 KST = timezone(timedelta(hours=9))
@@ -30,6 +37,51 @@ class FakeSession:
         return FakeResponse(self.payload)
 
 
+class RoutingSession:
+    """Answers full-history and delta requests with different row sets, keyed by beginBasDt."""
+
+    def __init__(self, rows_by_begin, default_rows=None, fail_begin=None):
+        self.rows_by_begin = rows_by_begin
+        self.default_rows = default_rows or []
+        self.fail_begin = fail_begin
+        self.calls = []
+
+    def get(self, url, params, timeout):
+        self.calls.append({"url": url, "params": params, "timeout": timeout})
+        begin = params.get("beginBasDt")
+        if begin is not None and begin == self.fail_begin:
+            return FakeResponse({}, status_code=503)
+        return FakeResponse(stock_payload(self.rows_by_begin.get(begin, self.default_rows)))
+
+
+class BlockingSession(FakeSession):
+    """Holds every request until released so concurrent cache misses overlap."""
+
+    def __init__(self, payload):
+        super().__init__(payload)
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def get(self, url, params, timeout):
+        with self._lock:
+            self.calls.append({"url": url, "params": params, "timeout": timeout})
+        self.release.wait(timeout=5)
+        return FakeResponse(self.payload)
+
+
+def stock_row(bas_dt, close, *, code="005930", name="삼성전자"):
+    return {
+        "basDt": bas_dt,
+        "srtnCd": code,
+        "itmsNm": name,
+        "mkp": str(close - 100),
+        "hipr": str(close + 300),
+        "lopr": str(close - 300),
+        "clpr": str(close),
+        "trqu": "1000000",
+    }
+
+
 def stock_payload(rows):
     return {
         "response": {
@@ -136,6 +188,72 @@ class PublicDataMarketDataProviderTest(unittest.TestCase):
         self.assertEqual(second.bars[-1].close, 71000.0)
         self.assertEqual(len(session.calls), 1)
 
+    def test_cache_hits_share_read_only_snapshots(self) -> None:
+        provider = PublicDataMarketDataProvider(
+            service_key="encoded%2Bkey%3D",
+            stock_price_url="https://example.com/stock",
+            session=FakeSession(stock_payload([stock_row("20260610", 71000)])),
+            cache_ttl_seconds=600,
+        )
+
+        first = provider._fetch_stock_snapshot("005930", requested_lookback=1)
+        second = provider._fetch_stock_snapshot("005930", requested_lookback=1)
+
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first.columns.closes[0] = 1.0
+        self.assertIs(provider.normalize_ticker("005930"), provider.normalize_ticker("Samsung"))
+        with self.assertRaises(ValidationError):
+            provider.normalize_ticker("005930").symbol_name = "changed"
+        with self.assertRaises(ValidationError):
+            provider.source_info.provider_id = "changed"
+
+    def test_concurrent_cache_misses_share_one_upstream_fetch(self) -> None:
+        session = BlockingSession(stock_payload([stock_row("20260610", 71000)]))
+        provider = PublicDataMarketDataProvider(
+            service_key="encoded%2Bkey%3D",
+            stock_price_url="https://example.com/stock",
+            session=session,
+            cache_ttl_seconds=600,
+        )
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = [executor.submit(provider.get_stock_daily_bars, "005930", lookback=1) for _ in range(6)]
+            while not session.calls:
+                threading.Event().wait(0.01)
+            session.release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(session.calls), 1)
+        self.assertEqual({series.bars[-1].close for series in results}, {71000.0})
+        self.assertEqual(provider._in_flight, {})
+
+    def test_concurrent_benchmark_misses_share_one_ecos_call(self) -> None:
+        provider = PublicDataMarketDataProvider(
+            service_key="encoded%2Bkey%3D",
+            stock_price_url="https://example.com/stock",
+            session=FakeSession(stock_payload([])),
+            cache_ttl_seconds=600,
+        )
+        release = threading.Event()
+        calls = []
+
+        def slow_ecos(*args):
+            calls.append(args)
+            release.wait(timeout=5)
+            return [{"TIME": "20260610", "DATA_VALUE": "3000.5"}]
+
+        with patch("ecos.get_ecos_statistic", side_effect=slow_ecos):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(provider.get_benchmark_daily_bars, "005930", lookback=1) for _ in range(4)]
+                while not calls:
+                    threading.Event().wait(0.01)
+                release.set()
+                results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual({series.bars[-1].close for series in results}, {3000.5})
+
     def test_zero_cache_ttl_disables_stock_row_cache(self) -> None:
         session = FakeSession(
             stock_payload(
@@ -187,15 +305,15 @@ class PublicDataMarketDataProviderTest(unittest.TestCase):
 
     def test_public_data_cache_expiry_uses_kst_refresh_window(self) -> None:
         self.assertEqual(
-            _next_public_data_cache_expiry(datetime(2026, 6, 12, 12, 0, tzinfo=KST)),
+            next_public_data_cache_expiry(datetime(2026, 6, 12, 12, 0, tzinfo=KST)),
             datetime(2026, 6, 12, 13, 10, tzinfo=KST),
         )
         self.assertEqual(
-            _next_public_data_cache_expiry(datetime(2026, 6, 12, 14, 0, tzinfo=KST)),
+            next_public_data_cache_expiry(datetime(2026, 6, 12, 14, 0, tzinfo=KST)),
             datetime(2026, 6, 15, 13, 10, tzinfo=KST),
         )
         self.assertEqual(
-            _next_public_data_cache_expiry(datetime(2026, 6, 13, 9, 0, tzinfo=KST)),
+            next_public_data_cache_expiry(datetime(2026, 6, 13, 9, 0, tzinfo=KST)),
             datetime(2026, 6, 15, 13, 10, tzinfo=KST),
         )
 
@@ -279,5 +397,75 @@ class PublicDataMarketDataProviderTest(unittest.TestCase):
         self.assertEqual(session.calls[0]["params"]["likeSrtnCd"], "032830")
 
 
+
+class PublicDataBarStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = SqliteDailyBarStore(Path(self.temp_dir.name) / "market_bars.db")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def build_provider(self, session, now):
+        return PublicDataMarketDataProvider(
+            service_key="encoded%2Bkey%3D",
+            stock_price_url="https://example.com/stock",
+            session=session,
+            cache_ttl_seconds=-1,
+            clock=lambda: now,
+            bar_store=self.store,
+        )
+
+    def test_restart_fetches_only_dates_after_last_stored_bar(self) -> None:
+        first_day = datetime(2026, 6, 11, 15, 0, tzinfo=KST)
+        cold_session = FakeSession(stock_payload([stock_row("20260611", 71000), stock_row("20260610", 70000)]))
+        self.build_provider(cold_session, first_day).get_stock_daily_bars("005930", lookback=5)
+
+        self.assertEqual(len(cold_session.calls), 1)
+        self.assertEqual(self.store.latest_bar_date("005930").isoformat(), "2026-06-11")
+
+        next_day = datetime(2026, 6, 12, 15, 0, tzinfo=KST)
+        warm_session = RoutingSession({"20260612": [stock_row("20260612", 72000)]})
+        series = self.build_provider(warm_session, next_day).get_stock_daily_bars("005930", lookback=5)
+
+        self.assertEqual(len(warm_session.calls), 1)
+        self.assertEqual(warm_session.calls[0]["params"]["beginBasDt"], "20260612")
+        self.assertEqual(warm_session.calls[0]["params"]["endBasDt"], "20260612")
+        self.assertEqual([bar.close for bar in series.bars], [70000.0, 71000.0, 72000.0])
+        self.assertEqual(series.instrument_name, "삼성전자")
+
+    def test_failed_delta_serves_stored_bars(self) -> None:
+        first_day = datetime(2026, 6, 11, 15, 0, tzinfo=KST)
+        self.build_provider(FakeSession(stock_payload([stock_row("20260611", 71000)])), first_day).get_stock_daily_bars(
+            "005930",
+            lookback=5,
+        )
+
+        next_day = datetime(2026, 6, 12, 15, 0, tzinfo=KST)
+        failing_session = RoutingSession({}, fail_begin="20260612")
+        series = self.build_provider(failing_session, next_day).get_stock_daily_bars("005930", lookback=5)
+
+        self.assertEqual(len(failing_session.calls), 1)
+        self.assertEqual(series.bars[-1].close, 71000.0)
+        self.assertNotEqual(series.data_status, MarketDataStatus.UNAVAILABLE)
+
+    def test_store_without_full_history_falls_back_to_full_pull(self) -> None:
+        now = datetime(2026, 6, 12, 15, 0, tzinfo=KST)
+        self.store.save_rows("005930", [stock_row("20260611", 71000)])
+        session = FakeSession(stock_payload([stock_row("20260612", 72000), stock_row("20260611", 71000)]))
+
+        self.build_provider(session, now).get_stock_daily_bars("005930", lookback=5)
+
+        self.assertEqual(session.calls[0]["params"]["beginBasDt"], "20241219")
+        self.assertEqual(self.store.history_start("005930").isoformat(), "2024-12-19")
+
+    def test_rows_for_other_codes_are_not_stored(self) -> None:
+        self.store.save_rows("005930", [stock_row("20260611", 71000), stock_row("20260611", 5000, code="0059300")])
+
+        rows = self.store.load_rows("005930", since=datetime(2026, 1, 1).date(), limit=10)
+
+        self.assertEqual([row["clpr"] for row in rows], [71000.0])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from datetime import date, timedelta
+
+from market_data.types import DailyBar, DailyBarSeries, MarketDataSourceInfo, MarketDataStatus, MarketInstrumentType
+from strategies.daily import DailySeriesView
+
+
+def build_series(closes: list[float], volumes: list[int]) -> DailyBarSeries:
+    start = date(2026, 1, 1)
+    return DailyBarSeries(
+        instrument_type=MarketInstrumentType.EQUITY,
+        instrument_code="005930",
+        data_status=MarketDataStatus.FRESH,
+        source=MarketDataSourceInfo(
+            provider_id="test_provider",
+            provider_name="Test Provider",
+            dataset="kr_daily_ohlcv",
+            provenance="fixture",
+        ),
+        bars=[
+            DailyBar(
+                date=start + timedelta(days=index),
+                open=close,
+                high=round(close * (1.01 + (index % 7) / 100), 2),
+                low=round(close * (0.99 - (index % 5) / 100), 2),
+                close=close,
+                volume=volume,
+            )
+            for index, (close, volume) in enumerate(zip(closes, volumes))
+        ],
+    )
+
+
+class DailySeriesViewTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.closes = [100.0 + ((index * 37) % 23) - index * 0.1 for index in range(60)]
+        self.volumes = [1_000 + (index * 7919) % 5_000 for index in range(60)]
+        self.series = build_series(self.closes, self.volumes)
+        self.view = DailySeriesView.from_series(self.series)
+
+    def test_window_queries_match_direct_slices(self) -> None:
+        highs = [bar.high for bar in self.series.bars]
+        lows = [bar.low for bar in self.series.bars]
+        for window in range(1, 40):
+            for exclude_recent in range(0, 6):
+                with self.subTest(window=window, exclude_recent=exclude_recent):
+                    end = len(self.closes) - exclude_recent
+                    start = end - window
+                    self.assertAlmostEqual(
+                        self.view.sma(window, offset=exclude_recent),
+                        sum(self.closes[start:end]) / window,
+                        places=9,
+                    )
+                    self.assertEqual(
+                        self.view.average_volume(window, offset=exclude_recent),
+                        sum(self.volumes[start:end]) / window,
+                    )
+                    self.assertEqual(self.view.rolling_high(window, exclude_recent=exclude_recent), max(highs[start:end]))
+                    self.assertEqual(self.view.rolling_low(window, exclude_recent=exclude_recent), min(lows[start:end]))
+                    self.assertEqual(
+                        self.view.rolling_close_high(window, exclude_recent=exclude_recent),
+                        max(self.closes[start:end]),
+                    )
+                    self.assertEqual(
+                        self.view.rolling_close_low(window, exclude_recent=exclude_recent),
+                        min(self.closes[start:end]),
+                    )
+
+    def test_out_of_range_windows_return_none(self) -> None:
+        self.assertIsNone(self.view.sma(61))
+        self.assertIsNone(self.view.sma(0))
+        self.assertIsNone(self.view.rolling_high(10, exclude_recent=-1))
+        self.assertIsNone(self.view.average_volume(60, offset=1))
+        self.assertFalse(self.view.any_close_below(1_000.0, window=61))
+        self.assertFalse(self.view.last_n_closes_above(0.0, window=61))
+
+    def test_close_threshold_helpers_use_window_extremes(self) -> None:
+        recent_low = min(self.closes[-20:-2])
+        self.assertTrue(self.view.any_close_below(recent_low + 0.01, window=18, exclude_recent=2))
+        self.assertFalse(self.view.any_close_below(recent_low, window=18, exclude_recent=2))
+        self.assertTrue(self.view.last_n_closes_above(min(self.closes[-2:]) - 0.01, window=2))
+        self.assertFalse(self.view.last_n_closes_above(min(self.closes[-2:]), window=2))
+
+    def test_columns_are_read_only(self) -> None:
+        self.assertEqual(self.view.latest_close, self.closes[-1])
+        self.assertEqual(self.view.latest_volume, self.volumes[-1])
+        with self.assertRaises(TypeError):
+            self.view.closes[0] = 1.0
+
+
+if __name__ == "__main__":
+    unittest.main()
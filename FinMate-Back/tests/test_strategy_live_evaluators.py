@@ -6,7 +6,12 @@ from pathlib import Path
 
 from market_data.mock_provider import MockMarketDataProvider
 from strategies import StrategyActivationState, StrategyCheckStatus, StrategyEvaluation
-from strategies.registry import evaluate_live_strategy, get_live_strategy_evaluator, list_live_strategy_ids
+from strategies.registry import (
+    evaluate_live_strategies,
+    evaluate_live_strategy,
+    get_live_strategy_evaluator,
+    list_live_strategy_ids,
+)
 
 
 def business_days(end_date: date, count: int) -> list[date]:
@@ -19,6 +24,21 @@ def business_days(end_date: date, count: int) -> list[date]:
     return list(reversed(days))
 
 
+class CountingMockMarketDataProvider(MockMarketDataProvider):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stock_calls = 0
+        self.benchmark_calls = 0
+
+    def get_stock_daily_bars(self, ticker: str, *, lookback: int | None = None):
+        self.stock_calls += 1
+        return super().get_stock_daily_bars(ticker, lookback=lookback)
+
+    def get_benchmark_daily_bars(self, ticker: str, *, lookback: int | None = None):
+        self.benchmark_calls += 1
+        return super().get_benchmark_daily_bars(ticker, lookback=lookback)
+
+
 def linear_series(start: float, end: float, count: int) -> list[float]:
     if count == 1:
         return [round(start, 2)]
@@ -467,6 +487,27 @@ class LiveStrategyEvaluatorsTest(unittest.TestCase):
                 evaluated_at=self.evaluated_at,
             )
 
+    def test_evaluate_live_strategies_fetches_each_series_once(self) -> None:
+        provider = CountingMockMarketDataProvider(fixture_path=self.provider.fixture_path)
+
+        evaluations = evaluate_live_strategies(
+            provider,
+            ticker="101001",
+            evaluated_at=self.evaluated_at,
+        )
+
+        self.assertEqual([evaluation.strategy_id for evaluation in evaluations], list_live_strategy_ids())
+        self.assertEqual(provider.stock_calls, 1)
+        self.assertEqual(provider.benchmark_calls, 1)
+        for evaluation in evaluations:
+            single = evaluate_live_strategy(
+                self.provider,
+                strategy_id=evaluation.strategy_id,
+                ticker="101001",
+                evaluated_at=self.evaluated_at,
+            )
+            self.assertEqual(evaluation.model_dump(), single.model_dump())
+
 
 if __name__ == "__main__":
     unittest.main()
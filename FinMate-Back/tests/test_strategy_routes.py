@@ -1,3 +1,4 @@
+import json
 import socket
 import threading
 import time
@@ -84,6 +85,26 @@ class SupportedUnavailableProvider(MockMarketDataProvider):
         return super().get_benchmark_daily_bars(ticker, lookback=lookback)
 
 
+class BenchmarkCountingProvider(MockMarketDataProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.benchmark_calls = 0
+        self.stock_calls = []
+
+    def get_benchmark_daily_bars_by_id(self, benchmark_id: str, *, lookback: int | None = None) -> DailyBarSeries:
+        self.benchmark_calls += 1
+        return super().get_benchmark_daily_bars_by_id(benchmark_id, lookback=lookback)
+
+    def get_stock_daily_bars(self, ticker: str, *, lookback: int | None = None) -> DailyBarSeries:
+        self.stock_calls.append(ticker)
+        return super().get_stock_daily_bars(ticker, lookback=lookback)
+
+
+class FailingStockProvider(MockMarketDataProvider):
+    def get_stock_daily_bars(self, ticker: str, *, lookback: int | None = None) -> DailyBarSeries:
+        raise RuntimeError("upstream error from https://apis.example.com/stock?serviceKey=secret")
+
+
 class StrategyApiServer:
     def __init__(self, provider: MockMarketDataProvider) -> None:
         self.provider = provider
@@ -341,6 +362,100 @@ class StrategyRoutesTest(unittest.TestCase):
             }.isdisjoint(keys)
         )
 
+    def test_screen_route_returns_per_symbol_groups_and_timings_in_request_order(self) -> None:
+        with StrategyApiServer(MockMarketDataProvider()) as server:
+            response = requests.post(
+                f"{server.base_url}/api/strategies/screen",
+                json={"symbols": ["000660", "999999", "005930.KS"], "max_concurrency": 2},
+                timeout=5,
+            )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload["max_concurrency"], 2)
+        self.assertEqual(payload["source"]["provider_id"], "mock_market_data")
+        self.assertEqual([result["query"] for result in payload["results"]], ["000660", "999999", "005930.KS"])
+
+        hynix, unsupported, samsung = payload["results"]
+        self.assertEqual(samsung["symbol"]["symbol_code"], "005930")
+        self.assertEqual(samsung["data_status"], "fresh")
+        self.assertEqual(
+            sum(len(group["evaluations"]) for group in samsung["live_evaluation_groups"]),
+            len(list_live_strategy_ids()),
+        )
+        self.assertEqual(hynix["symbol"]["symbol_name"], "SK하이닉스")
+        self.assertIsNone(unsupported["symbol"])
+        self.assertEqual(unsupported["data_status"], "unavailable")
+        for result in payload["results"]:
+            self.assertGreaterEqual(result["elapsed_ms"], result["fetch_ms"])
+
+    def test_screen_route_shares_benchmark_across_supported_universe(self) -> None:
+        provider = BenchmarkCountingProvider()
+        with StrategyApiServer(provider) as server:
+            response = requests.post(
+                f"{server.base_url}/api/strategies/screen",
+                json={"universe": "supported"},
+                timeout=5,
+            )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual(
+            {result["symbol"]["symbol_code"] for result in results},
+            {"005930", "000660", "035420", "035720", "005380", "373220"},
+        )
+        self.assertEqual(provider.benchmark_calls, 1)
+
+    def test_screen_route_evaluates_each_normalized_symbol_once(self) -> None:
+        provider = BenchmarkCountingProvider()
+        with StrategyApiServer(provider) as server:
+            response = requests.post(
+                f"{server.base_url}/api/strategies/screen",
+                json={"symbols": ["005930", "000660", "005930.KS"]},
+                timeout=5,
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["query"] for result in response.json()["results"]], ["005930", "000660"])
+        self.assertEqual(sorted(provider.stock_calls), ["000660", "005930"])
+
+    def test_screen_route_hides_raw_failure_messages(self) -> None:
+        with StrategyApiServer(FailingStockProvider()) as server, self.assertLogs("strategies.screener", "ERROR"):
+            response = requests.post(
+                f"{server.base_url}/api/strategies/screen",
+                json={"symbols": ["005930"]},
+                timeout=5,
+            )
+
+        self.assertEqual(response.status_code, 200)
+        (result,) = response.json()["results"]
+        self.assertEqual(result["data_status"], "unavailable")
+        self.assertNotIn("apis.example.com", result["status_reason"])
+        self.assertNotIn("secret", result["status_reason"])
+
+    def test_screen_route_rejects_empty_custom_universe(self) -> None:
+        with StrategyApiServer(MockMarketDataProvider()) as server:
+            response = requests.post(
+                f"{server.base_url}/api/strategies/screen",
+                json={"symbols": []},
+                timeout=2,
+            )
+
+        self.assertEqual(response.status_code, 422)
+
+    def test_screen_stream_route_emits_one_ndjson_line_per_symbol(self) -> None:
+        with StrategyApiServer(MockMarketDataProvider()) as server:
+            response = requests.post(
+                f"{server.base_url}/api/strategies/screen/stream",
+                json={"symbols": ["005930", "000660"]},
+                timeout=5,
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        lines = [json.loads(line) for line in response.text.splitlines() if line]
+        self.assertEqual({line["symbol"]["symbol_code"] for line in lines}, {"005930", "000660"})
+
 
 if __name__ == "__main__":
     unittest.main()